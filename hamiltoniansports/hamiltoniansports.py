@@ -4,6 +4,7 @@ from src.algo import Algo
 from src.infographic import Infographic
 import datetime
 from utils.logger import Logger
+from utils.config import Config
 
 # logging
 logger = Logger.setup(current_datetime=datetime.datetime.now())
@@ -19,15 +20,39 @@ class HamiltonianSports:
     league: str
     season: str
     clearcache: bool
+    engine: str | None
+    objective: str
+    memo_mb: int
+    resume: bool
+    budget: dict[str, float | int | None]
+    fast_path: bool
     # composition classes
     apicreator: APICreator  # the api connection, creator used to allow different APIs easily
     algo: Algo
     infographic: Infographic
 
-    def __init__(self, league: str, season: str, clearcache: bool) -> None:
+    def __init__(
+        self,
+        league: str,
+        season: str,
+        clearcache: bool,
+        engine: str | None = None,
+        objective: str = "earliest",
+        memo_mb: int = 0,
+        resume: bool = False,
+        budget: dict[str, float | int | None] | None = None,
+        fast_path: bool = False,
+    ) -> None:
         self.league = league
         self.season = season
         self.clearcache = clearcache
+        self.engine = engine
+        self.objective = objective
+        self.memo_mb = memo_mb
+        self.resume = resume
+        # round_seconds / round_nodes / season_seconds / season_nodes, passed through to the Algo
+        self.budget = budget or {}
+        self.fast_path = fast_path
 
     def assign_api(self) -> "HamiltonianSports":
         """initliases an APICreator composition class and assigns the correct API"""
@@ -42,15 +67,24 @@ class HamiltonianSports:
         self.apicreator.populate_from_api(clearcache=self.clearcache)
 
     def assign_algo(self) -> "HamiltonianSports":
-        """assigns the algorithmn using composition.
-        Only DFS is used at this stage, but have built it this way to allow other algos in the future maybe.
+        """assigns the algorithmn using composition, with the search engine requested or, if none was,
+        the cheapest engine for the objective
         """
         if not hasattr(self, "apicreator"):
             raise RuntimeError("assign_algo() called before assign_api()")
         if not hasattr(self.apicreator, "api"):
             raise RuntimeError("assign_algo() called before populate_from_api()")
 
-        self.algo = Algo(seasonresults=self.apicreator.api.seasonresults)
+        self.algo = Algo(
+            seasonresults=self.apicreator.api.seasonresults,
+            engine=self.engine or Config.objective_engines[self.objective],
+            objective=self.objective,
+            memo_bytes=self.memo_mb * 2**20 if self.memo_mb else None,
+            checkpoint=True,
+            resume=self.resume,
+            fast_path=self.fast_path,
+            **self.budget,
+        )
 
         return self
 
@@ -114,7 +148,20 @@ def main():
 
     # build the client class "hs" (instance of HamiltonianSports) using the validated cli arguments
     hs = HamiltonianSports(
-        league=av.args.league, season=av.args.season, clearcache=av.args.clearcache
+        league=av.args.league,
+        season=av.args.season,
+        clearcache=av.args.clearcache,
+        engine=av.args.engine,
+        objective=av.args.objective,
+        memo_mb=av.args.memo,
+        resume=av.args.resume,
+        budget={
+            "round_seconds": av.args.round_seconds,
+            "round_nodes": av.args.round_nodes,
+            "season_seconds": av.args.season_seconds,
+            "season_nodes": av.args.season_nodes,
+        },
+        fast_path=av.args.fast_path,
     )
 
     # assign the api and get data from it
@@ -1,8 +1,25 @@
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 from src.api.models import SeasonResults, GameResult
+from src.engines.creator import EngineCreator
+from src.engines.abstract import SearchComplete
+from src.filters.scc import SCCFilter
+from src.filters.matching import CycleCoverFilter
+from src.filters.transposition import TranspositionTable
+from src.filters.degree import (
+    graph_bitmasks,
+    degree_condition,
+    camion_cycle,
+    construct_cycle,
+)
+from src.budget import SearchBudget, BudgetExhausted
+from src.progress import ProgressReporter
+from src.estimator import SearchEstimator
+from typing import Callable
+from utils.config import Config
 import time
 import logging
 
@@ -13,23 +30,99 @@ class Algo:
     """class used for running the algorithm seasing for a Hamiltonian Cycle and
     miscellious results / data related to it"""
 
-    def __init__(self, seasonresults: SeasonResults):
+    def __init__(
+        self,
+        seasonresults: SeasonResults,
+        engine: str = "dfs",
+        objective: str = "earliest",
+        memo_entries: int | None = None,
+        memo_bytes: int | None = None,
+        checkpoint: bool = False,
+        resume: bool = False,
+        round_seconds: float | None = None,
+        round_nodes: int | None = None,
+        season_seconds: float | None = None,
+        season_nodes: int | None = None,
+        progress_callback: Callable[[dict], None] | None = None,
+        fast_path: bool = False,
+    ):
         self.seasonresults: SeasonResults = seasonresults
+        # what the search is looking for, see record_hc() for how each is handled
+        if objective not in Config.valid_objectives:
+            raise ValueError(
+                f'"{objective}" is not a valid search objective ({Config.valid_objectives})'
+            )
+        if objective not in Config.engine_objectives.get(engine, [objective]):
+            raise ValueError(
+                f'The {engine} engine cannot search for the "{objective}" objective (only {Config.engine_objectives[engine]})'
+            )
+        self.objective: str = objective
+        # the search engine, assigned using composition so other search methods can be used
+        self.enginecreator: EngineCreator = EngineCreator()
+        self.enginecreator.assign_engine(engine=engine, algo=self)
 
         self.adjacency_graph: defaultdict[int, set[int]] = defaultdict()
         self.result_detail: dict[int, dict[int, GameResult]] = dict()
+        # winner->loser edges first added to the adjacency_graph in each round
+        self.round_new_edges: list[list[tuple[int, int]]] = []
+        # those of the round being searched, for the enumerate objective to tell which cycles are new
+        self.cur_new_edges: set[tuple[int, int]] = set()
+        # strongly connected components of the adjacency_graph, kept up to date as edges are added
+        self.sccfilter: SCCFilter = SCCFilter()
+        # a cycle cover (perfect matching of winners to losers) of the adjacency_graph, checked before each search
+        self.coverfilter: CycleCoverFilter = CycleCoverFilter()
+        # optional memo of dead (visited, team) search states, used by the engines that support it
+        self.transposition: TranspositionTable | None = None
+        if memo_entries is not None or memo_bytes is not None:
+            self.transposition = TranspositionTable(
+                max_entries=memo_entries, max_bytes=memo_bytes
+            )
+            if engine not in Config.memo_engines:
+                logger.warning(
+                    f"The {engine} engine does not use the memo, only {Config.memo_engines} do"
+                )
+        # limits on the time / permutations the search can take, stopping with a partial result when one runs out
+        self.budget: SearchBudget = SearchBudget(
+            round_seconds=round_seconds,
+            round_nodes=round_nodes,
+            season_seconds=season_seconds,
+            season_nodes=season_nodes,
+        )
+        # reports the progress of each search, to the log and to the progress_callback (if any)
+        self.progress: ProgressReporter = ProgressReporter(callback=progress_callback)
+        # estimated permutations / seconds of each round's search, made before it is run
+        self.estimator: SearchEstimator = SearchEstimator()
+        self.round_estimates: dict[int, dict[str, float]] = {}
+        # the engine chosen for each round and why, by the auto engine
+        self.round_engines: dict[int, dict] = {}
+        # check the degree theorems guaranteeing a cycle before each round's search, skipping the search when
+        # a cycle constructed from them answers the objective, and the theorem that held by round
+        self.fast_path: bool = fast_path
+        self.round_certificates: dict[int, str] = {}
         self.first_hc: list[int] = []
         # purposefully large datetime to ensure first hamiltonian cycle is below this date
         self.date_of_first_hc: datetime = datetime(year=2999, month=12, day=31)
         self.all_hc: list[list] = []
+        # count of every cycle recorded, as the count and enumerate objectives do not keep them in all_hc
+        self.hc_counter: int = 0
+        self.cur_round: int | None = None
         self.round_hc_tracker: list[int] = []
         self.permutation_counter: int = 0
+        # branches cut by engines that prune the search, without being counted as permutations
+        self.pruned_counter: int = 0
         self.round_permutation_tracker: list[int] = []
         self.algo_seconds_runtime: float = 0.0
+        # checkpoints of the search are saved to checkpoint_file after every round (and periodically
+        # during a search, by engines able to resume part way through one), resume picks up from one
+        self.checkpointing: bool = checkpoint or resume
+        self.resuming: bool = resume
+        self.last_checkpoint: float = time.monotonic()
+        # the checkpoint being resumed from, until the round it was saved in has been rebuilt
+        self.resume_checkpoint: dict | None = None
 
     @property
     def total_hc_found(self) -> int:
-        return len(self.all_hc)
+        return self.hc_counter
 
     @property
     def round_of_first_hc(self) -> int | None:
@@ -75,10 +168,26 @@ class Algo:
                 "HC_Round": self.round_of_first_hc,
                 "HC_Date": self.date_of_first_hc,
                 "Permutations": self.permutation_counter,
+                "Pruned": self.pruned_counter,
                 "Permutation_Progression": self.round_permutation_tracker,
                 "Algo_Runtime_s": self.algo_seconds_runtime,
                 "Algo_Runtime_m": self.algo_seconds_runtime / 60,
                 "Total_HC": self.total_hc_found,
+                "Engine": self.enginecreator.engine.name,
+                "Objective": self.objective,
+                "Memo_Hits": self.transposition.hits if self.transposition else None,
+                "Memo_Misses": self.transposition.misses
+                if self.transposition
+                else None,
+                "Memo_Hit_Rate": self.transposition.hit_rate
+                if self.transposition
+                else None,
+                "Exhaustive": self.budget.exhausted is None,
+                "Budget": self.budget.limits,
+                "Budget_Exhausted": self.budget.exhausted,
+                "Search_Estimates": self.round_estimates,
+                "Engine_Selection": self.round_engines,
+                "HC_Certificates": self.round_certificates,
             }
         }
 
@@ -87,6 +196,20 @@ class Algo:
         """path of the file containing all the hamiltonian cycles search results for each season"""
         return Path(f"./data/{self.seasonresults.league}/all_seasons.json")
 
+    @property
+    def checkpoint_file(self) -> Path:
+        """path of the checkpoint of a search in progress for this league/season"""
+        return Path(
+            f"./data/{self.seasonresults.league}/{self.seasonresults.season}/checkpoint.json"
+        )
+
+    @property
+    def all_hc_stream_file(self) -> Path:
+        """path of the file every hamiltonian cycle is streamed to for the enumerate objective"""
+        return Path(
+            f"./data/{self.seasonresults.league}/{self.seasonresults.season}/all_hc.jsonl"
+        )
+
     def log_season_result(self) -> None:
         """log the contents of the single_season_result dict, just as an FYI on progress"""
         for k, v in self.hc_season_summary.items():
@@ -130,89 +253,316 @@ class Algo:
             json.dump(all_season_results, f, indent=2, default=str)
             logger.debug(f"Exported all_season_results to file")
 
-    def _hamiltonian_cycle_permutation_logger(self) -> None:
-        """helper function to log permutation progress, just helpful for eyeballing/ensuring compute is progressing"""
-        thresholds = [10, 100, 1000, 10000, 100000, 500000, 1000000]
-
-        if self.permutation_counter > thresholds[-1]:
-            if self.permutation_counter % 1000000 == 0:
-                logger.info(f"{self.permutation_counter} permutations")
-        else:
-            for threshold in thresholds:
-                if self.permutation_counter < threshold * 10:
-                    if self.permutation_counter % threshold == 0:
-                        logger.info(f"{self.permutation_counter} permutations")
-                    break
-
-    def _find_hamiltonian_cycle(self, hc_length_target: int):
-        """housing method to setup and then cur recursive algo"""
-
-        def dfs(cur_team: int, path: list[int]) -> bool | None:
-            """recursive dfs algo"""
-            self._hamiltonian_cycle_permutation_logger()
-            # check if we have a full length path
-            if len(path) == len(self.adjacency_graph) == hc_length_target:
-                # check if we have a hamiltonian cycle, but looking if the first team in the current
-                # path was defeated by the last team in the current path
-                if path[0] in [t for t in self.adjacency_graph[cur_team]]:
-                    # append the hc to list of all hcs found, because stats
-                    self.all_hc.append(path.copy())
-                    # get all date details to allow for a check if this is the 'first occuring' hc
-                    hc_dates: list = []
-                    # check dt for last on path and first on path
-                    hc_dates.append(self.result_detail[path[-1]][path[0]].dt)
-                    # check dt for all other winner/loser combos in the hc
-                    for i in range(1, hc_length_target, 1):
-                        w = path[i - 1]
-                        l = path[i]
-                        hc_dates.append(self.result_detail[w][l].dt)
-                    # get the max date, which is when the hamiltonian cycle was apparant
-                    max_hc_date = max(hc_dates)
-                    # update first_hc and its date if the current permutation is earlier
-                    if max_hc_date < self.date_of_first_hc:
-                        self.date_of_first_hc = max_hc_date
-                        self.first_hc = path.copy()
-                # return None to allow exit and backtracking to occur
-                return
-
-            # the main DFS callstack recursion loop
-            # using the 'current team', check if each defeated team is currently in the
-            # graph traversal 'path', recursively calling until the end of the path is
-            # reached or a hamiltonian cycle is found
-            if (
-                cur_team in self.adjacency_graph
-            ):  # check adjacency graph first as a safety
-                defeated_teams = self.adjacency_graph[cur_team]
-                for next_team in defeated_teams:
-                    if next_team not in path:
-                        self.permutation_counter += 1
-                        path.append(next_team)
-                        if dfs(next_team, path):
-                            return True
-                        # if DFS determines the path is at the end (either as a hamiltonian cycle
-                        # or a dead-end), remove the last item and continue down the call stack
-                        path.pop()
-
-            # hit the end of recursion calls here
-            return False
+    def save_checkpoint(self, search: dict | None = None) -> None:
+        """saves everything needed to pick the search up again to checkpoint_file: the rounds completed,
+        the adjacency_graph, the counters and trackers, the cycles found so far, and (if part way through a
+        round) the state of the engine's search. Written to a temporary file first, so an interruption
+        part way through leaves the previous checkpoint intact
+        """
+        checkpoint = {
+            "League": self.seasonresults.league,
+            "Season": self.seasonresults.season,
+            "Engine": self.enginecreator.engine.name,
+            "Objective": self.objective,
+            "Round": self.cur_round,
+            "Rounds_Completed": len(self.round_hc_tracker),
+            "Adjacency_Graph": {w: list(l) for w, l in self.adjacency_graph.items()},
+            "Search": search,
+            "HC": self.first_hc,
+            "HC_Date": self.date_of_first_hc,
+            "All_HC": self.all_hc,
+            "Total_HC": self.hc_counter,
+            "Permutations": self.permutation_counter,
+            "Pruned": self.pruned_counter,
+            "Permutation_Progression": self.round_permutation_tracker,
+            "HC_Progression": self.round_hc_tracker,
+            "Algo_Runtime_s": self.algo_seconds_runtime,
+            "Search_Estimates": self.round_estimates,
+            "Engine_Selection": self.round_engines,
+            "HC_Certificates": self.round_certificates,
+            "All_HC_Stream_Offset": None,
+        }
+        if self.objective == "enumerate":
+            # cycles streamed after this point are dropped on resume, as they will be found again
+            self.all_hc_stream.flush()
+            checkpoint["All_HC_Stream_Offset"] = self.all_hc_stream.tell()
+
+        self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.checkpoint_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(checkpoint, f, default=str)
+        os.replace(temp_file, self.checkpoint_file)
+        self.last_checkpoint = time.monotonic()
+        logger.debug(
+            f"Checkpoint saved to {self.checkpoint_file}, round {self.cur_round}"
+            + (f" part way through the search" if search else "")
+        )
 
-        # initial prep work, select the first team in the adjacency_graph
-        # and make the first call of recursive algo method
-        logger.debug("Begin recursion")
+    def search_checkpoint(self) -> None:
+        """called periodically by engines part way through a search, saving a checkpoint of it whenever
+        Config.checkpoint_seconds have passed since the last"""
+        if (
+            self.checkpointing
+            and time.monotonic() - self.last_checkpoint >= Config.checkpoint_seconds
+        ):
+            self.save_checkpoint(search=self.enginecreator.engine.checkpoint_state())
+
+    def load_checkpoint(self) -> dict | None:
+        """restores the counters, trackers and cycles found from checkpoint_file (if there is one), returning
+        the checkpoint. The graph itself is rebuilt by the round-by-round search, skipping the rounds
+        already searched
+        """
+        if not self.checkpoint_file.is_file():
+            logger.info(
+                f"No checkpoint found at {self.checkpoint_file}, starting afresh"
+            )
+            return None
+        with open(self.checkpoint_file, "r") as f:
+            checkpoint = json.load(f)
+        if (checkpoint["Engine"], checkpoint["Objective"]) != (
+            self.enginecreator.engine.name,
+            self.objective,
+        ):
+            raise ValueError(
+                f"Checkpoint was saved by engine {checkpoint['Engine']} for objective {checkpoint['Objective']}, "
+                f"not engine {self.enginecreator.engine.name} for objective {self.objective}"
+            )
+
+        self.first_hc = checkpoint["HC"]
+        self.date_of_first_hc = datetime.fromisoformat(checkpoint["HC_Date"])
+        self.all_hc = checkpoint["All_HC"]
+        self.hc_counter = checkpoint["Total_HC"]
+        self.permutation_counter = checkpoint["Permutations"]
+        self.pruned_counter = checkpoint["Pruned"]
+        self.round_permutation_tracker = checkpoint["Permutation_Progression"]
+        self.round_hc_tracker = checkpoint["HC_Progression"]
+        self.algo_seconds_runtime = checkpoint["Algo_Runtime_s"]
+        self.round_estimates = {
+            int(r): estimate for r, estimate in checkpoint["Search_Estimates"].items()
+        }
+        self.round_engines = {
+            int(r): decision for r, decision in checkpoint["Engine_Selection"].items()
+        }
+        self.round_certificates = {
+            int(r): condition for r, condition in checkpoint["HC_Certificates"].items()
+        }
+        self.resume_checkpoint = checkpoint
+        logger.info(
+            f"Resuming from checkpoint, {checkpoint['Rounds_Completed']} rounds already searched"
+            + (
+                f", part way through round {checkpoint['Round']}"
+                if checkpoint["Search"]
+                else ""
+            )
+        )
+        return checkpoint
+
+    def hc_date(self, path: list[int]) -> datetime:
+        """the date a hamiltonian cycle became apparent, ie. the date of the latest game making up the cycle"""
+        # get all date details to allow for a check if this is the 'first occuring' hc
+        hc_dates: list = []
+        # check dt for last on path and first on path
+        hc_dates.append(self.result_detail[path[-1]][path[0]].dt)
+        # check dt for all other winner/loser combos in the hc
+        for i in range(1, len(path), 1):
+            w = path[i - 1]
+            l = path[i]
+            hc_dates.append(self.result_detail[w][l].dt)
+        # get the max date, which is when the hamiltonian cycle was apparant
+        return max(hc_dates)
+
+    def record_hc(self, path: list[int]) -> None:
+        """record a hamiltonian cycle found by the search engine, keeping it as the first_hc if it
+        became apparent earlier than any found so far. What else is kept depends on the objective:
+
+        exists - the cycle is kept in all_hc, then SearchComplete is raised to stop the search
+        earliest - every cycle is kept in all_hc, because stats
+        count - cycles are only counted, never kept
+        enumerate - every cycle of the season is streamed to all_hc_stream_file rather than kept in memory,
+        once, in the round it became apparent. Cycles using none of the round's new edges were apparent in
+        an earlier round, so are neither counted nor streamed again, whichever engine found them
+        """
+        if self.objective == "enumerate" and not any(
+            edge in self.cur_new_edges for edge in zip(path, path[1:] + path[:1])
+        ):
+            return
+        self.hc_counter += 1
+        max_hc_date = self.hc_date(path)
+        # update first_hc and its date if the current permutation is earlier
+        if max_hc_date < self.date_of_first_hc:
+            self.date_of_first_hc = max_hc_date
+            self.first_hc = path.copy()
+
+        match self.objective:
+            case "exists":
+                self.all_hc.append(path.copy())
+                raise SearchComplete(
+                    f"Hamiltonian cycle exists in round {self.cur_round}"
+                )
+            case "count":
+                pass
+            case "enumerate":
+                self.all_hc_stream.write(
+                    json.dumps(
+                        {"Round": self.cur_round, "HC": path, "HC_Date": max_hc_date},
+                        default=str,
+                    )
+                    + "\n"
+                )
+            case _:
+                self.all_hc.append(path.copy())
+
+    def certificate_fast_path(self) -> bool:
+        """checks the theorems guaranteeing the current adjacency_graph a hamiltonian cycle in O(V^2),
+        recording the one that held. Returns True if the objective is answered without the engine's search
+        (see src/filters/degree.py for the cycles constructed in polynomial time, once every pair of teams has
+        played as in a round robin, Camion's construction always succeeds):
+
+        exists - any cycle will do, the constructed one is recorded
+        earliest - no cycle was found in earlier rounds, so every cycle this round uses one of its new games,
+        and a cycle using only games up to the earliest of them can't be bettered. Of those, the one dfs
+        would keep is recorded (see EngineAbstract.first_cycle, its expansions are the round's permutations)
+        count / enumerate - every cycle is needed, the search always runs
+
+        Only the one cycle is recorded, so Total_HC is 1 for a round answered here.
+        """
+        start_time = time.perf_counter()
+        try:
+            team_ids, defeated = graph_bitmasks(self.adjacency_graph)
+            condition = degree_condition(defeated)
+            if condition is None:
+                return False
+            self.round_certificates[self.cur_round] = condition
+            logger.info(
+                f"Round {self.cur_round} has a hamiltonian cycle by {condition}'s theorem"
+            )
+
+            match self.objective:
+                case "exists":
+                    if condition == "camion":
+                        cycle = camion_cycle(defeated)
+                    else:
+                        cycle = construct_cycle(defeated)
+                case "earliest" if self.round_new_edges[-1]:
+                    earliest_new = min(
+                        self.result_detail[w][l].dt for w, l in self.round_new_edges[-1]
+                    )
+                    team_index = {team: i for i, team in enumerate(team_ids)}
+                    defeated = [
+                        sum(
+                            1 << team_index[l]
+                            for l, game in self.result_detail.get(w, {}).items()
+                            if game.dt <= earliest_new
+                        )
+                        for w in team_ids
+                    ]
+                    if degree_condition(defeated) is None:
+                        return False
+                    # the teams each defeated by then, in the order dfs takes them
+                    neighbours = [
+                        [
+                            team_index[l]
+                            for l in self.adjacency_graph[w]
+                            if defeated[i] >> team_index[l] & 1
+                        ]
+                        for i, w in enumerate(team_ids)
+                    ]
+                    self.budget.start_round(self.permutation_counter)
+                    self.progress.start(self.cur_round, self.permutation_counter)
+                    try:
+                        cycle = self.enginecreator.engine.first_cycle(
+                            defeated, neighbours
+                        )
+                    except BudgetExhausted as be:
+                        logger.warning(
+                            f"Search stopped in round {self.cur_round}, {be} - results are partial"
+                        )
+                        return True
+                    finally:
+                        self.progress.finish(self.permutation_counter)
+                case _:
+                    return False
+
+            if cycle is None:
+                logger.info(
+                    f"Round {self.cur_round} cycle construction stalled, searching"
+                )
+                return False
+            try:
+                self.record_hc([team_ids[t] for t in cycle])
+            except SearchComplete:
+                # exists, the objective has been met
+                pass
+            return True
+        finally:
+            # checking the theorems is part of the round's runtime, whether or not a cycle is constructed
+            self.algo_seconds_runtime += time.perf_counter() - start_time
+
+    def estimate_search(self) -> dict[str, float]:
+        """estimates the permutations and runtime of the search of the current adjacency_graph before it is
+        run, logging and keeping the estimate by round"""
+        estimate = self.estimator.estimate(self.adjacency_graph)
+        self.round_estimates[self.cur_round] = estimate
+        logger.info(
+            f"Round {self.cur_round} search estimated at {estimate['Permutations']:.3g} permutations, "
+            f"{estimate['Seconds']:.3g} seconds"
+        )
+        round_seconds = self.budget.limits.get("round_seconds")
+        if round_seconds is not None and estimate["Seconds"] > round_seconds:
+            logger.warning(
+                f"Round {self.cur_round} search is estimated to exceed its budget of {round_seconds} seconds"
+            )
+        return estimate
+
+    def _find_hamiltonian_cycle(
+        self, hc_length_target: int, search: dict | None = None
+    ) -> None:
+        """housing method to time and then run the assigned search engine over the current adjacency_graph,
+        or to continue the engine's search from a checkpoint"""
+        logger.debug(f"Begin search - {self.enginecreator.engine.name}")
         start_time = time.perf_counter()  # start a timer because stats
-        cur_team = next(iter(self.adjacency_graph))
-        dfs(cur_team=cur_team, path=[cur_team])
-
-        # once the recursive calls are all done, log the time it took
-        self.algo_seconds_runtime += time.perf_counter() - start_time
-        logger.debug(f"End recursion - {self.algo_seconds_runtime} seconds")
+        start_permutations = self.permutation_counter
+        if self.transposition is not None:
+            # states dead in the previous round's graph may not be with this round's new edges
+            self.transposition.clear()
+        self.progress.start(self.cur_round, self.permutation_counter)
+        try:
+            self.budget.start_round(self.permutation_counter)
+            if search is None:
+                self.enginecreator.engine.find_hamiltonian_cycle(
+                    hc_length_target=hc_length_target
+                )
+            else:
+                self.enginecreator.engine.resume_search(state=search)
+        except SearchComplete as sc:
+            # the objective has been met part way through the search, no need to continue
+            logger.debug(f"Search stopped early - {sc}")
+        except BudgetExhausted as be:
+            # out of time / permutations, what has been found so far is kept as a partial result
+            logger.warning(
+                f"Search stopped in round {self.cur_round}, {be} - results are partial"
+            )
+            if self.checkpointing:
+                search_state = self.enginecreator.engine.checkpoint_state()
+                if search_state is not None:
+                    # picked up again from here on resume, otherwise from the last round's checkpoint
+                    self.save_checkpoint(search=search_state)
+
+        # once the search is done, log the time it took
+        search_seconds = time.perf_counter() - start_time
+        self.algo_seconds_runtime += search_seconds
+        logger.debug(f"End search - {self.algo_seconds_runtime} seconds")
+        self.estimator.observe(
+            self.permutation_counter - start_permutations, search_seconds
+        )
+        self.progress.finish(self.permutation_counter)
 
     def hamiltonian_cycle_search(self) -> None:
         """primary search method which builds the adjacency graph incrementally by round, and then
         triggers the the Hamiltonian Cycle search.
 
-        nb. the method name hamiltonian_cycle_search was used in case other algorithms are used in the future, however
-        only DFS is used at this stage. Will need a minor refactor to introduce other algorithm options.
+        nb. the search itself is undertaken by the engine assigned in the constructor (see src/engines/), this
+        method only manages the round-by-round graph and the trackers
         """
         # logging progress
         logger.info(f"Season {self.seasonresults.season}")
@@ -221,11 +571,50 @@ class Algo:
         for i in self.seasonresults.team_ids:
             self.adjacency_graph[i] = set()
 
+        checkpoint = self.load_checkpoint() if self.resuming else None
+        self.budget.start_season(self.permutation_counter)
+
+        try:
+            if self.objective == "enumerate":
+                # every cycle of every round is streamed to file, rather than building up in memory
+                self.all_hc_stream_file.parent.mkdir(parents=True, exist_ok=True)
+                if checkpoint:
+                    # carry on from the cycles streamed up to the checkpoint
+                    self.all_hc_stream = open(self.all_hc_stream_file, "a")
+                    self.all_hc_stream.truncate(checkpoint["All_HC_Stream_Offset"])
+                else:
+                    self.all_hc_stream = open(self.all_hc_stream_file, "w")
+                logger.info(
+                    f"Streaming all hamiltonian cycles to {self.all_hc_stream_file}"
+                )
+                try:
+                    self._round_by_round_search()
+                finally:
+                    self.all_hc_stream.close()
+            else:
+                self._round_by_round_search()
+        finally:
+            # release anything the engine held across rounds
+            self.enginecreator.engine.close()
+
+        if (
+            self.checkpointing
+            and self.budget.exhausted is None
+            and self.checkpoint_file.is_file()
+        ):
+            # the search is over, nothing left to resume
+            self.checkpoint_file.unlink()
+
+    def _round_by_round_search(self) -> None:
+        """the main round-by-round loop of hamiltonian_cycle_search"""
         # the main round-by-round loop, building the adjacency graph based on results
         # up-to that round, and run the _find_hamiltonian_cycle method for each in-sequence
-        for cur_round in self.seasonresults.rounds_list:
+        # (rounds searched before a checkpoint being resumed from only have their graph rebuilt)
+        rounds_completed: int = len(self.round_hc_tracker)
+        for index, cur_round in enumerate(self.seasonresults.rounds_list):
             logger.info(f"Searching round {cur_round}...")
-            team_w_no_loss_yet: bool = False
+            self.cur_round = cur_round
+            new_edges: list[tuple[int, int]] = []
             cur_round_results: list[GameResult] = self.seasonresults.round_results[
                 cur_round
             ]
@@ -236,33 +625,72 @@ class Algo:
                 # update adjacency_graph, only if first time winner-loser combo
                 if cur_game.loser not in self.adjacency_graph[cur_game.winner]:
                     self.adjacency_graph[cur_game.winner].add(cur_game.loser)
-                    if len(self.adjacency_graph[cur_game.winner]) == cur_round:
-                        # the number of losers against the current winner equals the number of rounds
-                        # indicates that this team is yet to lose
-                        team_w_no_loss_yet = True
+                    new_edges.append((cur_game.winner, cur_game.loser))
+                    self.sccfilter.add_edge(cur_game.winner, cur_game.loser)
                     # update results_matrix (which is a dict for simple referal for game_details, used later)
                     if cur_game.winner not in self.result_detail:
                         # was getting nested typehinting complaints with defaultdict, hence this work-around
                         self.result_detail[cur_game.winner] = {}
                     self.result_detail[cur_game.winner][cur_game.loser] = cur_game
+            self.round_new_edges.append(new_edges)
+            self.cur_new_edges = set(new_edges)
+            self.sccfilter.update(self.adjacency_graph)
 
-            # check if hc is possible (ie. all teams both won and lost) before running
+            search: dict | None = None
             if (
-                len(self.adjacency_graph) < self.seasonresults.nteams
-                or team_w_no_loss_yet
+                self.resume_checkpoint is not None
+                and cur_round == self.resume_checkpoint["Round"]
             ):
+                checkpoint, self.resume_checkpoint = self.resume_checkpoint, None
+                resumed_graph = {
+                    int(w): sorted(l) for w, l in checkpoint["Adjacency_Graph"].items()
+                }
+                if resumed_graph != {
+                    w: sorted(l) for w, l in self.adjacency_graph.items()
+                }:
+                    raise ValueError(
+                        f"Season results have changed since the checkpoint was saved in round {cur_round}"
+                    )
+                # the search in progress in this round when the checkpoint was saved, if any
+                search = checkpoint["Search"]
+            if index < rounds_completed:
+                # already searched before the checkpoint
+                continue
+
+            # check if hc is possible (ie. every team can reach every other team through victories) before running
+            if len(self.adjacency_graph) < self.seasonresults.nteams:
                 # if there are any teams not yet in the adjacency_graph that means they are yet to win
-                logger.info(f"Hamiltonian Cycle not possible in round {cur_round}")
+                logger.info(
+                    f"Hamiltonian Cycle not possible in round {cur_round} - teams yet to win"
+                )
+            elif not self.sccfilter.strongly_connected:
+                logger.info(
+                    f"Hamiltonian Cycle not possible in round {cur_round} - {self.sccfilter.reason(self.adjacency_graph)}"
+                )
+            elif not self.coverfilter.check(self.adjacency_graph):
+                logger.info(
+                    f"Hamiltonian Cycle not possible in round {cur_round} - {self.coverfilter.reason(self.adjacency_graph)}"
+                )
+            elif self.fast_path and self.certificate_fast_path():
+                logger.info(f"Round {cur_round} answered without a search")
             else:
+                self.estimate_search()
                 # run the hamiltonian cycle checking algo
-                self._find_hamiltonian_cycle(hc_length_target=self.seasonresults.nteams)
+                self._find_hamiltonian_cycle(
+                    hc_length_target=self.seasonresults.nteams, search=search
+                )
 
             # update trackers
             self.round_permutation_tracker.append(self.permutation_counter)
             self.round_hc_tracker.append(self.total_hc_found)
+            if self.budget.exhausted is not None:
+                # out of budget, the round is left unfinished in the checkpoint
+                break
+            if self.checkpointing:
+                self.save_checkpoint()
 
             # if a hamiltonian cycle was found this round, break the for-loop since we dont
-            # need to look into further rounds. (nb. can comment this out to continue searching,
+            # need to look into further rounds. (nb. the enumerate objective continues searching,
             # finding all Hamiltonian Cycles within an entire season... but yeah compute can explode... )
-            if self.first_hc:
+            if self.first_hc and self.objective != "enumerate":
                 break
@@ -0,0 +1,99 @@
+import time
+
+
+class BudgetExhausted(Exception):
+    """raised (by SearchBudget.check) part way through a search when one of its budgets has run out,
+    engines must leave the Algo counters up to date should it pass through them, as with SearchComplete
+    """
+
+    def __init__(self, budget: str, limit: float | int):
+        super().__init__(f"{budget} budget of {limit} exhausted")
+        self.budget = budget
+        self.limit = limit
+
+
+class SearchBudget:
+    """limits on how long a season's search can run, per round and for the whole season, in wall-clock
+    seconds and/or permutations (the nodes expanded by the search). Any left as None are unlimited.
+
+    start_season() and start_round() mark where each budget is measured from, check() is then called by
+    the engines as the search progresses and raises BudgetExhausted once the tightest limit has passed.
+    The engines only check every so often (see EngineAbstract.search_progress), and the depth-first
+    engines stop exactly on node_limit, so the time budgets may overrun slightly but their node budgets
+    won't. The dynamic programs can only check once each table is built, and the parallel and distributed
+    engines once their tasks come back, so they can overrun either.
+    """
+
+    def __init__(
+        self,
+        round_seconds: float | None = None,
+        round_nodes: int | None = None,
+        season_seconds: float | None = None,
+        season_nodes: int | None = None,
+    ):
+        self.limits: dict[str, float | int] = {
+            budget: limit
+            for budget, limit in (
+                ("round_seconds", round_seconds),
+                ("round_nodes", round_nodes),
+                ("season_seconds", season_seconds),
+                ("season_nodes", season_nodes),
+            )
+            if limit is not None
+        }
+        if any(limit <= 0 for limit in self.limits.values()):
+            raise ValueError(f"search budgets must be positive, not {self.limits}")
+        self.season_start: float = time.monotonic()
+        self.season_start_nodes: int = 0
+        # the tightest of the round and season limits for the round being searched, and which budget each is
+        self.deadline: float = float("inf")
+        self.deadline_budget: str | None = None
+        self.node_limit: float = float("inf")
+        self.node_budget: str | None = None
+        # the budget that ran out, if any
+        self.exhausted: str | None = None
+
+    def start_season(self, permutation_counter: int) -> None:
+        """the season budgets are measured from here"""
+        self.season_start = time.monotonic()
+        self.season_start_nodes = permutation_counter
+        self.exhausted = None
+
+    def start_round(self, permutation_counter: int) -> None:
+        """the round budgets are measured from here, raises BudgetExhausted if the season budgets have
+        already run out"""
+        now = time.monotonic()
+        deadlines = [(float("inf"), None)]
+        node_limits = [(float("inf"), None)]
+        if "round_seconds" in self.limits:
+            deadlines.append((now + self.limits["round_seconds"], "round_seconds"))
+        if "season_seconds" in self.limits:
+            deadlines.append(
+                (self.season_start + self.limits["season_seconds"], "season_seconds")
+            )
+        if "round_nodes" in self.limits:
+            node_limits.append(
+                (permutation_counter + self.limits["round_nodes"], "round_nodes")
+            )
+        if "season_nodes" in self.limits:
+            node_limits.append(
+                (self.season_start_nodes + self.limits["season_nodes"], "season_nodes")
+            )
+        self.deadline, self.deadline_budget = min(deadlines, key=lambda d: d[0])
+        self.node_limit, self.node_budget = min(node_limits, key=lambda n: n[0])
+        if now >= self.deadline:
+            self.exhaust(self.deadline_budget)
+        if permutation_counter >= self.node_limit:
+            self.exhaust(self.node_budget)
+
+    def check(self, permutation_counter: int) -> None:
+        """called as the search progresses, raises BudgetExhausted once the round's limits have passed"""
+        if permutation_counter >= self.node_limit:
+            self.exhaust(self.node_budget)
+        if time.monotonic() >= self.deadline:
+            self.exhaust(self.deadline_budget)
+
+    def exhaust(self, budget: str) -> None:
+        """record the budget as the one that ran out, and stop the search"""
+        self.exhausted = budget
+        raise BudgetExhausted(budget=budget, limit=self.limits[budget])
@@ -0,0 +1,204 @@
+from src.distributed.protocol import Connection
+from src.engines.parallel import Graph, Result, Task
+from collections import deque
+import threading
+import socket
+import queue
+import time
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class WorkerHandle:
+    """the coordinator's view of a connected worker"""
+
+    def __init__(self, connection: Connection, address: tuple) -> None:
+        self.connection = connection
+        self.name = f"{address[0]}:{address[1]}"
+        self.last_seen = time.monotonic()
+        # the search this worker has been sent the graph for, and its tasks not yet returned
+        self.search: int | None = None
+        self.tasks: dict[int, Task] = {}
+        self.alive = True
+
+
+class Coordinator:
+    """hands the tasks of a search out to the workers connected over tcp, collecting their results.
+
+    Every worker is kept prefetch tasks deep, and a worker that closes its connection or misses its
+    heartbeats for heartbeat_timeout seconds is dropped, with the tasks it held handed to other workers.
+    Results are only taken once per task, so a late result from a worker thought dead is ignored.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        heartbeat_timeout: float,
+        prefetch: int = 2,
+    ) -> None:
+        self.heartbeat_timeout = heartbeat_timeout
+        self.prefetch = prefetch
+        self.server = socket.create_server((host, port))
+        self.address: tuple[str, int] = self.server.getsockname()[:2]
+        self.workers: list[WorkerHandle] = []
+        # (event, worker, message) from the connection threads, handled by whoever is running a search
+        self.events: queue.Queue = queue.Queue()
+        self.search_id = 0
+        # every worker ever accepted, the search only learns of them through events
+        self.accepted: list[WorkerHandle] = []
+        self.closed = False
+        threading.Thread(target=self.accept, daemon=True).start()
+        logger.info(f"Coordinator listening for workers on {self.address}")
+
+    def accept(self) -> None:
+        """accepts worker connections until the coordinator is closed"""
+        while not self.closed:
+            try:
+                sock, address = self.server.accept()
+            except OSError:
+                return
+            worker = WorkerHandle(Connection(sock), address)
+            self.accepted.append(worker)
+            self.events.put(("connected", worker, None))
+            threading.Thread(target=self.listen, args=(worker,), daemon=True).start()
+
+    def listen(self, worker: WorkerHandle) -> None:
+        """passes on every message from a worker, then its disconnection"""
+        for message in worker.connection.messages():
+            self.events.put(("message", worker, message))
+        self.events.put(("disconnected", worker, None))
+
+    def run(
+        self,
+        graph: Graph,
+        tasks: list[Task],
+        keep_cycles: bool,
+        exists: bool,
+        node_limit: float = float("inf"),
+        deadline: float = float("inf"),
+    ) -> list[Result]:
+        """searches every task across the workers, waiting for workers should none be connected. The
+        search is cancelled once the results hold node_limit expansions between them or time.monotonic()
+        has passed deadline, returning the results so far"""
+        self.search_id += 1
+        search = self.search_id
+        todo: deque[tuple[int, Task]] = deque(enumerate(tasks))
+        results: dict[int, Result] = {}
+        waiting_logged = False
+
+        while len(results) < len(tasks):
+            searched = sum(result[3] for result in results.values())
+            if searched >= node_limit or time.monotonic() >= deadline:
+                # out of budget, the tasks still with the workers are abandoned
+                self.broadcast({"type": "cancel", "search": search})
+                break
+            # keep every worker busy
+            for worker in list(self.workers):
+                while todo and len(worker.tasks) < self.prefetch:
+                    task_id, task = todo.popleft()
+                    try:
+                        if worker.search != search:
+                            worker.connection.send(
+                                {
+                                    "type": "search",
+                                    "search": search,
+                                    "graph": graph,
+                                    "keep_cycles": keep_cycles,
+                                    "exists": exists,
+                                }
+                            )
+                            worker.search = search
+                        worker.connection.send(
+                            {
+                                "type": "task",
+                                "search": search,
+                                "task": task_id,
+                                "prefix": task[0],
+                                "candidates": task[1],
+                            }
+                        )
+                        worker.tasks[task_id] = task
+                    except OSError:
+                        todo.appendleft((task_id, task))
+                        self.drop(worker, todo, "connection lost")
+                        break
+            if not self.workers and not waiting_logged:
+                logger.info(f"Waiting for workers to connect to {self.address}")
+                waiting_logged = True
+
+            try:
+                event, worker, message = self.events.get(
+                    timeout=self.heartbeat_timeout / 4
+                )
+            except queue.Empty:
+                event = None
+            match event:
+                case "connected":
+                    self.workers.append(worker)
+                    waiting_logged = False
+                case "disconnected":
+                    self.drop(worker, todo, "disconnected")
+                case "message" if worker.alive:
+                    worker.last_seen = time.monotonic()
+                    if message["type"] == "hello":
+                        logger.info(f"Worker {message['name']} connected")
+                        worker.name = message["name"]
+                    elif message["type"] == "result" and message["search"] == search:
+                        task_id = message["task"]
+                        worker.tasks.pop(task_id, None)
+                        if task_id not in results:
+                            results[task_id] = tuple(message["result"])
+                            if exists and message["result"][1]:
+                                # a cycle exists, so nothing else is needed from any worker
+                                self.broadcast({"type": "cancel", "search": search})
+                                break
+
+            # workers silent for too long are treated as dead
+            now = time.monotonic()
+            for worker in list(self.workers):
+                if now - worker.last_seen > self.heartbeat_timeout:
+                    self.drop(worker, todo, "missed heartbeats")
+
+        for worker in self.workers:
+            worker.tasks.clear()
+        return list(results.values())
+
+    def drop(
+        self, worker: WorkerHandle, todo: deque[tuple[int, Task]], reason: str
+    ) -> None:
+        """forgets a worker, handing the tasks it held back out"""
+        if not worker.alive:
+            return
+        worker.alive = False
+        if worker in self.workers:
+            self.workers.remove(worker)
+        logger.info(
+            f"Worker {worker.name} {reason}, re-dispatching {len(worker.tasks)} tasks"
+        )
+        todo.extendleft(reversed(list(worker.tasks.items())))
+        worker.tasks.clear()
+        worker.connection.close()
+
+    def broadcast(self, message: dict) -> None:
+        """sends a message to every worker taking part in the search"""
+        for worker in self.workers:
+            try:
+                worker.connection.send(message)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """tells every worker to shut down, then stops listening"""
+        self.closed = True
+        self.server.close()
+        for worker in self.accepted:
+            if worker.alive:
+                try:
+                    worker.connection.send({"type": "shutdown"})
+                except OSError:
+                    pass
+            worker.connection.close()
+        self.workers.clear()
@@ -0,0 +1,49 @@
+"""the coordinator/worker protocol for distributed searches, newline delimited json messages over tcp
+
+coordinator -> worker:
+    search      {"type": "search", "search": id, "graph": Graph, "keep_cycles": bool, "exists": bool}
+    task        {"type": "task", "search": id, "task": id, "prefix": [...], "candidates": [...] | null}
+    cancel      {"type": "cancel", "search": id}
+    shutdown    {"type": "shutdown"}
+
+worker -> coordinator:
+    hello       {"type": "hello", "name": str}
+    heartbeat   {"type": "heartbeat"}
+    result      {"type": "result", "search": id, "task": id, "result": Result}
+"""
+
+from typing import Iterator
+import threading
+import socket
+import json
+
+
+class Connection:
+    """a socket carrying protocol messages, sends are locked so several threads can share it"""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.reader = sock.makefile("r", encoding="utf-8")
+        self.lock = threading.Lock()
+
+    def send(self, message: dict) -> None:
+        """sends a single message, raising OSError when the other end has gone"""
+        data = (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+        with self.lock:
+            self.sock.sendall(data)
+
+    def messages(self) -> Iterator[dict]:
+        """every message received, until the other end closes the connection"""
+        try:
+            for line in self.reader:
+                yield json.loads(line)
+        except (OSError, ValueError):
+            # a reset connection or a half written message, either way the connection is finished
+            return
+
+    def close(self) -> None:
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
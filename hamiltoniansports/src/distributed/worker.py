@@ -0,0 +1,105 @@
+from src.distributed.protocol import Connection
+from src.engines.parallel import search_subtree
+import threading
+import socket
+import queue
+import time
+import os
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class CancelScheduler:
+    """lets search_subtree check for cancellation, a remote worker never gives work away"""
+
+    def __init__(self, interval: int) -> None:
+        self.cancel = threading.Event()
+        self.interval = interval
+
+    def hungry(self) -> bool:
+        return False
+
+
+def connect(host: str, port: int, retry_seconds: float) -> socket.socket:
+    """connects to the coordinator, retrying until it is listening"""
+    while True:
+        try:
+            return socket.create_connection((host, port))
+        except OSError:
+            time.sleep(retry_seconds)
+
+
+def run_worker(
+    host: str,
+    port: int,
+    heartbeat_seconds: float = 1.0,
+    interval: int = 1000,
+    retry_seconds: float = 0.5,
+) -> None:
+    """connects to a coordinator and searches the tasks it sends, until it is told to shut down or the
+    connection is lost. Heartbeats are sent from a separate thread, so they continue during long tasks.
+    """
+    connection = Connection(connect(host, port, retry_seconds))
+    name = f"{socket.gethostname()}-{os.getpid()}"
+    connection.send({"type": "hello", "name": name})
+    logger.info(f"Worker {name} connected to {host}:{port}")
+
+    inbox: queue.Queue = queue.Queue()
+    stopped = threading.Event()
+    # cancellation has to be seen part way through a task, so it is handled as soon as it's received
+    cancelled: dict[int, CancelScheduler] = {}
+
+    def receive() -> None:
+        for message in connection.messages():
+            if message["type"] == "cancel":
+                cancelled.setdefault(message["search"], CancelScheduler(interval))
+                cancelled[message["search"]].cancel.set()
+            inbox.put(message)
+        inbox.put({"type": "shutdown"})
+
+    def heartbeat() -> None:
+        while not stopped.wait(heartbeat_seconds):
+            try:
+                connection.send({"type": "heartbeat"})
+            except OSError:
+                return
+
+    threading.Thread(target=receive, daemon=True).start()
+    threading.Thread(target=heartbeat, daemon=True).start()
+
+    search: dict = {}
+    try:
+        while True:
+            message = inbox.get()
+            match message["type"]:
+                case "shutdown":
+                    return
+                case "search":
+                    search = message
+                    cancelled.setdefault(message["search"], CancelScheduler(interval))
+                case "task" if message["search"] == search.get("search"):
+                    scheduler = cancelled[message["search"]]
+                    if scheduler.cancel.is_set():
+                        continue
+                    result = search_subtree(
+                        (message["prefix"], message["candidates"]),
+                        search["graph"],
+                        search["keep_cycles"],
+                        search["exists"],
+                        scheduler,
+                    )
+                    connection.send(
+                        {
+                            "type": "result",
+                            "search": message["search"],
+                            "task": message["task"],
+                            "result": result,
+                        }
+                    )
+    except OSError:
+        logger.info(f"Worker {name} lost its connection to {host}:{port}")
+    finally:
+        stopped.set()
+        connection.close()
@@ -0,0 +1,181 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+from datetime import datetime
+
+import logging
+
+if TYPE_CHECKING:
+    # only imported for typehinting, the algo class composes the engine so a runtime import would be circular
+    from src.algo import Algo
+
+logger = logging.getLogger("main")
+
+
+def dfs_order(cycle: list[int], neighbours: list[list[int]]) -> list[int]:
+    """the order the serial dfs would find a cycle in, as the neighbour position taken at each step, for
+    engines finding cycles out of that order to settle which came first"""
+    return [neighbours[a].index(b) for a, b in zip(cycle, cycle[1:])]
+
+
+class SearchComplete(Exception):
+    """raised (by Algo.record_hc) when the search objective has been met part way through a search,
+    engines must leave the Algo counters up to date should it pass through them"""
+
+
+class EngineAbstract(ABC):
+    """Abstract class for use with the various hamiltonian cycle search engines, as a guide for further
+    usage with the EngineCreator class, which allows the Algo class to run any search engine.
+
+    Engines read the current state of the graph from the Algo instance (adjacency_graph, result_detail),
+    and report back into it: any hamiltonian cycle found is passed to Algo.record_hc() and every
+    expansion of the search is counted in Algo.permutation_counter (the depth-first engines also calling
+    search_progress() every so often as they count). Engines counting in locals write them back to the Algo
+    in a finally block, as the search can be stopped part way through by SearchComplete or BudgetExhausted.
+    """
+
+    name: str
+    algo: "Algo"
+
+    def __init__(self, algo: "Algo") -> None:
+        self.algo = algo
+
+    def team_bitmasks(self) -> tuple[list[int], dict[int, int], list[int]]:
+        """remaps the team ids in the adjacency_graph onto bit positions 0..n-1, in adjacency_graph order
+        (so bit 0 is always the team the search starts from)
+
+        returns the list of team ids (by bit position), the team id -> bit position lookup, and for each
+        bit position the bitmask of teams defeated by that team
+        """
+        adjacency_graph = self.algo.adjacency_graph
+        team_ids: list[int] = list(adjacency_graph)
+        team_index: dict[int, int] = {team: i for i, team in enumerate(team_ids)}
+        defeated: list[int] = [
+            sum(1 << team_index[t] for t in adjacency_graph[team]) for team in team_ids
+        ]
+        return team_ids, team_index, defeated
+
+    @staticmethod
+    def defeated_by_bitmasks(defeated: list[int]) -> list[int]:
+        """inverts the defeated bitmasks, for each bit position the bitmask of teams that defeated that team"""
+        nteams = len(defeated)
+        return [
+            sum(1 << i for i in range(nteams) if defeated[i] >> t & 1)
+            for t in range(nteams)
+        ]
+
+    def edge_ranks(
+        self, team_ids: list[int], defeated: list[int]
+    ) -> tuple[list[datetime], list[list[int]]]:
+        """game dates compared as ranks among the distinct dates of the current graph
+
+        returns the sorted distinct dates, and for each pair of bit positions the rank of the date the
+        first defeated the second (-1 if it didn't)
+        """
+        result_detail = self.algo.result_detail
+        nteams = len(team_ids)
+        dates: list[datetime] = sorted(
+            {
+                result_detail[team_ids[w]][team_ids[l]].dt
+                for w in range(nteams)
+                for l in range(nteams)
+                if defeated[w] >> l & 1
+            }
+        )
+        rank: dict[datetime, int] = {dt: i for i, dt in enumerate(dates)}
+        edge_rank: list[list[int]] = [
+            [
+                rank[result_detail[team_ids[w]][team_ids[l]].dt]
+                if defeated[w] >> l & 1
+                else -1
+                for l in range(nteams)
+            ]
+            for w in range(nteams)
+        ]
+        return dates, edge_rank
+
+    def first_cycle(
+        self, defeated: list[int], neighbours: list[list[int]]
+    ) -> list[int] | None:
+        """the cycle (as bit positions from 0) dfs finds first along the defeated bitmasks, taking the
+        neighbours of each team in order, with forward checking. Its expansions are counted (and the budget
+        checked) as the depth-first engines do, for settling which of several cycles dfs would keep
+        """
+        # imported here, the pruned engine's module imports this one
+        from src.engines.pruned import forward_check
+
+        defeated_by = self.defeated_by_bitmasks(defeated)
+        full = (1 << len(defeated)) - 1
+        search_progress = self.search_progress
+        counter: int = self.algo.permutation_counter
+        next_progress: int = counter
+        path = [0]
+
+        def dfs(cur: int, visited: int) -> bool:
+            nonlocal counter, next_progress
+            if counter >= next_progress:
+                next_progress = search_progress(counter, len(path))
+            if visited == full:
+                return bool(defeated[cur] & 1)
+            for nxt in neighbours[cur]:
+                bit = 1 << nxt
+                if not visited & bit and forward_check(
+                    nxt, visited | bit, full, defeated, defeated_by
+                ):
+                    counter += 1
+                    path.append(nxt)
+                    if dfs(nxt, visited | bit):
+                        return True
+                    path.pop()
+            return False
+
+        try:
+            if forward_check(0, 1, full, defeated, defeated_by) and dfs(0, 1):
+                return path
+            return None
+        finally:
+            self.algo.permutation_counter = counter
+
+    def record_count(self, total: int, witness: list[int]) -> None:
+        """for engines counting cycles without building every one, records the total with a single witness
+        cycle (of team ids), passed to Algo.record_hc for its date and counted as one of the total
+        """
+        self.algo.hc_counter += total - 1
+        self.algo.record_hc(witness)
+
+    def search_progress(self, permutation_counter: int, depth: int | None) -> int:
+        """called by the depth-first engines once their permutation count reaches the count last returned,
+        which keeps everything but the count out of their hot loop (and by the dynamic programs once each
+        table is built). Samples the search progress, and stops
+        the search (raising BudgetExhausted) once the Algo's search budget has run out
+        """
+        self.algo.budget.check(permutation_counter)
+        self.algo.progress.sample(permutation_counter, depth)
+        return min(
+            permutation_counter + self.algo.progress.sample_interval,
+            self.algo.budget.node_limit,
+        )
+
+    def checkpoint_state(self) -> dict | None:
+        """the state of the search in progress, json serialisable, for engines able to resume part way
+        through a search (see resume_search). None for engines that can only be checkpointed between rounds
+        """
+        return None
+
+    def resume_search(self, state: dict) -> None:
+        """continue a search from a checkpoint_state(), for engines able to"""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} cannot resume part way through a search"
+        )
+
+    def close(self) -> None:
+        """called once the round-by-round search is over, for engines holding anything across rounds
+        (eg. sockets) to release it"""
+
+    @abstractmethod
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """search the current adjacency_graph of the algo for hamiltonian cycles of length hc_length_target,
+        recording each one found with algo.record_hc() and counting expansions in algo.permutation_counter
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__}.{__name__} is abstract and has not been implemented in the subclass"
+        )
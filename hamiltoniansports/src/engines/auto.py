@@ -0,0 +1,124 @@
+from src.engines.abstract import EngineAbstract
+from src.engines.creator import EngineCreator
+from utils.config import Config
+from typing import TYPE_CHECKING
+import math
+
+import logging
+
+if TYPE_CHECKING:
+    from src.algo import Algo
+
+logger = logging.getLogger("main")
+
+
+def select_engine(
+    objective: str,
+    nteams: int,
+    strongly_connected: bool,
+    estimated_permutations: float,
+    density: float,
+) -> str | None:
+    """the engine expected to search a round the quickest for the objective, or None when no cycle is
+    possible. A depth-first search is chosen while its estimated tree is a fraction (1/Config.auto_dfs_ratio)
+    of the 2^(V-1) V states of the dynamic programs, which take the same time however the round looks,
+    and the dynamic programs only up to Config.auto_dp_max_teams, beyond which their tables outgrow memory.
+    Past that, the meet-in-the-middle engine's halves each search about the square root of the tree, so it
+    is chosen to count or find the earliest cycle while Config.auto_mitm_max_halves of them fit in memory.
+
+    The exists objective stops at the first cycle, which the estimate of the whole tree can't tell apart,
+    so rounds at least Config.auto_exists_density dense (where one is all but certain, and forward checking
+    tends to find it on the first dives) are searched depth-first whatever the size of the tree
+    """
+    if not strongly_connected:
+        return None
+    dp_states = (1 << (nteams - 1)) * nteams
+    dfs_cheaper = estimated_permutations * Config.auto_dfs_ratio < dp_states
+    dp_feasible = nteams <= Config.auto_dp_max_teams
+    mitm_feasible = math.sqrt(estimated_permutations) <= Config.auto_mitm_max_halves
+    match objective:
+        case "exists":
+            if density >= Config.auto_exists_density:
+                return "mrv"
+            return "mrv" if dfs_cheaper or not dp_feasible else "dp"
+        case "earliest":
+            if dfs_cheaper:
+                return "bnb"
+            if dp_feasible:
+                return "bottleneck"
+            return "mitm" if mitm_feasible else "bnb"
+        case "count":
+            if dfs_cheaper:
+                return "pruned"
+            if dp_feasible:
+                return "dpcount"
+            return "mitm" if mitm_feasible else "iecount"
+        case _:
+            # enumerate, every cycle has to be found regardless, but only once across the rounds
+            return "incremental"
+
+
+class AutoEngine(EngineAbstract):
+    """chooses the engine for each round with select_engine(), from the number of teams, whether the graph
+    is strongly connected and the estimated size of its search tree (see SearchEstimator), then runs it.
+    The decision and its inputs (with the number of edges and density of the graph) are kept by round in
+    Algo.round_engines for the season summary.
+    """
+
+    name: str = "auto"
+
+    def __init__(self, algo: "Algo") -> None:
+        super().__init__(algo)
+        # the engines chosen so far, kept across rounds for those holding anything between them
+        self.engines: dict[str, EngineAbstract] = {}
+        self.selected: EngineAbstract | None = None
+
+    def engine(self, name: str) -> EngineAbstract:
+        """the named engine, composed the first time it is chosen"""
+        if name not in self.engines:
+            creator = EngineCreator()
+            creator.assign_engine(engine=name, algo=self.algo)
+            self.engines[name] = creator.engine
+        return self.engines[name]
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """selects the engine for the current adjacency_graph and runs it"""
+        adjacency_graph = self.algo.adjacency_graph
+        nteams = len(adjacency_graph)
+        edges = sum(len(defeated) for defeated in adjacency_graph.values())
+        # already up to date when called from the round-by-round search
+        self.algo.sccfilter.update(adjacency_graph)
+        strongly_connected = self.algo.sccfilter.strongly_connected
+        estimate = self.algo.round_estimates.get(self.algo.cur_round)
+        if estimate is None:
+            estimate = self.algo.estimator.estimate(adjacency_graph)
+        decision = {
+            "Teams": nteams,
+            "Edges": edges,
+            "Density": edges / (nteams * (nteams - 1)) if nteams > 1 else 0.0,
+            "Strongly_Connected": strongly_connected,
+            "Estimated_Permutations": estimate["Permutations"],
+        }
+        name = select_engine(
+            objective=self.algo.objective,
+            nteams=nteams,
+            strongly_connected=decision["Strongly_Connected"],
+            estimated_permutations=decision["Estimated_Permutations"],
+            density=decision["Density"],
+        )
+        decision["Engine"] = name
+        self.algo.round_engines[self.algo.cur_round] = decision
+        logger.info(f"Round {self.algo.cur_round} engine selected - {decision}")
+
+        self.selected = None if name is None else self.engine(name)
+        if self.selected is not None:
+            self.selected.find_hamiltonian_cycle(hc_length_target=hc_length_target)
+
+    def checkpoint_state(self) -> dict | None:
+        """the state of the engine selected for this round, if it can resume part way through a search"""
+        return None if self.selected is None else self.selected.checkpoint_state()
+
+    def close(self) -> None:
+        """closes every engine chosen"""
+        for engine in self.engines.values():
+            engine.close()
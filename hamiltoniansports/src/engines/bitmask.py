@@ -0,0 +1,71 @@
+from src.engines.abstract import EngineAbstract
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class BitmaskDFSEngine(EngineAbstract):
+    """depth-first search over the same tree as DFSEngine, but with team ids remapped to 0..n-1 so that
+    the visited set and each team's defeated set are integer bitmasks.
+
+    Membership checks become a single bitwise-and rather than a scan of the path list, and no lists are
+    built at the leaves. Neighbours are visited in the same order as the adjacency_graph sets iterate,
+    so the cycles found, their order and the permutation count are identical to DFSEngine.
+
+    With the Algo's transposition table enabled, subtrees from (visited, team) states already proven to
+    be dead ends are skipped, so the permutation count drops while the cycles found stay identical.
+    """
+
+    name: str = "bitmask"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """remaps the adjacency_graph onto bit positions and runs the recursive bitmask dfs"""
+        adjacency_graph = self.algo.adjacency_graph
+        # bit position i represents team_ids[i], the first team in the graph is the start team
+        team_ids, team_index, defeated = self.team_bitmasks()
+        nteams: int = len(team_ids)
+        # neighbours kept as lists in set-iteration order, so the search order matches DFSEngine
+        neighbours: list[list[int]] = [
+            [team_index[t] for t in adjacency_graph[team]] for team in team_ids
+        ]
+        start_bit: int = 1
+        search_progress = self.search_progress
+        record_hc = self.algo.record_hc
+        transposition = self.algo.transposition
+        algo = self.algo
+        counter: int = self.algo.permutation_counter
+        next_progress: int = counter
+        path: list[int] = [0]
+
+        def dfs(cur: int, visited: int, depth: int) -> None:
+            """recursive dfs algo, visited is the bitmask of teams on the current path"""
+            nonlocal counter, next_progress
+            if counter >= next_progress:
+                next_progress = search_progress(counter, depth)
+            if depth == nteams:
+                # full length path, check the first team was defeated by the last team
+                if defeated[cur] & start_bit:
+                    record_hc([team_ids[i] for i in path])
+                return
+            if transposition is not None:
+                if transposition.dead(visited, cur):
+                    return
+                found = algo.hc_counter
+
+            for nxt in neighbours[cur]:
+                bit = 1 << nxt
+                if not visited & bit:
+                    counter += 1
+                    path.append(nxt)
+                    dfs(nxt, visited | bit, depth + 1)
+                    path.pop()
+
+            if transposition is not None and algo.hc_counter == found:
+                # searched in full without a single cycle
+                transposition.add(visited, cur)
+
+        try:
+            dfs(cur=0, visited=start_bit, depth=1)
+        finally:
+            self.algo.permutation_counter = counter
@@ -0,0 +1,79 @@
+from src.engines.abstract import EngineAbstract
+from src.engines.pruned import forward_check
+from bisect import bisect_left
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class BranchAndBoundEngine(EngineAbstract):
+    """bitmask depth-first search with branch-and-bound on the cycle date. The latest game date along the
+    current path is tracked, and a branch is cut as soon as it reaches the date of the best cycle found so
+    far (the incumbent), as any cycle through it could only be later. Defeated teams are tried earliest game
+    first, so a good incumbent is found early, and forward_check() cuts branches that can't become a cycle.
+
+    HC_Date is exact, but only the cycles that improved on the incumbent are recorded (so Total_HC is not a
+    count of every cycle), and when several cycles share the earliest date the one kept may differ from dfs.
+    Branches cut by either the bound or forward checking are counted in Algo.pruned_counter.
+    """
+
+    name: str = "bnb"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """remaps the adjacency_graph onto bit positions and game dates onto ranks, then runs the recursive search"""
+        team_ids, _, defeated = self.team_bitmasks()
+        defeated_by = self.defeated_by_bitmasks(defeated)
+        nteams: int = len(team_ids)
+
+        # game dates compared as ranks among the distinct dates of this round's graph
+        dates, edge_rank = self.edge_ranks(team_ids, defeated)
+        # defeated teams ordered earliest game first
+        neighbours: list[list[int]] = [
+            sorted(
+                (l for l in range(nteams) if defeated[w] >> l & 1),
+                key=lambda l, w=w: edge_rank[w][l],
+            )
+            for w in range(nteams)
+        ]
+        # cycles from earlier rounds (if any) bound this round too
+        incumbent: int = bisect_left(dates, self.algo.date_of_first_hc)
+        full: int = (1 << nteams) - 1
+        search_progress = self.search_progress
+        record_hc = self.algo.record_hc
+        counter: int = self.algo.permutation_counter
+        next_progress: int = counter
+        pruned: int = self.algo.pruned_counter
+        path: list[int] = [0]
+
+        def dfs(cur: int, visited: int, latest: int) -> None:
+            """recursive dfs algo, latest is the rank of the latest game date along the path"""
+            nonlocal counter, pruned, incumbent, next_progress
+            if counter >= next_progress:
+                next_progress = search_progress(counter, len(path))
+            if visited == full:
+                # full length path, check the first team was defeated by the last team, and that it's earlier
+                if defeated[cur] & 1 and max(latest, edge_rank[cur][0]) < incumbent:
+                    incumbent = max(latest, edge_rank[cur][0])
+                    record_hc([team_ids[i] for i in path])
+                return
+
+            for nxt in neighbours[cur]:
+                bit = 1 << nxt
+                if visited & bit:
+                    continue
+                if edge_rank[cur][nxt] >= incumbent or not forward_check(
+                    nxt, visited | bit, full, defeated, defeated_by
+                ):
+                    pruned += 1
+                    continue
+                counter += 1
+                path.append(nxt)
+                dfs(nxt, visited | bit, max(latest, edge_rank[cur][nxt]))
+                path.pop()
+
+        try:
+            dfs(cur=0, visited=1, latest=-1)
+        finally:
+            self.algo.permutation_counter = counter
+            self.algo.pruned_counter = pruned
@@ -0,0 +1,105 @@
+from src.engines.abstract import EngineAbstract
+from src.engines.dp import held_karp_cycle, dfs_first_cycle
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class BottleneckEngine(EngineAbstract):
+    """finds the earliest hamiltonian cycle (the smallest 'latest game' date) without enumerating every
+    cycle. Adding games can only create cycles, never remove them, so whether a cycle exists using only
+    games up to a date is monotone in that date. A binary search over the distinct game dates, with a
+    Held-Karp existence check at each step, finds the earliest date in a logarithmic number of checks.
+
+    The witness recorded is the cycle dfs finds first among the games up to that date (see
+    dfs_first_cycle()), which is the first_hc dfs keeps, so HC and HC_Date are identical to the enumerating
+    engines. Only that cycle is recorded (Total_HC is at most 1 per round), and Permutations counts the
+    Held-Karp states of every check.
+
+    The earliest cycle is also found for the counting engines, whose tables only give an arbitrary one
+    (see earliest_cycle()). Those without the memory for Held-Karp override exists() and first_cycle().
+    """
+
+    name: str = "bottleneck"
+
+    def exists(self, defeated: list[int]) -> bool:
+        """whether there is a hamiltonian cycle along the defeated bitmasks, by Held-Karp"""
+        cycle, states = held_karp_cycle(defeated)
+        self.algo.permutation_counter += states
+        self.search_progress(self.algo.permutation_counter, None)
+        return cycle is not None
+
+    def first_cycle(
+        self, defeated: list[int], neighbours: list[list[int]]
+    ) -> list[int] | None:
+        """the cycle (as bit positions from 0) dfs finds first along the defeated bitmasks, taking the
+        neighbours of each team in order, walked from the Held-Karp table of the reversed graph
+        """
+        cycle, states = dfs_first_cycle(defeated, neighbours)
+        self.algo.permutation_counter += states
+        self.search_progress(self.algo.permutation_counter, None)
+        return cycle
+
+    def earliest_cycle(self, known: bool = False) -> list[int] | None:
+        """the cycle dfs keeps as the first_hc of the current adjacency_graph (as team ids), or None. When a
+        cycle is already known to exist, the check using every game is skipped"""
+        adjacency_graph = self.algo.adjacency_graph
+        team_ids, team_index, defeated = self.team_bitmasks()
+        nteams: int = len(team_ids)
+        # neighbours in set-iteration order, the order dfs finds cycles in
+        neighbours: list[list[int]] = [
+            [team_index[t] for t in adjacency_graph[team]] for team in team_ids
+        ]
+        dates, edge_rank = self.edge_ranks(team_ids, defeated)
+        if not dates:
+            return None
+
+        def defeated_before(rank: int) -> list[int]:
+            """defeated bitmasks using only the games up to the date of the rank"""
+            return [
+                sum(1 << l for l in range(nteams) if 0 <= edge_rank[w][l] <= rank)
+                for w in range(nteams)
+            ]
+
+        # every team needs a win and a loss in the cycle, so it can't be before both have happened
+        first_win = [
+            min((r for r in ranks if r >= 0), default=None) for ranks in edge_rank
+        ]
+        first_loss = [
+            min(
+                (edge_rank[w][l] for w in range(nteams) if edge_rank[w][l] >= 0),
+                default=None,
+            )
+            for l in range(nteams)
+        ]
+        if None in first_win or None in first_loss:
+            return None
+
+        lo: int = max(first_win + first_loss)
+        hi: int = len(dates) - 1
+        if not known and not self.exists(defeated_before(hi)):
+            return None
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found = self.exists(defeated_before(mid))
+            logger.debug(f"Cycle before {dates[mid]}: {found}")
+            if found:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        cycle = self.first_cycle(
+            defeated_before(lo),
+            [
+                [t for t in ts if edge_rank[w][t] <= lo]
+                for w, ts in enumerate(neighbours)
+            ],
+        )
+        return [team_ids[i] for i in cycle]
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """binary search for the earliest date a cycle exists, and record the witness cycle"""
+        cycle = self.earliest_cycle()
+        if cycle is not None:
+            self.algo.record_hc(cycle)
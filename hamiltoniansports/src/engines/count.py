@@ -0,0 +1,110 @@
+from src.engines.bottleneck import BottleneckEngine
+from src.engines.dp import subset_layers, defeated_by_others
+import numpy as np
+import math
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+def count_dtype(nothers: int) -> type:
+    """int64 while the number of paths through nothers teams, at most nothers!, fits in it, otherwise
+    python ints through an object array, which is far slower but exact"""
+    return np.int64 if math.factorial(nothers) < 2**63 else object
+
+
+def path_count_table(defeated: list[int]) -> np.ndarray:
+    """bitmask dynamic program counting paths from bit position 0, over (visited subset, end team).
+
+    defeated[i] is the bitmask of teams defeated by team i. The returned table is indexed by a subset of the
+    other teams (team i is bit i-1) and an end team (again i-1), holding the number of paths from team 0
+    that visit exactly that subset and finish on that team.
+
+    The counts are int64 unless they could overflow, see count_dtype.
+    """
+    nothers = len(defeated) - 1
+    dtype = count_dtype(nothers)
+    # adjacency among the other teams, adjacency[i, j] when other team i defeated other team j
+    adjacency = np.array(
+        [
+            [defeated[i + 1] >> (j + 1) & 1 for j in range(nothers)]
+            for i in range(nothers)
+        ],
+        dtype=np.int64,
+    ).astype(dtype)
+    counts = np.zeros((1 << nothers, nothers), dtype=dtype)
+    for j in range(nothers):
+        if defeated[0] >> (j + 1) & 1:
+            counts[1 << j, j] = 1
+
+    # extend every path by one team, layer by layer, so each subset is complete before it is extended
+    for layer in subset_layers(nothers)[1:-1]:
+        extended = counts[layer].dot(adjacency)
+        for j in range(nothers):
+            bit = 1 << j
+            new = (layer & bit) == 0
+            counts[layer[new] | bit, j] = extended[new, j]
+
+    return counts
+
+
+def count_cycles(defeated: list[int]) -> tuple[int, list[int] | None, int]:
+    """exact number of hamiltonian cycles, with one of them rebuilt from the table as a witness
+
+    returns the count, the witness cycle as bit positions starting from 0 (or None), and the number of
+    non-zero (subset, end team) states in the table
+    """
+    nteams = len(defeated)
+    if nteams < 2:
+        return 0, None, 0
+    nothers = nteams - 1
+    counts = path_count_table(defeated)
+    into = defeated_by_others(defeated)
+    states = int(np.count_nonzero(counts))
+
+    full = (1 << nothers) - 1
+    closing = [j for j in range(nothers) if into[0] >> j & 1 and counts[full, j]]
+    total = sum(int(counts[full, j]) for j in closing)
+    if not total:
+        return 0, None, states
+
+    # walk back through the table, each step finding a team in the previous subset with paths to this one
+    cur = closing[0]
+    mask = full
+    backwards = [cur]
+    while mask != 1 << cur:
+        mask ^= 1 << cur
+        cur = next(
+            i for i in range(nothers) if into[cur + 1] >> i & 1 and counts[mask, i]
+        )
+        backwards.append(cur)
+
+    return total, [0] + [j + 1 for j in reversed(backwards)], states
+
+
+class PathCountEngine(BottleneckEngine):
+    """counts every hamiltonian cycle exactly with a bitmask dynamic program over (visited subset, end team)
+    path counts, vectorised with numpy, in O(2^n * n^2) time and O(2^n * n) memory however many cycles
+    there are, without ever building the individual cycles.
+
+    Total_HC is the exact count, but only a single witness cycle is recorded. The table only gives an
+    arbitrary one, so the witness is the first_hc dfs would keep, found as the bottleneck engine does (see
+    BottleneckEngine.earliest_cycle()), and HC and HC_Date are identical to the enumerating engines.
+    Permutations counts the non-zero (subset, end team) states of the table, and those of the Held-Karp
+    checks finding the witness.
+    """
+
+    name: str = "dpcount"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """runs the counting dynamic program over the current adjacency_graph"""
+        _, _, defeated = self.team_bitmasks()
+
+        total, _, states = count_cycles(defeated)
+        self.algo.permutation_counter += states
+        # the table is built in one go, so the budget can only be checked once it is
+        self.search_progress(self.algo.permutation_counter, None)
+        logger.debug(f"{total} hamiltonian cycles counted")
+        if total:
+            self.record_count(total, self.earliest_cycle(known=True))
@@ -0,0 +1,117 @@
+from src.engines.abstract import EngineAbstract
+from src.engines.pruned import forward_check
+from src.filters.matching import hopcroft_karp, augment_from
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class CycleCoverDFSEngine(EngineAbstract):
+    """bitmask depth-first search with forward checking (see forward_check()) and a cycle cover check. The
+    rest of a path ending at cur has to leave cur and each unvisited team for distinct teams among the
+    unvisited teams and the start team, so there must be a perfect matching of {cur} + unvisited (as winners)
+    into unvisited + {start} (as losers), and branches without one are cut.
+
+    The matching is found for the whole graph by Hopcroft-Karp at the root, then carried down the search:
+    stepping from cur to nxt removes cur from the winners and nxt from the losers, so the child's matching is
+    the parent's with those two pairs removed, repaired by at most one augmenting path.
+
+    Only branches without any cycle are cut and neighbours are taken in set-iteration order, so the cycles
+    found (and their order) are identical to DFSEngine, with the branches cut counted in Algo.pruned_counter.
+    """
+
+    name: str = "cover"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """remaps the adjacency_graph onto bit positions and runs the recursive dfs"""
+        adjacency_graph = self.algo.adjacency_graph
+        team_ids, team_index, defeated = self.team_bitmasks()
+        defeated_by = self.defeated_by_bitmasks(defeated)
+        nteams: int = len(team_ids)
+        # neighbours kept as lists in set-iteration order, so the search order matches DFSEngine
+        neighbours: list[list[int]] = [
+            [team_index[t] for t in adjacency_graph[team]] for team in team_ids
+        ]
+        full: int = (1 << nteams) - 1
+        search_progress = self.search_progress
+        record_hc = self.algo.record_hc
+        transposition = self.algo.transposition
+        algo = self.algo
+        counter: int = self.algo.permutation_counter
+        next_progress: int = counter
+        pruned: int = self.algo.pruned_counter
+        path: list[int] = [0]
+
+        def covered(
+            cur: int,
+            nxt: int,
+            visited: int,
+            match_left: list[int],
+            match_right: list[int],
+        ) -> tuple[list[int], list[int]] | None:
+            """the matching after stepping from cur to nxt, or None if there's no longer a perfect one"""
+            match_left = match_left.copy()
+            match_right = match_right.copy()
+            loser = match_left[cur]
+            winner = match_right[nxt]
+            match_left[cur] = match_right[loser] = -1
+            if loser == nxt:
+                return match_left, match_right
+            # winner (the team matched to nxt) has to be rematched among the losers still unmatched
+            match_left[winner] = match_right[nxt] = -1
+            right = (full & ~visited) | 1
+            if not augment_from(defeated, winner, right, match_left, match_right):
+                return None
+            return match_left, match_right
+
+        def dfs(
+            cur: int, visited: int, match_left: list[int], match_right: list[int]
+        ) -> None:
+            """recursive dfs algo, visited is the bitmask of teams on the current path, and the matching of
+            the teams yet to be left to the teams yet to be entered"""
+            nonlocal counter, pruned, next_progress
+            if counter >= next_progress:
+                next_progress = search_progress(counter, len(path))
+            if visited == full:
+                # full length path, check the first team was defeated by the last team
+                if defeated[cur] & 1:
+                    record_hc([team_ids[i] for i in path])
+                return
+            if transposition is not None:
+                if transposition.dead(visited, cur):
+                    return
+                found = algo.hc_counter
+
+            for nxt in neighbours[cur]:
+                bit = 1 << nxt
+                if not visited & bit:
+                    if not forward_check(
+                        nxt, visited | bit, full, defeated, defeated_by
+                    ):
+                        pruned += 1
+                        continue
+                    matching = covered(cur, nxt, visited | bit, match_left, match_right)
+                    if matching is None:
+                        pruned += 1
+                        continue
+                    counter += 1
+                    path.append(nxt)
+                    dfs(nxt, visited | bit, *matching)
+                    path.pop()
+
+            if transposition is not None and algo.hc_counter == found:
+                # searched in full without a single cycle
+                transposition.add(visited, cur)
+
+        try:
+            match_left, match_right = hopcroft_karp(defeated, full, full)
+            if -1 not in match_left and forward_check(
+                0, 1, full, defeated, defeated_by
+            ):
+                dfs(0, 1, match_left, match_right)
+            else:
+                pruned += 1
+        finally:
+            self.algo.permutation_counter = counter
+            self.algo.pruned_counter = pruned
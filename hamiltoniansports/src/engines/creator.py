@@ -0,0 +1,120 @@
+from src.engines.abstract import EngineAbstract
+from typing import TYPE_CHECKING
+
+import logging
+
+if TYPE_CHECKING:
+    from src.algo import Algo
+
+logger = logging.getLogger("main")
+
+
+class EngineCreator:
+    """Creator class for the hamiltonian cycle search engine requested. Ensures the Algo class is able
+    to build the adjacency graph round-by-round and record results regardless of how the search itself
+    is undertaken.
+
+    Uses composition for interacting with the correct engine
+    """
+
+    def __init__(self):
+        # purposeful
+        pass
+
+    @property
+    def engine(self) -> EngineAbstract:
+        """Allowing a hacky 'not yet set' pattern here"""
+        if not hasattr(self, "_engine"):
+            raise AttributeError("Engine has not been assigned to this creator")
+        return self._engine
+
+    def assign_engine(self, engine: str, algo: "Algo") -> None:
+        """composition class _engine used to assign the correct search engine to the engine variable.
+        Engine classes are only imported when required
+        """
+        match engine:
+            case "dfs":
+                from src.engines.dfs import DFSEngine
+
+                self._engine = DFSEngine(algo=algo)
+
+            case "bitmask":
+                from src.engines.bitmask import BitmaskDFSEngine
+
+                self._engine = BitmaskDFSEngine(algo=algo)
+
+            case "dp":
+                from src.engines.dp import HeldKarpEngine
+
+                self._engine = HeldKarpEngine(algo=algo)
+
+            case "incremental":
+                from src.engines.incremental import IncrementalEngine
+
+                self._engine = IncrementalEngine(algo=algo)
+
+            case "iterative":
+                from src.engines.iterative import IterativeDFSEngine
+
+                self._engine = IterativeDFSEngine(algo=algo)
+
+            case "pruned":
+                from src.engines.pruned import PrunedDFSEngine
+
+                self._engine = PrunedDFSEngine(algo=algo)
+
+            case "cover":
+                from src.engines.cover import CycleCoverDFSEngine
+
+                self._engine = CycleCoverDFSEngine(algo=algo)
+
+            case "bottleneck":
+                from src.engines.bottleneck import BottleneckEngine
+
+                self._engine = BottleneckEngine(algo=algo)
+
+            case "bnb":
+                from src.engines.bnb import BranchAndBoundEngine
+
+                self._engine = BranchAndBoundEngine(algo=algo)
+
+            case "mrv":
+                from src.engines.mrv import MRVEngine
+
+                self._engine = MRVEngine(algo=algo)
+
+            case "dpcount":
+                from src.engines.count import PathCountEngine
+
+                self._engine = PathCountEngine(algo=algo)
+
+            case "iecount":
+                from src.engines.inclusion import InclusionExclusionEngine
+
+                self._engine = InclusionExclusionEngine(algo=algo)
+
+            case "parallel":
+                from src.engines.parallel import ParallelDFSEngine
+
+                self._engine = ParallelDFSEngine(algo=algo)
+
+            case "distributed":
+                from src.engines.distributed import DistributedEngine
+
+                self._engine = DistributedEngine(algo=algo)
+
+            case "mitm":
+                from src.engines.mitm import MeetInTheMiddleEngine
+
+                self._engine = MeetInTheMiddleEngine(algo=algo)
+
+            case "auto":
+                from src.engines.auto import AutoEngine
+
+                self._engine = AutoEngine(algo=algo)
+
+            case _:
+                # should never occur when command line arguments are validated properly
+                raise ValueError(f'Unable to compose search engine "{engine}"')
+
+        logger.debug(f"Search engine {self._engine.name} assigned")
@@ -0,0 +1,57 @@
+from src.engines.abstract import EngineAbstract
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class DFSEngine(EngineAbstract):
+    """the original recursive depth-first search, walking the adjacency_graph directly using the team ids"""
+
+    name: str = "dfs"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """housing method to setup and then cur recursive algo"""
+        adjacency_graph = self.algo.adjacency_graph
+        next_progress: int = self.algo.permutation_counter
+
+        def dfs(cur_team: int, path: list[int]) -> bool | None:
+            """recursive dfs algo"""
+            nonlocal next_progress
+            if self.algo.permutation_counter >= next_progress:
+                next_progress = self.search_progress(
+                    self.algo.permutation_counter, len(path)
+                )
+            # check if we have a full length path
+            if len(path) == len(adjacency_graph) == hc_length_target:
+                # check if we have a hamiltonian cycle, but looking if the first team in the current
+                # path was defeated by the last team in the current path
+                if path[0] in [t for t in adjacency_graph[cur_team]]:
+                    # record the hc, the algo keeps all of them and tracks the 'first occuring' one
+                    self.algo.record_hc(path)
+                # return None to allow exit and backtracking to occur
+                return
+
+            # the main DFS callstack recursion loop
+            # using the 'current team', check if each defeated team is currently in the
+            # graph traversal 'path', recursively calling until the end of the path is
+            # reached or a hamiltonian cycle is found
+            if cur_team in adjacency_graph:  # check adjacency graph first as a safety
+                defeated_teams = adjacency_graph[cur_team]
+                for next_team in defeated_teams:
+                    if next_team not in path:
+                        self.algo.permutation_counter += 1
+                        path.append(next_team)
+                        if dfs(next_team, path):
+                            return True
+                        # if DFS determines the path is at the end (either as a hamiltonian cycle
+                        # or a dead-end), remove the last item and continue down the call stack
+                        path.pop()
+
+            # hit the end of recursion calls here
+            return False
+
+        # initial prep work, select the first team in the adjacency_graph
+        # and make the first call of recursive algo method
+        cur_team = next(iter(adjacency_graph))
+        dfs(cur_team=cur_team, path=[cur_team])
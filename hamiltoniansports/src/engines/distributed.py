@@ -0,0 +1,64 @@
+from src.engines.parallel import ParallelDFSEngine, Graph, Result, split_prefixes
+from src.distributed.coordinator import Coordinator
+from utils.config import Config
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class DistributedEngine(ParallelDFSEngine):
+    """the parallel engine's forward checking search, spread across machines. This process acts as the
+    coordinator, listening on Config.coordinator_host/port, and handing the path prefixes split from the
+    search tree to the workers connected over tcp (started with worker.py on any machine), which search
+    them with the same code as the parallel engine and send back their results and permutation counts.
+
+    Workers send heartbeats, and the prefixes held by a worker that disconnects or goes quiet are handed
+    to another worker. Results are merged exactly as the parallel engine does, so the cycles found (and
+    their order) are identical to pruned and dfs. The search waits for at least one worker to connect.
+    """
+
+    name: str = "distributed"
+    # smaller prefixes than the parallel engine, more tasks to spread across more workers
+    split_depth: int = 5
+    host: str = Config.coordinator_host
+    port: int = Config.coordinator_port
+    heartbeat_timeout: float = Config.heartbeat_timeout_seconds
+    coordinator: Coordinator | None = None
+
+    def start(self) -> tuple[str, int]:
+        """starts the coordinator listening for workers (if not already), returning its address"""
+        if self.coordinator is None:
+            self.coordinator = Coordinator(
+                host=self.host, port=self.port, heartbeat_timeout=self.heartbeat_timeout
+            )
+        return self.coordinator.address
+
+    def search_split(self, graph: Graph) -> list[Result]:
+        """hands the split prefixes out to the workers, collecting their results until every one is done"""
+        neighbours, defeated, defeated_by, _ = graph
+        prefixes, counter, pruned = split_prefixes(
+            neighbours, defeated, defeated_by, self.split_depth
+        )
+        results: list[Result] = [([], 0, None, counter, pruned)]
+        if not prefixes:
+            return results
+
+        self.start()
+        objective = self.algo.objective
+        node_limit, deadline = self.budget_left(counter)
+        results += self.coordinator.run(
+            graph,
+            [(prefix, None) for prefix in prefixes],
+            keep_cycles=objective != "count",
+            exists=objective == "exists",
+            node_limit=node_limit,
+            deadline=deadline,
+        )
+        return results
+
+    def close(self) -> None:
+        """tells the workers to shut down and stops listening"""
+        if self.coordinator is not None:
+            self.coordinator.close()
+            self.coordinator = None
@@ -0,0 +1,152 @@
+from src.engines.abstract import EngineAbstract
+import numpy as np
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+def subset_layers(nbits: int) -> list[np.ndarray]:
+    """every subset of nbits items as an integer mask, grouped into layers by the subset size
+    (layers[k] holds all masks with k bits set)
+    """
+    masks = np.arange(1 << nbits, dtype=np.int64)
+    popcount = np.zeros(1 << nbits, dtype=np.int64)
+    for bit in range(nbits):
+        popcount += (masks >> bit) & 1
+    order = np.argsort(popcount, kind="stable")
+    boundaries = np.cumsum(np.bincount(popcount, minlength=nbits + 1))[:-1]
+    return np.split(masks[order], boundaries)
+
+
+def defeated_by_others(defeated: list[int]) -> list[int]:
+    """for every team t, the bitmask of the other teams (team i is bit i-1) that defeated team t"""
+    nteams = len(defeated)
+    return [
+        sum(1 << (i - 1) for i in range(1, nteams) if defeated[i] >> t & 1)
+        for t in range(nteams)
+    ]
+
+
+def held_karp_reach(defeated: list[int]) -> np.ndarray:
+    """Held-Karp dynamic program over (visited subset, end team), starting from bit position 0.
+
+    defeated[i] is the bitmask of teams defeated by team i. The returned array is indexed by a subset of
+    the other teams (team i is bit i-1), and each entry is itself a bitmask of the teams (again bit i-1)
+    that a path from team 0 visiting exactly that subset can end on. This doubles as the predecessor
+    table, since a path ending on j through mask can only have come from mask without j.
+    """
+    nothers = len(defeated) - 1
+    if nothers > 63:
+        raise ValueError(
+            f"Held-Karp engine supports at most 64 teams, not {nothers + 1}"
+        )
+    dtype = np.uint32 if nothers <= 32 else np.uint64
+    # into[j] is the bitmask of other teams that defeated other team j
+    into = defeated_by_others(defeated)[1:]
+    reach = np.zeros(1 << nothers, dtype=dtype)
+    for j in range(nothers):
+        if defeated[0] >> (j + 1) & 1:
+            reach[1 << j] = 1 << j
+
+    # extend every path by one team, layer by layer, so each subset is complete before it is extended
+    for layer in subset_layers(nothers)[1:-1]:
+        ends = reach[layer]
+        live = ends != 0
+        layer, ends = layer[live], ends[live]
+        for j in range(nothers):
+            bit = 1 << j
+            extendable = ((layer & bit) == 0) & ((ends & dtype(into[j])) != 0)
+            reach[layer[extendable] | bit] |= dtype(bit)
+
+    return reach
+
+
+def held_karp_cycle(defeated: list[int]) -> tuple[list[int] | None, int]:
+    """decides whether a hamiltonian cycle exists and rebuilds one from the Held-Karp table
+
+    returns the cycle as bit positions starting from 0 (or None), and the number of reachable
+    (subset, end team) states in the table
+    """
+    nteams = len(defeated)
+    if nteams < 2:
+        return None, 0
+    nothers = nteams - 1
+    reach = held_karp_reach(defeated)
+    into = defeated_by_others(defeated)
+    states = int(sum(((reach >> bit) & 1).sum() for bit in range(nothers)))
+
+    full = (1 << nothers) - 1
+    # ends of full length paths that defeated the start team, closing the cycle
+    closing = int(reach[full]) & into[0]
+    if not closing:
+        return None, states
+
+    # walk back through the table, each step finding a team in the previous subset that defeated this one
+    cur = (closing & -closing).bit_length() - 1
+    mask = full
+    backwards = [cur]
+    while mask != 1 << cur:
+        mask ^= 1 << cur
+        candidates = int(reach[mask]) & into[cur + 1]
+        cur = (candidates & -candidates).bit_length() - 1
+        backwards.append(cur)
+
+    return [0] + [j + 1 for j in reversed(backwards)], states
+
+
+def dfs_first_cycle(
+    defeated: list[int], neighbours: list[list[int]]
+) -> tuple[list[int] | None, int]:
+    """the hamiltonian cycle a dfs from bit position 0 finds first, taking the neighbours of each team in
+    order, walked in O(n^2) steps rather than searched for. The Held-Karp table of the reversed graph holds,
+    for each subset of the other teams, the teams with a path through that subset back to team 0, so the
+    dfs only ever steps onto the first neighbour with such a path through the teams left.
+
+    returns the cycle as bit positions starting from 0 (or None), and the number of reachable states
+    in the table
+    """
+    nteams = len(defeated)
+    if nteams < 2:
+        return None, 0
+    nothers = nteams - 1
+    back = held_karp_reach(EngineAbstract.defeated_by_bitmasks(defeated))
+    states = int(sum(((back >> bit) & 1).sum() for bit in range(nothers)))
+
+    # the other teams not yet on the path
+    left = (1 << nothers) - 1
+    cycle = [0]
+    while left:
+        ends = int(back[left])
+        nxt = next(
+            (t for t in neighbours[cycle[-1]] if t and ends >> (t - 1) & 1), None
+        )
+        if nxt is None:
+            # only at the start team, once a step is taken the rest of the cycle is always there
+            return None, states
+        cycle.append(nxt)
+        left ^= 1 << (nxt - 1)
+    return cycle, states
+
+
+class HeldKarpEngine(EngineAbstract):
+    """Held-Karp bitmask dynamic program, deciding if a hamiltonian cycle exists in O(2^n * n^2) time
+    regardless of how dense the adjacency_graph is, rather than the O(n!) worst case of dfs.
+
+    Only a single cycle is rebuilt and recorded, so Total_HC is at most 1 per round and HC_Date is the date
+    of that cycle, which is not necessarily the earliest. Permutations counts the reachable (subset, end team)
+    states of the table.
+    """
+
+    name: str = "dp"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """runs the dynamic program over the current adjacency_graph and records the rebuilt cycle"""
+        team_ids, _, defeated = self.team_bitmasks()
+
+        cycle, states = held_karp_cycle(defeated)
+        self.algo.permutation_counter += states
+        # the table is built in one go, so the budget can only be checked once it is
+        self.search_progress(self.algo.permutation_counter, None)
+        if cycle is not None:
+            self.algo.record_hc([team_ids[i] for i in cycle])
@@ -0,0 +1,154 @@
+from src.engines.abstract import EngineAbstract
+from src.engines.bottleneck import BottleneckEngine
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import math
+import os
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+def is_prime(candidate: int) -> bool:
+    """trial division, only used on the handful of moduli below 2^31"""
+    if candidate < 2 or candidate % 2 == 0:
+        return candidate == 2
+    return all(candidate % d for d in range(3, math.isqrt(candidate) + 1, 2))
+
+
+def moduli(nteams: int) -> list[int]:
+    """primes just below 2^31 whose product exceeds (nteams-1)!, the most cycles there can be, so the count
+    can be rebuilt exactly from its residues. Residues below 2^31 summed over at most nteams teams stay well
+    within the 2^53 float64 mantissa, so the walks can be counted with float matrix products.
+    """
+    bound = math.factorial(max(nteams - 1, 1))
+    primes: list[int] = []
+    product = 1
+    candidate = (1 << 31) - 1
+    while product <= bound:
+        if is_prime(candidate):
+            primes.append(candidate)
+            product *= candidate
+        candidate -= 2
+    return primes
+
+
+def crt(residues: list[int], primes: list[int]) -> int:
+    """chinese remainder theorem, the unique integer below the product of primes with these residues"""
+    total, product = 0, 1
+    for residue, prime in zip(residues, primes):
+        # lift total so it also has the right residue modulo prime
+        step = (residue - total) * pow(product, -1, prime) % prime
+        total += step * product
+        product *= prime
+    return total
+
+
+def closed_walk_residues(
+    adjacency: np.ndarray, lo: int, hi: int, primes: list[int], batch: int = 4096
+) -> list[int]:
+    """inclusion-exclusion terms for the removed subsets lo..hi-1, summed modulo each prime.
+
+    Subset s removes the teams at bit positions 1.. set in s (team 0 is never removed), and contributes
+    (-1)^|s| times the number of closed walks from team 0 of length nteams through the remaining teams.
+    Walks are counted for a batch of subsets, and every prime, at once by pushing the walk counts one step
+    at a time and zeroing the removed teams, so only O(batch * nteams) memory is needed.
+    """
+    nteams = len(adjacency)
+    mods = np.array(primes, dtype=np.float64)[:, None, None]
+    bits = np.arange(1, nteams, dtype=np.int64)
+    totals = [0] * len(primes)
+    for start in range(lo, hi, batch):
+        subsets = np.arange(start, min(start + batch, hi), dtype=np.int64)
+        removed = (subsets[:, None] >> (bits - 1)) & 1
+        keep = np.ones((len(subsets), nteams), dtype=np.float64)
+        keep[:, 1:] -= removed
+        sign = np.where(removed.sum(axis=1) % 2, -1, 1)
+
+        walks = np.zeros((len(primes), len(subsets), nteams), dtype=np.float64)
+        walks[:, :, 0] = 1
+        for _ in range(nteams):
+            walks = walks.reshape(-1, nteams).dot(adjacency).reshape(walks.shape)
+            walks = np.fmod(walks, mods) * keep
+
+        closed = walks[:, :, 0].astype(np.int64)
+        for k, prime in enumerate(primes):
+            totals[k] = (totals[k] + int((closed[k] * sign).sum())) % prime
+    return totals
+
+
+class InclusionExclusionEngine(BottleneckEngine):
+    """counts every hamiltonian cycle exactly by inclusion-exclusion over the teams left out of closed
+    walks: the cycles through team 0 are the closed walks of length n from team 0 that miss no team, ie.
+    the sum over subsets s of the other teams of (-1)^|s| times the closed walks avoiding s.
+
+    This takes O(2^n * n^3) time but only polynomial memory, unlike the O(2^n * n) table of dpcount, so
+    larger competitions can be counted. Walks are counted modulo a few primes with batched numpy matrix
+    products and the count rebuilt with the chinese remainder theorem, and large subset ranges are split
+    across a process pool.
+
+    As with dpcount only a single witness cycle is recorded, the first_hc dfs would keep, found as the
+    bottleneck engine does but in polynomial memory: each existence check is a count, and the cycle is
+    found by dfs. Permutations counts the subsets summed over by every count, plus the expansions of the
+    dfs finding the witness.
+    """
+
+    name: str = "iecount"
+    # teams from which the subset range is split across a process pool, and how many processes
+    parallel_min_teams: int = 20
+    workers: int | None = None
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """runs the inclusion-exclusion count over the current adjacency_graph"""
+        _, _, defeated = self.team_bitmasks()
+        total = self.counted(defeated)
+        logger.debug(f"{total} hamiltonian cycles counted")
+        if total:
+            self.record_count(total, self.earliest_cycle(known=True))
+
+    def counted(self, defeated: list[int]) -> int:
+        """count(), with the subsets summed over added to the permutations"""
+        total = self.count(defeated)
+        self.algo.permutation_counter += 1 << (len(defeated) - 1)
+        # every subset is counted in one go, so the budget can only be checked once they are
+        self.search_progress(self.algo.permutation_counter, None)
+        return total
+
+    def exists(self, defeated: list[int]) -> bool:
+        """whether there is a hamiltonian cycle along the defeated bitmasks, by counting them"""
+        return self.counted(defeated) > 0
+
+    # the witness dfs, in polynomial memory (not the Held-Karp walk of the bottleneck engine)
+    first_cycle = EngineAbstract.first_cycle
+
+    def count(self, defeated: list[int]) -> int:
+        """number of hamiltonian cycles in the graph on bit positions"""
+        nteams = len(defeated)
+        adjacency = np.array(
+            [[d >> j & 1 for j in range(nteams)] for d in defeated], dtype=np.float64
+        )
+        primes = moduli(nteams)
+        nsubsets = 1 << (nteams - 1)
+
+        workers = self.workers or os.cpu_count() or 1
+        if nteams < self.parallel_min_teams or workers == 1:
+            residues = closed_walk_residues(adjacency, 0, nsubsets, primes)
+        else:
+            # a few chunks per process, so an uneven split doesn't leave processes idle
+            chunk = -(-nsubsets // (workers * 4))
+            bounds = [
+                (lo, min(lo + chunk, nsubsets)) for lo in range(0, nsubsets, chunk)
+            ]
+            residues = [0] * len(primes)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(closed_walk_residues, adjacency, lo, hi, primes)
+                    for lo, hi in bounds
+                ]
+                for future in futures:
+                    residues = [
+                        (r + part) % p
+                        for r, part, p in zip(residues, future.result(), primes)
+                    ]
+        return crt(residues, primes)
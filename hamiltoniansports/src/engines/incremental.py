@@ -0,0 +1,101 @@
+from src.engines.abstract import EngineAbstract, dfs_order
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class IncrementalEngine(EngineAbstract):
+    """bitmask depth-first search that only looks for cycles through the edges added in the latest round.
+
+    Rounds are searched in order and the search stops at the first round with a cycle, so the graph of the
+    previous round is already known to be cycle-free (either searched or skipped as impossible). Any cycle
+    in this round must therefore use at least one of this round's new winner->loser edges. Each new edge
+    anchors a search for paths back around to its winner, and edges anchored earlier are excluded from the
+    later searches so every cycle is found exactly once.
+
+    Cycles are rotated to begin with the same start team as the other engines, so the same cycles and dates
+    are found, but permutation counts only reflect the anchored searches. They are found in a different
+    order, so when several cycles share the earliest date the first_hc is settled as dfs would, keeping the
+    one dfs would have found first (with the exists objective the search stops at whichever comes first).
+    """
+
+    name: str = "incremental"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """runs an anchored bitmask dfs from each new edge of the latest round in turn"""
+        team_ids, team_index, defeated = self.team_bitmasks()
+        nteams: int = len(team_ids)
+        if not self.algo.round_new_edges:
+            # no round has been added to the graph yet
+            return
+
+        new_edges: list[tuple[int, int]] = [
+            (team_index[w], team_index[l]) for w, l in self.algo.round_new_edges[-1]
+        ]
+        # defeated, less the new edges already anchored, and the same as 'defeated by' bitmasks
+        allowed: list[int] = defeated.copy()
+        allowed_by: list[int] = self.defeated_by_bitmasks(defeated)
+        full: int = (1 << nteams) - 1
+        # neighbours in set-iteration order, the order dfs would find cycles in
+        adjacency_graph = self.algo.adjacency_graph
+        neighbours: list[list[int]] = [
+            [team_index[t] for t in adjacency_graph[team]] for team in team_ids
+        ]
+        search_progress = self.search_progress
+        record_hc = self.algo.record_hc
+        algo = self.algo
+        # the dfs order of the first_hc, once one has been found earlier than those of previous rounds
+        first_order: list[int] | None = None
+        counter: int = self.algo.permutation_counter
+        next_progress: int = counter
+        path: list[int] = []
+        anchor: int = 0
+
+        def dfs(cur: int, visited: int) -> None:
+            """recursive dfs algo, looking for a path from cur through every unvisited team back to the anchor"""
+            nonlocal counter, next_progress, first_order
+            if counter >= next_progress:
+                next_progress = search_progress(counter, len(path))
+            if visited == full:
+                if allowed[cur] >> anchor & 1:
+                    # rotate so the cycle begins with the start team, as the full search would have found it
+                    start = path.index(0)
+                    cycle = path[start:] + path[:start]
+                    hc = [team_ids[i] for i in cycle]
+                    date_of_first_hc = algo.date_of_first_hc
+                    record_hc(hc)
+                    if algo.date_of_first_hc < date_of_first_hc:
+                        first_order = dfs_order(cycle, neighbours)
+                    elif first_order is not None:
+                        order = dfs_order(cycle, neighbours)
+                        if order < first_order and algo.hc_date(hc) == date_of_first_hc:
+                            # as early as the first_hc, but dfs would have found it first
+                            algo.first_hc = hc
+                            first_order = order
+                return
+            # the path must finish on a team that defeated the anchor, stop once none of them are left
+            if not allowed_by[anchor] & (full ^ visited | 1 << cur):
+                return
+
+            remaining = allowed[cur] & ~visited
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                nxt = bit.bit_length() - 1
+                counter += 1
+                path.append(nxt)
+                dfs(nxt, visited | bit)
+                path.pop()
+
+        try:
+            for winner, loser in new_edges:
+                anchor = winner
+                counter += 1
+                path[:] = [winner, loser]
+                dfs(loser, (1 << winner) | (1 << loser))
+                # all cycles through this edge are now found, exclude it from the remaining anchored searches
+                allowed[winner] &= ~(1 << loser)
+                allowed_by[loser] &= ~(1 << winner)
+        finally:
+            self.algo.permutation_counter = counter
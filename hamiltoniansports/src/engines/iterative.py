@@ -0,0 +1,156 @@
+from src.engines.abstract import EngineAbstract
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class IterativeDFSEngine(EngineAbstract):
+    """non-recursive depth-first search over the same tree as DFSEngine, using an explicit stack of
+    [team, next neighbour position] frames instead of python call frames.
+
+    As the whole search state lives on the engine (stack, visited bitmask, graph snapshot), the search can
+    be paused after a number of permutations with resume(max_permutations), inspected through the state
+    property, and then resumed again. Neighbours are taken in set-iteration order, so results and
+    permutation counts are identical to DFSEngine.
+
+    The search pauses every checkpoint_permutations for the Algo to save a checkpoint (if due), which
+    holds the whole search state, so an interrupted search can be resumed from the checkpoint.
+    """
+
+    name: str = "iterative"
+    # permutations between each chance for the Algo to save a checkpoint
+    checkpoint_permutations: int = 100000
+
+    # snapshot of the graph taken by start(), using bit positions 0..n-1
+    team_ids: list[int]
+    neighbours: list[list[int]]
+    defeated: list[int]
+    # the search state, each frame is [team bit position, position of the next neighbour to try]
+    stack: list[list[int]]
+    visited: int
+
+    def __init__(self, algo) -> None:
+        super().__init__(algo=algo)
+        self.team_ids = []
+        self.neighbours = []
+        self.defeated = []
+        self.stack = []
+        self.visited = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """the search has finished (or has not been started), nothing is left on the stack"""
+        return not self.stack
+
+    @property
+    def path(self) -> list[int]:
+        """team ids on the current path, in order"""
+        return [self.team_ids[team] for team, _ in self.stack]
+
+    @property
+    def state(self) -> dict[str, list | int | bool]:
+        """snapshot of the current search state, for inspecting a paused search"""
+        return {
+            "Path": self.path,
+            "Depth": len(self.stack),
+            "Stack": [[self.team_ids[team], position] for team, position in self.stack],
+            "Permutations": self.algo.permutation_counter,
+            "Exhausted": self.exhausted,
+        }
+
+    def start(self) -> None:
+        """snapshot the current adjacency_graph and push the start team, ready for resume()"""
+        adjacency_graph = self.algo.adjacency_graph
+        self.team_ids, team_index, self.defeated = self.team_bitmasks()
+        # neighbours kept as lists in set-iteration order, so the search order matches DFSEngine
+        self.neighbours = [
+            [team_index[t] for t in adjacency_graph[team]] for team in self.team_ids
+        ]
+        self.stack = [[0, 0]]
+        self.visited = 1
+
+    def resume(self, max_permutations: int | None = None) -> bool:
+        """continue the search, pausing once max_permutations more permutations have been undertaken
+        (or running to completion if None). Returns True when the search is exhausted
+        """
+        stack = self.stack
+        visited = self.visited
+        neighbours = self.neighbours
+        defeated = self.defeated
+        nteams = len(self.team_ids)
+        search_progress = self.search_progress
+        counter = self.algo.permutation_counter
+        next_progress = counter
+        limit = None if max_permutations is None else counter + max_permutations
+
+        try:
+            while stack:
+                frame = stack[-1]
+                team_neighbours = neighbours[frame[0]]
+                position = frame[1]
+                # skip past neighbours already on the path
+                while position < len(team_neighbours) and (
+                    visited >> team_neighbours[position] & 1
+                ):
+                    position += 1
+                if position == len(team_neighbours):
+                    # dead-end or every neighbour tried, backtrack
+                    stack.pop()
+                    visited ^= 1 << frame[0]
+                    continue
+                if limit is not None and counter >= limit:
+                    frame[1] = position
+                    break
+
+                nxt = team_neighbours[position]
+                if counter >= next_progress:
+                    # before the stack is touched, so a search stopped here resumes from exactly this point
+                    next_progress = search_progress(counter, len(stack))
+                frame[1] = position + 1
+                counter += 1
+                if len(stack) + 1 == nteams:
+                    # full length path, check the first team was defeated by the last team
+                    if defeated[nxt] & 1:
+                        self.algo.record_hc(
+                            [self.team_ids[team] for team, _ in stack]
+                            + [self.team_ids[nxt]]
+                        )
+                    continue
+                visited |= 1 << nxt
+                stack.append([nxt, 0])
+        finally:
+            self.visited = visited
+            self.algo.permutation_counter = counter
+        return not stack
+
+    def run(self) -> None:
+        """runs the search to completion, pausing for the Algo to save any checkpoint due along the way"""
+        while not self.resume(max_permutations=self.checkpoint_permutations):
+            self.algo.search_checkpoint()
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """runs the whole search"""
+        self.start()
+        self.run()
+
+    def checkpoint_state(self) -> dict | None:
+        """the graph snapshot and the stack, everything needed to resume the search exactly"""
+        if self.exhausted:
+            return None
+        return {
+            "Team_Ids": self.team_ids,
+            "Neighbours": self.neighbours,
+            "Defeated": self.defeated,
+            "Stack": self.stack,
+            "Visited": self.visited,
+        }
+
+    def resume_search(self, state: dict) -> None:
+        """restores the graph snapshot and the stack from checkpoint_state(), then runs the search on"""
+        self.team_ids = state["Team_Ids"]
+        self.neighbours = state["Neighbours"]
+        self.defeated = state["Defeated"]
+        self.stack = state["Stack"]
+        self.visited = state["Visited"]
+        self.run()
@@ -0,0 +1,131 @@
+from src.engines.abstract import EngineAbstract, SearchComplete
+from src.engines.pruned import forward_check
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+class MeetInTheMiddleEngine(EngineAbstract):
+    """bidirectional search meeting in the middle of the cycle. Every cycle 0 -> v1 -> ... -> v(n-1) -> 0 is
+    split at its middle team v(n/2) into a forward half, a path from the start team over the teams it
+    defeated, and a backward half, a path back from the start team over the teams that defeated it.
+
+    Forward halves are enumerated first and kept in a hash map keyed on (visited bitmask, end team), with
+    how many there are and the earliest of them. Each backward half then only has to look up the forward
+    halves covering exactly the teams it didn't, ending on the same team. Both halves are cut with
+    forward_check() (on the reversed graph for the backward halves), so each direction searches only
+    about n/2 teams deep.
+
+    Total_HC is the exact count, and HC_Date is exact, but only the earliest cycle is recorded (in all_hc
+    too), with ties possibly broken differently to dfs. The exists objective stops at the first join.
+    """
+
+    name: str = "mitm"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """remaps the adjacency_graph onto bit positions, then enumerates and joins the two halves"""
+        team_ids, _, defeated = self.team_bitmasks()
+        defeated_by = self.defeated_by_bitmasks(defeated)
+        nteams: int = len(team_ids)
+        if nteams < 2:
+            # no cycle without at least two teams
+            return
+        _, edge_rank = self.edge_ranks(team_ids, defeated)
+        full: int = (1 << nteams) - 1
+        # the middle team is packed below the visited bitmask in the keys of the halves
+        shift: int = nteams.bit_length()
+        # teams on the forward half (including the start and middle teams), the backward half has the rest
+        forward_length: int = nteams // 2 + 1
+        backward_length: int = nteams - forward_length + 2
+        exists: bool = self.algo.objective == "exists"
+        search_progress = self.search_progress
+        counter: int = self.algo.permutation_counter
+        next_progress: int = counter
+        pruned: int = self.algo.pruned_counter
+
+        # (visited, middle team) -> [number of forward halves, earliest date rank, earliest half]
+        halves: dict[int, list] = {}
+
+        def forward(path: list[int], visited: int, latest: int) -> None:
+            """every path from the start team of forward_length teams, over the teams defeated"""
+            nonlocal counter, pruned, next_progress
+            if counter >= next_progress:
+                next_progress = search_progress(counter, len(path))
+            cur = path[-1]
+            if len(path) == forward_length:
+                key = visited << shift | cur
+                half = halves.get(key)
+                if half is None:
+                    halves[key] = [1, latest, list(path)]
+                else:
+                    half[0] += 1
+                    if latest < half[1]:
+                        half[1], half[2] = latest, list(path)
+                return
+            remaining = defeated[cur] & ~visited
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                nxt = bit.bit_length() - 1
+                if not forward_check(nxt, visited | bit, full, defeated, defeated_by):
+                    pruned += 1
+                    continue
+                counter += 1
+                path.append(nxt)
+                forward(path, visited | bit, max(latest, edge_rank[cur][nxt]))
+                path.pop()
+
+        total: int = 0
+        best: tuple[int, list[int]] | None = None
+
+        def backward(path: list[int], visited: int, latest: int) -> None:
+            """every path back to the start team of backward_length teams, over the teams that defeated,
+            joined with the forward halves covering the other teams"""
+            nonlocal counter, pruned, total, best, next_progress
+            if counter >= next_progress:
+                next_progress = search_progress(counter, len(path))
+            cur = path[-1]
+            if len(path) == backward_length:
+                key = (full & ~visited | 1 | 1 << cur) << shift | cur
+                half = halves.get(key)
+                if half is not None:
+                    # only the one cycle recorded is counted when stopping at the first join
+                    total += 1 if exists else half[0]
+                    date = max(half[1], latest)
+                    if best is None or date < best[0]:
+                        # the forward half, then the backward half in cycle order
+                        best = (date, half[2] + path[-2:0:-1])
+                    if exists:
+                        raise SearchComplete("forward and backward halves joined")
+                return
+            remaining = defeated_by[cur] & ~visited
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                nxt = bit.bit_length() - 1
+                # a path back to the start team is a path from it in the reversed graph
+                if not forward_check(nxt, visited | bit, full, defeated_by, defeated):
+                    pruned += 1
+                    continue
+                counter += 1
+                path.append(nxt)
+                backward(path, visited | bit, max(latest, edge_rank[nxt][cur]))
+                path.pop()
+
+        try:
+            if forward_check(0, 1, full, defeated, defeated_by):
+                forward([0], 1, -1)
+                logger.debug(f"{len(halves)} forward halves to join")
+                if halves:
+                    backward([0], 1, -1)
+            else:
+                pruned += 1
+        except SearchComplete:
+            pass
+        finally:
+            self.algo.permutation_counter = counter
+            self.algo.pruned_counter = pruned
+            if best is not None:
+                # also when out of budget, keeping the count and earliest of the joins made so far
+                self.record_count(total, [team_ids[i] for i in best[1]])
@@ -0,0 +1,108 @@
+from src.engines.abstract import EngineAbstract
+from src.engines.pruned import forward_check
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+def most_constrained_team(defeated: list[int], defeated_by: list[int]) -> int:
+    """the team with the fewest wins or losses (smallest in- or out-degree), as every cycle must pass through
+    one of its few edges, starting from it gives the fewest branches at the root of the search
+    """
+    return min(
+        range(len(defeated)),
+        key=lambda team: min(defeated[team].bit_count(), defeated_by[team].bit_count()),
+    )
+
+
+class MRVEngine(EngineAbstract):
+    """bitmask depth-first search with forward checking and a most-constrained-first ordering.
+
+    The search starts from the team with the smallest in- or out-degree rather than the first team in the
+    adjacency_graph (searching the reversed graph when in-degree is the smaller), and at each step the defeated teams are tried in order of how many unvisited teams they
+    in turn defeated, fewest first (Warnsdorff's rule), so dead-ends are hit early and cycles are found sooner.
+
+    Cycles are rotated to begin with the same start team as the other engines, so the same cycles and dates
+    are found, but in a different order, so when several cycles share the earliest date the one kept may
+    differ from dfs.
+    """
+
+    name: str = "mrv"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """remaps the adjacency_graph onto bit positions, with the most constrained team at bit 0"""
+        team_ids, _, defeated = self.team_bitmasks()
+        defeated_by = self.defeated_by_bitmasks(defeated)
+        nteams: int = len(team_ids)
+
+        # swap the most constrained team into bit position 0, which forward_check() treats as the start
+        start = most_constrained_team(defeated, defeated_by)
+        # when it has fewer losses than wins, search the reversed (defeated by) graph so the root branching
+        # is over the fewer edges, the cycles found are then reversed back
+        reverse: bool = defeated_by[start].bit_count() < defeated[start].bit_count()
+        if reverse:
+            defeated, defeated_by = defeated_by, defeated
+        order = list(range(nteams))
+        order[0], order[start] = order[start], order[0]
+        position = {team: i for i, team in enumerate(order)}
+        search_team_ids = [team_ids[team] for team in order]
+        defeated = [
+            sum(1 << position[l] for l in range(nteams) if defeated[team] >> l & 1)
+            for team in order
+        ]
+        defeated_by = self.defeated_by_bitmasks(defeated)
+        first_team: int = position[0]
+
+        full: int = (1 << nteams) - 1
+        search_progress = self.search_progress
+        record_hc = self.algo.record_hc
+        counter: int = self.algo.permutation_counter
+        next_progress: int = counter
+        pruned: int = self.algo.pruned_counter
+        path: list[int] = [0]
+
+        def dfs(cur: int, visited: int) -> None:
+            """recursive dfs algo, visited is the bitmask of teams on the current path"""
+            nonlocal counter, pruned, next_progress
+            if counter >= next_progress:
+                next_progress = search_progress(counter, len(path))
+            if visited == full:
+                # full length path, check the first team was defeated by the last team
+                if defeated[cur] & 1:
+                    cycle = [path[0]] + path[:0:-1] if reverse else path
+                    # rotate so the cycle begins with the start team of the other engines
+                    rotate = cycle.index(first_team)
+                    record_hc(
+                        [search_team_ids[i] for i in cycle[rotate:] + cycle[:rotate]]
+                    )
+                return
+
+            unvisited = full & ~visited
+            candidates = []
+            remaining = defeated[cur] & unvisited
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                nxt = bit.bit_length() - 1
+                if not forward_check(nxt, visited | bit, full, defeated, defeated_by):
+                    pruned += 1
+                    continue
+                candidates.append(((defeated[nxt] & unvisited & ~bit).bit_count(), nxt))
+            # fewest onward exits first
+            candidates.sort()
+
+            for _, nxt in candidates:
+                counter += 1
+                path.append(nxt)
+                dfs(nxt, visited | 1 << nxt)
+                path.pop()
+
+        try:
+            if forward_check(0, 1, full, defeated, defeated_by):
+                dfs(cur=0, visited=1)
+            else:
+                pruned += 1
+        finally:
+            self.algo.permutation_counter = counter
+            self.algo.pruned_counter = pruned
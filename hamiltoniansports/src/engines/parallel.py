@@ -0,0 +1,382 @@
+from src.engines.abstract import EngineAbstract, dfs_order
+from src.engines.pruned import forward_check
+import multiprocessing
+import queue
+import time
+import os
+
+import logging
+
+logger = logging.getLogger("main")
+
+# the graph as sent to the workers: neighbours in search order, defeated, defeated_by, game date ranks
+Graph = tuple[list[list[int]], list[int], list[int], list[list[int]]]
+# a piece of work: the path prefix, and the teams still to try from its last team (None for all of them)
+Task = tuple[list[int], list[int] | None]
+# the cycles found (only when kept), how many, the earliest as (date rank, dfs order, cycle),
+# and the expansions and forward checking cuts made
+Result = tuple[list[list[int]], int, tuple[int, list[int], list[int]] | None, int, int]
+# expansions between each check of the budget, when searching without a scheduler
+poll_interval: int = 1000
+
+
+def split_prefixes(
+    neighbours: list[list[int]],
+    defeated: list[int],
+    defeated_by: list[int],
+    depth: int,
+) -> tuple[list[list[int]], int, int]:
+    """expands the search tree from bit position 0 to depth teams, in the same order as the serial dfs
+
+    returns the path prefixes left to search, along with the expansions and forward checking cuts made
+    """
+    full = (1 << len(defeated)) - 1
+    prefixes: list[list[int]] = []
+    counter = pruned = 0
+    if not forward_check(0, 1, full, defeated, defeated_by):
+        return prefixes, counter, pruned + 1
+
+    def expand(path: list[int], visited: int) -> None:
+        nonlocal counter, pruned
+        if len(path) == depth or visited == full:
+            prefixes.append(list(path))
+            return
+        for nxt in neighbours[path[-1]]:
+            bit = 1 << nxt
+            if visited & bit:
+                continue
+            if not forward_check(nxt, visited | bit, full, defeated, defeated_by):
+                pruned += 1
+                continue
+            counter += 1
+            path.append(nxt)
+            expand(path, visited | bit)
+            path.pop()
+
+    expand([0], 1)
+    return prefixes, counter, pruned
+
+
+class StealingScheduler:
+    """the shared state between the work-stealing workers and the parent:
+
+    tasks - queue of Task still to be searched, followed by a None per worker once the search is over
+    pending - tasks created but not yet finished, the search is over once it drops to zero
+    created - every task created, so the parent knows how many results to wait for
+    idle - workers waiting on the tasks queue, which busy workers give work to
+    cancel - set once an existence-only objective is met, every worker abandons its search
+    """
+
+    def __init__(self, context, interval: int) -> None:
+        self.tasks = context.Queue()
+        self.results = context.Queue()
+        self.pending = context.Value("q", 0)
+        self.created = context.Value("q", 0)
+        self.idle = context.Value("i", 0)
+        self.cancel = context.Event()
+        # expansions between each check for cancellation and idle workers
+        self.interval = interval
+
+    def submit(self, tasks: list[Task]) -> None:
+        """queues tasks, counting them as pending before any worker can finish them"""
+        with self.pending.get_lock():
+            self.pending.value += len(tasks)
+        with self.created.get_lock():
+            self.created.value += len(tasks)
+        for task in tasks:
+            self.tasks.put(task)
+
+    def hungry(self) -> bool:
+        """a worker is waiting for work and there is none queued for it"""
+        return self.idle.value > 0 and self.tasks.empty()
+
+    def done(self, received: int) -> bool:
+        """every task has finished, and the parent has received all of their results"""
+        return self.pending.value == 0 and received == self.created.value
+
+
+def search_subtree(
+    task: Task,
+    graph: Graph,
+    keep_cycles: bool,
+    exists: bool,
+    scheduler: StealingScheduler | None = None,
+    node_limit: float = float("inf"),
+    deadline: float = float("inf"),
+) -> Result:
+    """forward checking dfs of every completion of a task, with an explicit stack so that the untried
+    teams of the bottom (largest) frame can be given away to an idle worker through the scheduler.
+
+    The search stops part way through once it has made node_limit expansions or time.monotonic() has
+    passed deadline, for the caller to find the budget exhausted (see SearchBudget.check)
+    """
+    neighbours, defeated, defeated_by, edge_rank = graph
+    full = (1 << len(defeated)) - 1
+    cycles: list[list[int]] = []
+    count = counter = pruned = 0
+    earliest: tuple[int, list[int], list[int]] | None = None
+    prefix, candidates = task
+    path = list(prefix)
+    visited = [sum(1 << team for team in path)]
+    latest = [max((edge_rank[a][b] for a, b in zip(path, path[1:])), default=-1)]
+
+    def found(cycle: list[int], date: int) -> None:
+        nonlocal count, earliest
+        count += 1
+        if earliest is None or date <= earliest[0]:
+            order = dfs_order(cycle, neighbours)
+            if earliest is None or (date, order) < earliest[:2]:
+                earliest = (date, order, cycle)
+        if keep_cycles:
+            cycles.append(cycle)
+
+    if visited[0] == full:
+        # the prefix is already full length, check the first team was defeated by the last team
+        if defeated[path[-1]] & 1:
+            found(path, max(latest[0], edge_rank[path[-1]][0]))
+        return cycles, count, earliest, counter, pruned
+
+    # frames of [teams to try, position of the next one]
+    stack: list[list] = [
+        [neighbours[path[-1]] if candidates is None else candidates, 0]
+    ]
+    interval = scheduler.interval if scheduler else poll_interval
+    next_poll = min(interval, node_limit)
+    while stack and not (exists and count):
+        if counter >= next_poll:
+            if counter >= node_limit or time.monotonic() >= deadline:
+                break
+            next_poll = min(next_poll + interval, node_limit)
+            if scheduler is None:
+                continue
+            if scheduler.cancel.is_set():
+                break
+            if scheduler.hungry():
+                # give away the untried teams of the bottom frame still having any, the largest subtrees
+                for depth, frame in enumerate(stack):
+                    if frame[1] < len(frame[0]):
+                        task = (path[: len(prefix) + depth], frame[0][frame[1] :])
+                        frame[1] = len(frame[0])
+                        scheduler.submit([task])
+                        break
+
+        frame = stack[-1]
+        if frame[1] == len(frame[0]):
+            stack.pop()
+            if stack:
+                path.pop()
+                visited.pop()
+                latest.pop()
+            continue
+        nxt = frame[0][frame[1]]
+        frame[1] += 1
+        cur = path[-1]
+        bit = 1 << nxt
+        if visited[-1] & bit:
+            continue
+        if not forward_check(nxt, visited[-1] | bit, full, defeated, defeated_by):
+            pruned += 1
+            continue
+        counter += 1
+        if visited[-1] | bit == full:
+            # full length path, check the first team was defeated by the last team
+            if defeated[nxt] & 1:
+                date = max(latest[-1], edge_rank[cur][nxt], edge_rank[nxt][0])
+                found(path + [nxt], date)
+            continue
+        path.append(nxt)
+        visited.append(visited[-1] | bit)
+        latest.append(max(latest[-1], edge_rank[cur][nxt]))
+        stack.append([neighbours[nxt], 0])
+
+    return cycles, count, earliest, counter, pruned
+
+
+def stealing_worker(
+    scheduler: StealingScheduler,
+    graph: Graph,
+    keep_cycles: bool,
+    exists: bool,
+    node_limit: float,
+    deadline: float,
+) -> None:
+    """worker process, searching tasks until it is sent None, each within the nodes left in the budget
+    when the search started"""
+    while True:
+        with scheduler.idle.get_lock():
+            scheduler.idle.value += 1
+        task = scheduler.tasks.get()
+        with scheduler.idle.get_lock():
+            scheduler.idle.value -= 1
+        if task is None:
+            return
+        if scheduler.cancel.is_set():
+            result: Result = ([], 0, None, 0, 0)
+        else:
+            result = search_subtree(
+                task, graph, keep_cycles, exists, scheduler, node_limit, deadline
+            )
+            if exists and result[1]:
+                # stop every other worker as soon as a cycle exists
+                scheduler.cancel.set()
+        scheduler.results.put(result)
+        with scheduler.pending.get_lock():
+            scheduler.pending.value -= 1
+
+
+class ParallelDFSEngine(EngineAbstract):
+    """forward checking depth-first search across worker processes with a work-stealing scheduler. The
+    search tree is expanded to split_depth teams in the parent to seed the workers, after which a busy
+    worker gives the untried teams at the bottom of its stack to any idle worker, so that a single branch
+    holding most of the search is still shared out. The workers send back their cycles, the earliest of
+    them and their permutation counts.
+
+    Cycles are recorded in dfs order once the search is over, so the cycles found (and their order) are
+    identical to pruned and dfs. For the count objective workers only send back how many cycles they found
+    and the earliest one, which is recorded as the witness (so HC_Date stays exact). The exists objective
+    cancels every worker as soon as one finds a cycle. Graphs below parallel_min_teams are searched in
+    process.
+    """
+
+    name: str = "parallel"
+    # depth of the path prefixes seeding the workers, teams from which the workers are used and how many
+    split_depth: int = 4
+    parallel_min_teams: int = 14
+    workers: int | None = None
+    # expansions between each worker checking for cancellation and idle workers
+    steal_interval: int = 1000
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """remaps the adjacency_graph onto bit positions, then searches it serially or across the workers"""
+        adjacency_graph = self.algo.adjacency_graph
+        team_ids, team_index, defeated = self.team_bitmasks()
+        defeated_by = self.defeated_by_bitmasks(defeated)
+        nteams: int = len(team_ids)
+        # neighbours kept as lists in set-iteration order, so the search order matches DFSEngine
+        neighbours: list[list[int]] = [
+            [team_index[t] for t in adjacency_graph[team]] for team in team_ids
+        ]
+        # game dates compared as ranks, so workers can find the earliest cycle they search
+        _, edge_rank = self.edge_ranks(team_ids, defeated)
+        graph: Graph = (neighbours, defeated, defeated_by, edge_rank)
+
+        if nteams < self.parallel_min_teams:
+            results = self.search_serial(graph)
+        else:
+            results = self.search_split(graph)
+        self.record(team_ids, neighbours, results)
+        # the searches stop short when out of budget, which is only raised once their counts are recorded
+        self.algo.budget.check(self.algo.permutation_counter)
+
+    def budget_left(self, searched: int) -> tuple[float, float]:
+        """the expansions left in the Algo's search budget once those searched are added, and its deadline"""
+        budget = self.algo.budget
+        return (
+            budget.node_limit - self.algo.permutation_counter - searched,
+            budget.deadline,
+        )
+
+    def search_serial(self, graph: Graph) -> list[Result]:
+        """searches the whole tree in process"""
+        _, defeated, defeated_by, _ = graph
+        objective = self.algo.objective
+        if not forward_check(0, 1, (1 << len(defeated)) - 1, defeated, defeated_by):
+            return [([], 0, None, 0, 1)]
+        task: Task = ([0], None)
+        node_limit, deadline = self.budget_left(0)
+        return [
+            search_subtree(
+                task,
+                graph,
+                objective != "count",
+                objective == "exists",
+                node_limit=node_limit,
+                deadline=deadline,
+            )
+        ]
+
+    def search_split(self, graph: Graph) -> list[Result]:
+        """seeds the workers with the split prefixes, collecting their results until every task is done"""
+        workers = self.workers or os.cpu_count() or 1
+        if workers == 1:
+            return self.search_serial(graph)
+        neighbours, defeated, defeated_by, _ = graph
+        prefixes, counter, pruned = split_prefixes(
+            neighbours, defeated, defeated_by, self.split_depth
+        )
+        results: list[Result] = [([], 0, None, counter, pruned)]
+        if not prefixes:
+            return results
+
+        objective = self.algo.objective
+        node_limit, deadline = self.budget_left(counter)
+        context = multiprocessing.get_context()
+        scheduler = StealingScheduler(context, self.steal_interval)
+        scheduler.submit([(prefix, None) for prefix in prefixes])
+        processes = [
+            context.Process(
+                target=stealing_worker,
+                args=(
+                    scheduler,
+                    graph,
+                    objective != "count",
+                    objective == "exists",
+                    node_limit,
+                    deadline,
+                ),
+                daemon=True,
+            )
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            while not scheduler.done(len(results) - 1):
+                searched = sum(r[3] for r in results)
+                node_limit, deadline = self.budget_left(searched)
+                if not scheduler.cancel.is_set() and (
+                    node_limit <= 0 or time.monotonic() >= deadline
+                ):
+                    # out of budget between the workers, which send back what they have searched so far
+                    scheduler.cancel.set()
+                try:
+                    results.append(scheduler.results.get(timeout=0.05))
+                except queue.Empty:
+                    # workers only exit once sent None, any gone before then took their task with them
+                    exitcodes = [p.exitcode for p in processes if not p.is_alive()]
+                    if exitcodes:
+                        raise RuntimeError(
+                            f"parallel search worker died part way through the search (exit codes {exitcodes})"
+                        )
+                    continue
+                self.algo.progress.sample(
+                    self.algo.permutation_counter + searched + results[-1][3]
+                )
+        finally:
+            scheduler.cancel.set()
+            for _ in processes:
+                scheduler.tasks.put(None)
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        return results
+
+    def record(
+        self, team_ids: list[int], neighbours: list[list[int]], results: list[Result]
+    ) -> None:
+        """adds the counts from the searched tasks to the Algo, then records their cycles in dfs order"""
+        for _, _, _, counter, pruned in results:
+            self.algo.permutation_counter += counter
+            self.algo.pruned_counter += pruned
+
+        if self.algo.objective == "count":
+            earliest = min((r[2] for r in results if r[2] is not None), default=None)
+            if earliest is not None:
+                self.record_count(
+                    sum(r[1] for r in results), [team_ids[i] for i in earliest[2]]
+                )
+        else:
+            cycles = [cycle for r in results for cycle in r[0]]
+            for cycle in sorted(cycles, key=lambda c: dfs_order(c, neighbours)):
+                self.algo.record_hc([team_ids[i] for i in cycle])
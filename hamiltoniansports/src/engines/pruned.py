@@ -0,0 +1,125 @@
+from src.engines.abstract import EngineAbstract
+
+import logging
+
+logger = logging.getLogger("main")
+
+
+def forward_check(
+    cur: int, visited: int, full: int, defeated: list[int], defeated_by: list[int]
+) -> bool:
+    """cheap bitset checks that a path (starting at bit position 0, ending at cur, covering visited) can
+    still be completed into a hamiltonian cycle. Returns False when the branch can be cut:
+
+    - the unvisited teams are no longer all reachable from cur, through unvisited teams
+    - the start team can no longer be reached, ie. no reachable unvisited team defeated it
+    - an unvisited team can no longer be entered (from cur or another unvisited team) or left (toward
+      another unvisited team or the start team)
+    """
+    unvisited = full & ~visited
+    if not unvisited:
+        return True
+
+    # flood fill from cur through the unvisited teams
+    reached = defeated[cur] & unvisited
+    frontier = reached
+    while frontier:
+        bit = frontier & -frontier
+        frontier ^= bit
+        new = defeated[bit.bit_length() - 1] & unvisited & ~reached
+        reached |= new
+        frontier |= new
+    if reached != unvisited:
+        return False
+    if not defeated_by[0] & reached:
+        return False
+
+    enter_from = unvisited | 1 << cur
+    leave_to = unvisited | 1
+    remaining = unvisited
+    while remaining:
+        bit = remaining & -remaining
+        remaining ^= bit
+        team = bit.bit_length() - 1
+        if not defeated_by[team] & enter_from & ~bit:
+            return False
+        if not defeated[team] & leave_to & ~bit:
+            return False
+
+    return True
+
+
+class PrunedDFSEngine(EngineAbstract):
+    """bitmask depth-first search with forward checking. Before each expansion the new path is checked with
+    forward_check(), and branches that can no longer become a hamiltonian cycle are cut.
+
+    Only branches without any cycle are cut and neighbours are taken in set-iteration order, so the cycles
+    found (and their order) are identical to DFSEngine. Permutations only counts the expansions actually
+    undertaken, with the branches cut counted separately in Algo.pruned_counter.
+
+    With the Algo's transposition table enabled, subtrees from (visited, team) states already proven to
+    be dead ends are skipped as well.
+    """
+
+    name: str = "pruned"
+
+    def find_hamiltonian_cycle(self, hc_length_target: int) -> None:
+        """remaps the adjacency_graph onto bit positions and runs the recursive pruned dfs"""
+        adjacency_graph = self.algo.adjacency_graph
+        team_ids, team_index, defeated = self.team_bitmasks()
+        defeated_by = self.defeated_by_bitmasks(defeated)
+        nteams: int = len(team_ids)
+        # neighbours kept as lists in set-iteration order, so the search order matches DFSEngine
+        neighbours: list[list[int]] = [
+            [team_index[t] for t in adjacency_graph[team]] for team in team_ids
+        ]
+        full: int = (1 << nteams) - 1
+        search_progress = self.search_progress
+        record_hc = self.algo.record_hc
+        transposition = self.algo.transposition
+        algo = self.algo
+        counter: int = self.algo.permutation_counter
+        next_progress: int = counter
+        pruned: int = self.algo.pruned_counter
+        path: list[int] = [0]
+
+        def dfs(cur: int, visited: int) -> None:
+            """recursive dfs algo, visited is the bitmask of teams on the current path"""
+            nonlocal counter, pruned, next_progress
+            if counter >= next_progress:
+                next_progress = search_progress(counter, len(path))
+            if visited == full:
+                # full length path, check the first team was defeated by the last team
+                if defeated[cur] & 1:
+                    record_hc([team_ids[i] for i in path])
+                return
+            if transposition is not None:
+                if transposition.dead(visited, cur):
+                    return
+                found = algo.hc_counter
+
+            for nxt in neighbours[cur]:
+                bit = 1 << nxt
+                if not visited & bit:
+                    if not forward_check(
+                        nxt, visited | bit, full, defeated, defeated_by
+                    ):
+                        pruned += 1
+                        continue
+                    counter += 1
+                    path.append(nxt)
+                    dfs(nxt, visited | bit)
+                    path.pop()
+
+            if transposition is not None and algo.hc_counter == found:
+                # searched in full without a single cycle
+                transposition.add(visited, cur)
+
+        try:
+            if forward_check(0, 1, full, defeated, defeated_by):
+                dfs(cur=0, visited=1)
+            else:
+                pruned += 1
+        finally:
+            self.algo.permutation_counter = counter
+            self.algo.pruned_counter = pruned
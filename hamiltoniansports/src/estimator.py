@@ -0,0 +1,71 @@
+from utils.config import Config
+import random
+
+
+def knuth_estimate(defeated: list[int], probes: int, rng: random.Random) -> float:
+    """Knuth's estimate of the size of the depth-first search tree from bit position 0, every expansion
+    being a permutation. Each probe walks a single random path from the root to a dead end, and a node
+    with d children along it stands in for d copies of itself, so the running product of the branching
+    factors down the path is an unbiased estimate of the nodes at each depth. Every probe is averaged, as
+    stopping on the running estimate would stop most often when it is low, biasing it towards trees that
+    look small after a few dead ends.
+
+    defeated is, for each bit position, the bitmask of teams defeated by that team
+    """
+    total: float = 0.0
+    for _ in range(probes):
+        visited = 1
+        cur_team = 0
+        weight = 1.0
+        nodes = 0.0
+        while True:
+            options = defeated[cur_team] & ~visited
+            if not options:
+                break
+            children = options.bit_count()
+            weight *= children
+            nodes += weight
+            # the lowest set bit, stepped past a random number of times
+            for _ in range(rng.randrange(children)):
+                options &= options - 1
+            cur = options & -options
+            cur_team = cur.bit_length() - 1
+            visited |= cur
+        total += nodes
+    return total / probes if probes else 0.0
+
+
+class SearchEstimator:
+    """estimates the permutations a round's search will take before it is run, with knuth_estimate() over
+    the current adjacency_graph, and the runtime from the permutations per second of the searches so far
+    (Config.estimate_permutations_per_s until a search large enough to time has been run).
+
+    The estimate is of the plain depth-first search tree (dfs, bitmask, iterative), engines that prune
+    will search fewer permutations. Probes are drawn from a seeded generator, so estimates are repeatable.
+    """
+
+    # permutations a search needs before its rate is trusted over the last
+    MIN_TIMED_PERMUTATIONS: int = 10000
+
+    def __init__(self, probes: int = Config.estimate_probes, seed: int = 0):
+        self.probes: int = probes
+        self.rng: random.Random = random.Random(seed)
+        self.permutations_per_s: float = Config.estimate_permutations_per_s
+
+    def estimate(self, adjacency_graph: dict[int, set[int]]) -> dict[str, float]:
+        """estimated permutations and seconds for a search of the adjacency_graph"""
+        team_ids = list(adjacency_graph)
+        team_index = {team: i for i, team in enumerate(team_ids)}
+        defeated = [
+            sum(1 << team_index[t] for t in adjacency_graph[team]) for team in team_ids
+        ]
+        permutations = knuth_estimate(defeated, self.probes, self.rng)
+        return {
+            "Permutations": permutations,
+            "Seconds": permutations / self.permutations_per_s,
+        }
+
+    def observe(self, permutations: int, seconds: float) -> None:
+        """the permutations and time a search actually took, updating the rate estimates are made at"""
+        if permutations >= self.MIN_TIMED_PERMUTATIONS and seconds > 0:
+            self.permutations_per_s = permutations / seconds
@@ -0,0 +1,251 @@
+import logging
+
+logger = logging.getLogger("main")
+
+
+def graph_bitmasks(graph: dict[int, set[int]]) -> tuple[list[int], list[int]]:
+    """the team ids by bit position (in graph order, so the first team is bit 0), and for each bit position
+    the bitmask of teams defeated by that team"""
+    team_ids = list(graph)
+    team_index = {team: i for i, team in enumerate(team_ids)}
+    defeated = [sum(1 << team_index[t] for t in graph[team]) for team in team_ids]
+    return team_ids, defeated
+
+
+def reaches_all(out: list[int]) -> bool:
+    """can bit position 0 reach every other bit position along the out bitmasks"""
+    full = (1 << len(out)) - 1
+    seen = frontier = 1
+    while frontier:
+        step = 0
+        while frontier:
+            low = frontier & -frontier
+            step |= out[low.bit_length() - 1]
+            frontier ^= low
+        frontier = step & ~seen
+        seen |= frontier
+    return seen == full
+
+
+def degree_condition(defeated: list[int]) -> str | None:
+    """which of the theorems guarantees the graph a hamiltonian cycle, checked in O(V^2), or None if none
+    does. All need the graph to be strongly connected, then:
+
+    camion - every pair of teams has played (the graph is semicomplete), see camion_cycle()
+    ghouila-houri - every team has at least V wins plus losses (against distinct teams each way)
+    meyniel - every pair of teams yet to play each other has at least 2V - 1 between them
+
+    Meyniel's theorem is the more general (Ghouila-Houri's is the case with every degree at least V, and
+    Camion's the case with no pairs yet to play), but only Camion's comes with a construction that can't
+    stall.
+    """
+    nteams = len(defeated)
+    if nteams < 2:
+        return None
+    defeated_by = [
+        sum(1 << w for w in range(nteams) if defeated[w] >> t & 1)
+        for t in range(nteams)
+    ]
+    if not (reaches_all(defeated) and reaches_all(defeated_by)):
+        return None
+    full = (1 << nteams) - 1
+    if all(defeated[t] | defeated_by[t] | 1 << t == full for t in range(nteams)):
+        return "camion"
+    degree = [
+        defeated[t].bit_count() + defeated_by[t].bit_count() for t in range(nteams)
+    ]
+    if min(degree) >= nteams:
+        return "ghouila-houri"
+    for u in range(nteams):
+        played = defeated[u] | defeated_by[u] | 1 << u
+        for v in range(u + 1, nteams):
+            if not played >> v & 1 and degree[u] + degree[v] < 2 * nteams - 1:
+                return None
+    return "meyniel"
+
+
+def insert_vertices(cycle: list[int], outside: list[int], defeated: list[int]) -> None:
+    """inserts every team it can from outside into the cycle, between a team that defeated it and a team
+    it defeated, in place (outside is left with the teams that couldn't be)"""
+    inserted = True
+    while inserted and outside:
+        inserted = False
+        for x in list(outside):
+            for i, cur in enumerate(cycle):
+                nxt = cycle[(i + 1) % len(cycle)]
+                if defeated[cur] >> x & 1 and defeated[x] >> nxt & 1:
+                    cycle.insert(i + 1, x)
+                    outside.remove(x)
+                    inserted = True
+                    break
+
+
+def ears(cycle: list[int], defeated: list[int]) -> list[list[int]]:
+    """for each team on the cycle, the shortest path leaving it through teams off the cycle and returning to
+    the cycle, as [cycle team, outside teams..., cycle team]"""
+    on_cycle = sum(1 << t for t in cycle)
+    found = []
+    for start in cycle:
+        # breadth first through the teams off the cycle, stopping at the first that returns to it
+        parent = {}
+        frontier = []
+        for t in range(len(defeated)):
+            if defeated[start] >> t & 1 and not on_cycle >> t & 1:
+                parent[t] = start
+                frontier.append(t)
+        while frontier:
+            returning = next(
+                (t for t in frontier if defeated[t] & on_cycle & ~(1 << start)), None
+            )
+            if returning is not None:
+                end = (defeated[returning] & on_cycle & ~(1 << start)).bit_length() - 1
+                path = [end, returning]
+                while path[-1] != start:
+                    path.append(parent[path[-1]])
+                found.append(path[::-1])
+                break
+            step = []
+            for t in frontier:
+                for u in range(len(defeated)):
+                    if (
+                        defeated[t] >> u & 1
+                        and not on_cycle >> u & 1
+                        and u not in parent
+                    ):
+                        parent[u] = t
+                        step.append(u)
+            frontier = step
+    return found
+
+
+def shortest_cycle(defeated: list[int]) -> list[int]:
+    """a shortest cycle through bit position 0, breadth first until a team that defeated 0 is reached, or
+    an empty list if there isn't one"""
+    parent = {0: None}
+    frontier = [0]
+    while frontier:
+        step = []
+        for t in frontier:
+            if t != 0 and defeated[t] & 1:
+                cycle = [t]
+                while parent[cycle[-1]] is not None:
+                    cycle.append(parent[cycle[-1]])
+                return cycle[::-1]
+            for u in range(len(defeated)):
+                if defeated[t] >> u & 1 and u not in parent:
+                    parent[u] = t
+                    step.append(u)
+        frontier = step
+    return []
+
+
+def rotate_to_start(cycle: list[int], defeated: list[int]) -> list[int]:
+    """the cycle starting from bit position 0, checked to be a hamiltonian cycle of the graph"""
+    nteams = len(defeated)
+    start = cycle.index(0)
+    cycle = cycle[start:] + cycle[:start]
+    if len(cycle) != nteams or not all(
+        defeated[cycle[i]] >> cycle[(i + 1) % nteams] & 1 for i in range(nteams)
+    ):
+        raise RuntimeError(f"constructed cycle {cycle} is not a hamiltonian cycle")
+    return cycle
+
+
+def camion_cycle(defeated: list[int]) -> list[int] | None:
+    """builds a hamiltonian cycle (of bit positions, starting from 0) of a semicomplete graph in O(V^2),
+    or None if it isn't strongly connected (Camion's theorem, every strongly connected semicomplete graph
+    has one). Starting from a shortest cycle through bit position 0, while there are teams off the cycle:
+
+    - a team that both defeated and was defeated by teams on the cycle is inserted between them, going
+    round the cycle there are consecutive teams the first of which defeated it and the second it defeated
+    - otherwise each team off the cycle either defeated every team on it or lost to every team on it, and
+    as the graph is strongly connected one of those that lost has defeated one of those that won, the two
+    are inserted together after any team on the cycle
+    """
+    nteams = len(defeated)
+    defeated_by = [
+        sum(1 << w for w in range(nteams) if defeated[w] >> t & 1)
+        for t in range(nteams)
+    ]
+    cycle = shortest_cycle(defeated)
+    if not cycle:
+        return None
+    on_cycle = sum(1 << t for t in cycle)
+    outside = [t for t in range(nteams) if not on_cycle >> t & 1]
+    while outside:
+        x = next(
+            (
+                t
+                for t in outside
+                if defeated[t] & on_cycle and defeated_by[t] & on_cycle
+            ),
+            None,
+        )
+        if x is not None:
+            for i, cur in enumerate(cycle):
+                if (
+                    defeated[cur] >> x & 1
+                    and defeated[x] >> cycle[(i + 1) % len(cycle)] & 1
+                ):
+                    cycle.insert(i + 1, x)
+                    break
+            added = [x]
+        else:
+            # the teams off the cycle that defeated every team on it, one of which a team that lost to
+            # every team on it defeated
+            won = sum(1 << t for t in outside if defeated[t] & on_cycle)
+            lost = next(
+                (t for t in outside if not won >> t & 1 and defeated[t] & won), None
+            )
+            if lost is None:
+                # nothing returns to the cycle from the teams that lost to it
+                return None
+            beat = (defeated[lost] & won).bit_length() - 1
+            cycle[1:1] = [lost, beat]
+            added = [lost, beat]
+        for t in added:
+            on_cycle |= 1 << t
+            outside.remove(t)
+    return rotate_to_start(cycle, defeated)
+
+
+def construct_cycle(defeated: list[int]) -> list[int] | None:
+    """builds a hamiltonian cycle (of bit positions, starting from 0) in polynomial time, for graphs
+    degree_condition() has guaranteed one. Starting from a shortest cycle through bit position 0, the cycle
+    is grown by inserting single teams between two consecutive teams on it, or by rerouting through an ear
+    of outside teams and then reinserting the teams it bypassed, until it covers every team.
+
+    The theorems' proofs don't give a practical construction, so this may stall on a graph they cover, in
+    which case None is returned and the exhaustive search has to find the cycle instead
+    """
+    nteams = len(defeated)
+    cycle = shortest_cycle(defeated)
+    if not cycle:
+        return None
+
+    outside = [t for t in range(nteams) if t not in cycle]
+    while outside:
+        insert_vertices(cycle, outside, defeated)
+        if not outside:
+            break
+        # reroute through the ear that leaves the longest cycle, once the bypassed teams are reinserted
+        best: tuple[list[int], list[int]] | None = None
+        for ear in ears(cycle, defeated):
+            i, j = cycle.index(ear[0]), cycle.index(ear[-1])
+            # the cycle from ear[-1] back round to ear[0], then along the ear
+            rerouted = [
+                cycle[(j + k) % len(cycle)] for k in range((i - j) % len(cycle))
+            ]
+            rerouted += ear[:-1]
+            remaining = [t for t in range(nteams) if t not in rerouted]
+            insert_vertices(rerouted, remaining, defeated)
+            if best is None or len(rerouted) > len(best[0]):
+                best = rerouted, remaining
+        if best is None or len(best[0]) <= len(cycle):
+            logger.debug(
+                f"cycle construction stalled at {len(cycle)} of {nteams} teams"
+            )
+            return None
+        cycle, outside = best
+
+    return rotate_to_start(cycle, defeated)
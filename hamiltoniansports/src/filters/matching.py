@@ -0,0 +1,150 @@
+from src.filters.degree import graph_bitmasks
+from typing import Iterator
+import logging
+
+logger = logging.getLogger("main")
+
+
+def bit_positions(mask: int) -> Iterator[int]:
+    """the set bit positions of mask, lowest first"""
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        yield bit.bit_length() - 1
+
+
+def hopcroft_karp(
+    defeated: list[int], left: int, right: int
+) -> tuple[list[int], list[int]]:
+    """maximum matching of the bit positions in left (as winners) to those in right (as losers) along the
+    defeated bitmasks, by Hopcroft-Karp in O(E sqrt(V)). Each phase layers the left positions breadth first
+    by the length of their alternating paths from the unmatched ones, then augments depth first along
+    vertex-disjoint paths through those layers, until no augmenting path is left.
+
+    Returns match_left and match_right, the position each is matched to by position, -1 when unmatched
+    """
+    nteams = len(defeated)
+    match_left = [-1] * nteams
+    match_right = [-1] * nteams
+    lefts = list(bit_positions(left))
+
+    def augment(u: int, layer: dict[int, int | None]) -> bool:
+        for r in bit_positions(defeated[u] & right):
+            w = match_right[r]
+            if w == -1 or (layer.get(w) == layer[u] + 1 and augment(w, layer)):
+                match_left[u] = r
+                match_right[r] = u
+                return True
+        # a dead end for the rest of this phase
+        layer[u] = None
+        return False
+
+    while True:
+        queue = [u for u in lefts if match_left[u] == -1]
+        layer: dict[int, int | None] = {u: 0 for u in queue}
+        augmentable = False
+        for u in queue:
+            for r in bit_positions(defeated[u] & right):
+                w = match_right[r]
+                if w == -1:
+                    augmentable = True
+                elif w not in layer:
+                    layer[w] = layer[u] + 1
+                    queue.append(w)
+        if not augmentable:
+            return match_left, match_right
+        for u in lefts:
+            if match_left[u] == -1:
+                augment(u, layer)
+
+
+def augment_from(
+    defeated: list[int],
+    start: int,
+    right: int,
+    match_left: list[int],
+    match_right: list[int],
+) -> bool:
+    """extends a matching of the bit positions in right by the unmatched left position start, along the
+    shortest alternating path from it to an unmatched right position (breadth first, in O(E)), updating
+    match_left and match_right in place. Returns False if there is no such path (the matching is maximum)
+    """
+    # the left position each right position was reached from
+    parent: dict[int, int] = {}
+    reached = 0
+    frontier = [start]
+    while frontier:
+        step = []
+        for u in frontier:
+            for r in bit_positions(defeated[u] & right & ~reached):
+                reached |= 1 << r
+                parent[r] = u
+                w = match_right[r]
+                if w != -1:
+                    step.append(w)
+                    continue
+                # flip the matching back along the path
+                while True:
+                    u = parent[r]
+                    r, match_left[u] = match_left[u], r
+                    match_right[match_left[u]] = u
+                    if u == start:
+                        return True
+        frontier = step
+    return False
+
+
+def hall_violator(defeated: list[int], left: int, right: int) -> int:
+    """a set of the bit positions in left that defeated fewer of those in right between them than there
+    are in the set, as a bitmask, or 0 if left can be perfectly matched into right (Hall's theorem, left and
+    right having as many positions each). The set is the left positions reached by alternating paths from
+    one left unmatched by a maximum matching, as every right position they defeated is matched back into it
+    """
+    match_left, match_right = hopcroft_karp(defeated, left, right)
+    unmatched = [u for u in bit_positions(left) if match_left[u] == -1]
+    if not unmatched:
+        return 0
+    reached = frontier = 1 << unmatched[0]
+    neighbours = 0
+    while frontier:
+        step = 0
+        for u in bit_positions(frontier):
+            step |= defeated[u] & right
+        step &= ~neighbours
+        neighbours |= step
+        frontier = 0
+        for r in bit_positions(step):
+            frontier |= 1 << match_right[r]
+        frontier &= ~reached
+        reached |= frontier
+    return reached
+
+
+class CycleCoverFilter:
+    """necessary condition for a hamiltonian cycle: the games along the cycle pair every team as a winner
+    with a distinct team as a loser, so the victory graph has a cycle cover, ie. a perfect matching between
+    winner and loser copies of the teams. Stronger than every team having won and lost, and independent of
+    strong connectivity (a strongly connected graph can have three teams whose only wins are over the same
+    two teams, and a cycle cover of two disjoint cycles is not strongly connected).
+
+    When there is no perfect matching, the teams of a Hall violator (see hall_violator()) are kept as the
+    certificate, teams that defeated fewer teams between them than there are of them.
+    """
+
+    def __init__(self) -> None:
+        self.violator: list[int] = []
+        self.checks: int = 0
+
+    def check(self, graph: dict[int, set[int]]) -> bool:
+        """whether the graph has a cycle cover, keeping a Hall violator when it doesn't"""
+        team_ids, defeated = graph_bitmasks(graph)
+        full = (1 << len(team_ids)) - 1
+        violator = hall_violator(defeated, full, full)
+        self.violator = [team_ids[t] for t in bit_positions(violator)]
+        self.checks += 1
+        return not self.violator
+
+    def reason(self, graph: dict[int, set[int]]) -> str:
+        """human readable Hall violator, for logging skipped rounds"""
+        losers = sorted(set().union(*(graph[team] for team in self.violator)))
+        return f"no cycle cover, teams {self.violator} only defeated teams {losers} between them"
@@ -0,0 +1,103 @@
+from typing import Iterator
+import logging
+
+logger = logging.getLogger("main")
+
+
+def strongly_connected_components(graph: dict[int, set[int]]) -> list[list[int]]:
+    """Tarjan's algorithm, O(V+E), using an explicit stack rather than recursion.
+    Returns the strongly connected components as lists of team ids (in reverse topological order)
+    """
+    index: dict[int, int] = {}
+    lowlink: dict[int, int] = {}
+    on_stack: set[int] = set()
+    stack: list[int] = []
+    components: list[list[int]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        # each frame is the team and an iterator over the teams it defeated
+        work: list[tuple[int, Iterator[int]]] = [(root, iter(graph.get(root, ())))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            team, defeated = work[-1]
+            for loser in defeated:
+                if loser not in index:
+                    index[loser] = lowlink[loser] = len(index)
+                    stack.append(loser)
+                    on_stack.add(loser)
+                    work.append((loser, iter(graph.get(loser, ()))))
+                    break
+                elif loser in on_stack:
+                    lowlink[team] = min(lowlink[team], index[loser])
+            else:
+                # every team defeated by this team has been visited
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[team])
+                if lowlink[team] == index[team]:
+                    component: list[int] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == team:
+                            break
+                    components.append(component)
+
+    return components
+
+
+class SCCFilter:
+    """necessary condition for a hamiltonian cycle: every team must be able to reach every other team
+    through victories, ie. the victory graph is strongly connected.
+
+    Kept up to date as edges are added to the adjacency_graph. An edge between two teams already in the same
+    component cannot change the components, so Tarjan's algorithm is only re-run when an edge joins two
+    different components, and never again once the graph is strongly connected (edges are never removed).
+    """
+
+    def __init__(self) -> None:
+        self.components: list[list[int]] = []
+        self.component_of: dict[int, int] = {}
+        self.stale: bool = True
+        self.recomputations: int = 0
+
+    @property
+    def strongly_connected(self) -> bool:
+        """the whole graph is a single strongly connected component"""
+        return len(self.components) == 1
+
+    def add_edge(self, winner: int, loser: int) -> None:
+        """record a new winner->loser edge, only marking the components stale if it crosses components"""
+        winner_component = self.component_of.get(winner)
+        if winner_component is None or winner_component != self.component_of.get(loser):
+            self.stale = True
+
+    def update(self, graph: dict[int, set[int]]) -> None:
+        """re-run Tarjan's algorithm if any edge added since the last update crossed components"""
+        if not self.stale:
+            return
+        self.components = strongly_connected_components(graph)
+        self.component_of = {
+            team: i for i, component in enumerate(self.components) for team in component
+        }
+        self.stale = False
+        self.recomputations += 1
+        logger.debug(f"{len(self.components)} strongly connected components")
+
+    def reason(self, graph: dict[int, set[int]]) -> str:
+        """human readable reason the graph is not strongly connected, for logging skipped rounds"""
+        no_wins = [team for team in graph if not graph[team]]
+        if no_wins:
+            return f"teams {no_wins} yet to win"
+        losers = set().union(*graph.values())
+        no_losses = [team for team in graph if team not in losers]
+        if no_losses:
+            return f"teams {no_losses} yet to lose"
+        sizes = sorted((len(component) for component in self.components), reverse=True)
+        return f"victory graph not strongly connected, {len(sizes)} components of sizes {sizes}"
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+import logging
+
+logger = logging.getLogger("main")
+
+
+class TranspositionTable:
+    """memo of dead search states: a path from the start team covering the visited teams and ending on the
+    current team, that has been searched without completing into a single hamiltonian cycle. Every other
+    path reaching the same (visited bitmask, current team) state has the same completions, so its subtree
+    can be skipped.
+
+    Bounded by max_entries and/or max_bytes (estimated at ENTRY_BYTES an entry), evicting the least recently
+    used states first. The graph gains edges every round, so a dead state may come alive in a later round,
+    hence clear() before each search. Hits and misses are kept across rounds for the run summary.
+    """
+
+    # rough size of an OrderedDict entry keyed on a (visited, team) tuple, measured with tracemalloc
+    ENTRY_BYTES: int = 160
+
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None):
+        limits = [
+            limit
+            for limit in (max_entries, max_bytes and max_bytes // self.ENTRY_BYTES)
+            if limit is not None
+        ]
+        if not limits or min(limits) < 1:
+            raise ValueError(
+                f"transposition table needs a positive max_entries or max_bytes, not {max_entries}/{max_bytes}"
+            )
+        self.capacity: int = min(limits)
+        self.states: OrderedDict[tuple[int, int], None] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def dead(self, visited: int, cur: int) -> bool:
+        """has this state already been proven to be a dead end, counting the lookup as a hit or miss"""
+        key = (visited, cur)
+        if key in self.states:
+            self.states.move_to_end(key)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def add(self, visited: int, cur: int) -> None:
+        """record a state proven to be a dead end, evicting the least recently used if full"""
+        self.states[visited, cur] = None
+        if len(self.states) > self.capacity:
+            self.states.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """forget every state, for a new search over a graph with more edges"""
+        self.states.clear()
+
+    @property
+    def hit_rate(self) -> float | None:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
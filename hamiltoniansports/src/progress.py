@@ -0,0 +1,75 @@
+from typing import Callable
+from utils.config import Config
+import time
+import logging
+
+logger = logging.getLogger("main")
+
+
+class ProgressReporter:
+    """reports the progress of each round's search: permutations, permutations per second, the depth the
+    search has reached and the time elapsed. The depth-first engines only count permutations as they
+    search, calling sample() every sample_interval permutations, so the clock is read well away from the
+    hot path and a report is made whenever report_seconds have passed since the last.
+
+    Every report is logged and, if a callback was given, passed to it as a dict with the keys Round,
+    Permutations, Depth, Elapsed_s and Permutations_per_s (Depth is None for engines without one).
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[dict], None] | None = None,
+        sample_interval: int = Config.progress_sample_interval,
+        report_seconds: float = Config.progress_report_seconds,
+    ):
+        self.callback: Callable[[dict], None] | None = callback
+        self.sample_interval: int = sample_interval
+        self.report_seconds: float = report_seconds
+        self.cur_round: int | None = None
+        self.start_time: float = time.monotonic()
+        self.start_permutations: int = 0
+        # when, and at how many permutations, the last report was made (permutations per second is since then)
+        self.last_time: float = self.start_time
+        self.last_permutations: int = 0
+
+    def start(self, cur_round: int | None, permutation_counter: int) -> None:
+        """a new search, reports are measured from here"""
+        self.cur_round = cur_round
+        self.start_time = self.last_time = time.monotonic()
+        self.start_permutations = self.last_permutations = permutation_counter
+
+    def sample(self, permutation_counter: int, depth: int | None = None) -> None:
+        """called periodically during the search, reporting if report_seconds have passed"""
+        now = time.monotonic()
+        if now - self.last_time >= self.report_seconds:
+            self.report(permutation_counter, depth, now)
+
+    def finish(self, permutation_counter: int) -> None:
+        """the search is over, report its totals"""
+        now = time.monotonic()
+        self.last_time = self.start_time
+        self.last_permutations = self.start_permutations
+        self.report(permutation_counter, None, now)
+
+    def report(self, permutation_counter: int, depth: int | None, now: float) -> None:
+        elapsed = now - self.last_time
+        progress = {
+            "Round": self.cur_round,
+            "Permutations": permutation_counter,
+            "Depth": depth,
+            "Elapsed_s": now - self.start_time,
+            "Permutations_per_s": (permutation_counter - self.last_permutations)
+            / elapsed
+            if elapsed > 0
+            else 0.0,
+        }
+        self.last_time = now
+        self.last_permutations = permutation_counter
+        logger.info(
+            f"Round {progress['Round']} - {progress['Permutations']} permutations, "
+            f"{progress['Permutations_per_s']:.0f}/s, "
+            + (f"depth {progress['Depth']}, " if depth is not None else "")
+            + f"{progress['Elapsed_s']:.1f}s elapsed"
+        )
+        if self.callback is not None:
+            self.callback(progress)
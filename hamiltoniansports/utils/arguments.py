@@ -52,6 +52,72 @@ class Arguments:
             action="store_true",
             help="Clear cached files/resources for this league/season",
         )
+        self.parser.add_argument(
+            "-e",
+            "--engine",
+            type=str,
+            default=None,
+            choices=Config.valid_engines,
+            help="Search engine used for the hamiltonian cycle search, defaults to the cheapest engine for the objective",
+        )
+        self.parser.add_argument(
+            "-o",
+            "--objective",
+            type=str,
+            default="earliest",
+            choices=Config.valid_objectives,
+            help="What the search is looking for: whether a cycle exists, the earliest cycle, a count of cycles, or every cycle",
+        )
+        self.parser.add_argument(
+            "-m",
+            "--memo",
+            type=int,
+            default=0,
+            help="Megabytes of memo for dead search states, skipping subtrees already searched without a cycle (bitmask, pruned and cover engines, or auto when it chooses pruned, default off)",
+        )
+        self.parser.add_argument(
+            "-r",
+            "--resume",
+            action="store_true",
+            help="Resume the search from the checkpoint saved by an interrupted run of this league/season",
+        )
+        # budgets on the search, stopping with a partial result once one has run out
+        self.parser.add_argument(
+            "--round-seconds",
+            type=float,
+            default=None,
+            help="Wall-clock seconds the search of any one round can take (default unlimited)",
+        )
+        self.parser.add_argument(
+            "--round-nodes",
+            type=int,
+            default=None,
+            help="Permutations the search of any one round can take (default unlimited)",
+        )
+        self.parser.add_argument(
+            "--season-seconds",
+            type=float,
+            default=None,
+            help="Wall-clock seconds the search of the whole season can take (default unlimited)",
+        )
+        self.parser.add_argument(
+            "--season-nodes",
+            type=int,
+            default=None,
+            help="Permutations the search of the whole season can take (default unlimited)",
+        )
+        self.parser.add_argument(
+            "--fast-path",
+            action="store_true",
+            help="Answer the rounds the degree theorems guarantee a hamiltonian cycle without a full search (exists and earliest objectives)",
+        )
 
         self.args = self.parser.parse_args()
+        if (
+            self.args.engine is not None
+            and self.args.objective not in Config.engine_objectives[self.args.engine]
+        ):
+            self.parser.error(
+                f"Engine '{self.args.engine}' cannot search for the '{self.args.objective}' objective, only {Config.engine_objectives[self.args.engine]}"
+            )
         logger.debug(f"Command line arguments parsed\n{self.args}")
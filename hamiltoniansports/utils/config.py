@@ -8,6 +8,79 @@ class Config:
         "afl": [str(yr) for yr in range(1897, 3000)],
         "nrl": [str(yr) for yr in range(1981, 3000)],
     }
+    # hamiltonian cycle search engines, see src/engines/creator.py
+    valid_engines: list[str] = [
+        "dfs",
+        "bitmask",
+        "dp",
+        "incremental",
+        "iterative",
+        "pruned",
+        "cover",
+        "bottleneck",
+        "bnb",
+        "mrv",
+        "dpcount",
+        "iecount",
+        "parallel",
+        "distributed",
+        "mitm",
+        "auto",
+    ]
+    # what the search is looking for, and the engine used for each when no engine is requested (the cheapest,
+    # other than earliest which keeps to dfs, whose all_seasons.json counts every cycle and node of the round)
+    valid_objectives: list[str] = ["exists", "earliest", "count", "enumerate"]
+    objective_engines: dict[str, str] = {
+        "exists": "mrv",
+        "earliest": "dfs",
+        "count": "dpcount",
+        "enumerate": "incremental",
+    }
+    # the objectives each engine can meet, those recording a single cycle per round can't count or enumerate
+    # the cycles, and those not searching on the cycle date can't be sure theirs is the earliest
+    engine_objectives: dict[str, list[str]] = {
+        "dfs": ["exists", "earliest", "count", "enumerate"],
+        "bitmask": ["exists", "earliest", "count", "enumerate"],
+        "dp": ["exists"],
+        "incremental": ["exists", "earliest", "count", "enumerate"],
+        "iterative": ["exists", "earliest", "count", "enumerate"],
+        "pruned": ["exists", "earliest", "count", "enumerate"],
+        "cover": ["exists", "earliest", "count", "enumerate"],
+        "bottleneck": ["exists", "earliest"],
+        "bnb": ["exists", "earliest"],
+        "mrv": ["exists", "earliest", "count", "enumerate"],
+        "dpcount": ["exists", "count"],
+        "iecount": ["exists", "count"],
+        "parallel": ["exists", "earliest", "count", "enumerate"],
+        "distributed": ["exists", "earliest", "count", "enumerate"],
+        "mitm": ["exists", "earliest", "count"],
+        "auto": ["exists", "earliest", "count", "enumerate"],
+    }
+    # engines using the memo of dead search states (-m), auto for when it chooses pruned
+    memo_engines: list[str] = ["bitmask", "pruned", "cover", "auto"]
+    # the distributed engine's coordinator address, which workers connect to (see worker.py), and how
+    # long a worker can go without a heartbeat before the tasks it holds are handed to other workers
+    coordinator_host: str = "127.0.0.1"
+    coordinator_port: int = 47600
+    heartbeat_seconds: float = 1.0
+    heartbeat_timeout_seconds: float = 10.0
+    # how often a search in progress is checkpointed, by the engines able to resume part way through one
+    checkpoint_seconds: float = 300.0
+    # permutations between each progress sample taken by the depth-first engines, and how often progress is logged
+    progress_sample_interval: int = 65536
+    progress_report_seconds: float = 10.0
+    # random probes of the search tree estimating each round's search, and the permutations per second
+    # assumed until a search has been timed
+    estimate_probes: int = 200
+    estimate_permutations_per_s: float = 1000000.0
+    # the auto engine searches depth-first while the estimated tree is under 1/auto_dfs_ratio of the
+    # dynamic programs' states, which are only used up to auto_dp_max_teams
+    auto_dfs_ratio: float = 10.0
+    auto_dp_max_teams: int = 20
+    # beyond those, meet-in-the-middle while its halves (about the square root of the tree) fit in memory,
+    # and for the exists objective, depth-first in rounds at least as dense as a round robin
+    auto_mitm_max_halves: float = 1e7
+    auto_exists_density: float = 0.5
 
     def valid_seasons(self, league: str) -> list[str]:
         return self.valid_leagues_seasons[league]
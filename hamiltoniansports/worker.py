@@ -0,0 +1,38 @@
+from src.distributed.worker import run_worker
+from utils.logger import Logger
+from utils.config import Config
+import argparse
+import datetime
+
+# logging
+logger = Logger.setup(current_datetime=datetime.datetime.now())
+
+
+def main():
+    # a worker for the distributed engine, run on any machine able to reach the coordinator
+    parser = argparse.ArgumentParser(description="Distributed search worker")
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=Config.coordinator_host,
+        help="Address of the coordinator, ie. the machine running hamiltoniansports.py -e distributed",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=Config.coordinator_port,
+        help="Port the coordinator is listening on",
+    )
+    args = parser.parse_args()
+
+    run_worker(
+        host=args.host, port=args.port, heartbeat_seconds=Config.heartbeat_seconds
+    )
+
+
+if __name__ == "__main__":
+    # Big Tarp logging pattern
+    try:
+        main()
+    except Exception as e:
+        logger.exception("Fatal error in main()")
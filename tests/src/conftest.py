@@ -0,0 +1,55 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import random
+from pathlib import Path
+from typing import Callable
+from datetime import datetime, timedelta
+from hamiltoniansports.src.api.models import SeasonResults, GameResult, Team
+
+
+def season_of_random_results(nteams: int, nrounds: int, seed: int) -> SeasonResults:
+    """a season of random results, every team plays once per round"""
+    rng = random.Random(seed)
+    teams = {
+        i: Team(
+            id=i,
+            name=f"Team{i}",
+            logo_url=f"http://example.com/logo{i}.png",
+            logo_file=Path(f"/path/to/logo{i}.png"),
+        )
+        for i in range(1, nteams + 1)
+    }
+    dt = datetime(year=2022, month=3, day=1)
+    round_results = {}
+    for cur_round in range(1, nrounds + 1):
+        team_ids = list(teams)
+        rng.shuffle(team_ids)
+        round_results[cur_round] = []
+        for home, away in zip(team_ids[::2], team_ids[1::2]):
+            winner, loser = (home, away) if rng.random() < 0.5 else (away, home)
+            dt += timedelta(hours=rng.randint(1, 30))
+            round_results[cur_round].append(
+                GameResult(
+                    winner=winner,
+                    loser=loser,
+                    round=cur_round,
+                    winner_score=rng.randint(60, 120),
+                    loser_score=rng.randint(0, 59),
+                    dt=dt,
+                )
+            )
+    return SeasonResults(
+        league="TestLeague", season="2022", round_results=round_results, teams=teams
+    )
+
+
+@pytest.fixture
+def random_season_results() -> Callable[[int, int, int], SeasonResults]:
+    """helper to create a season of random results, every team plays once per round, from the number of
+    teams, the number of rounds and a seed"""
+    return season_of_random_results
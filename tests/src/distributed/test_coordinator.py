@@ -0,0 +1,112 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import math
+import socket
+import threading
+import time
+from hamiltoniansports.src.distributed.coordinator import Coordinator
+from hamiltoniansports.src.distributed.protocol import Connection
+from hamiltoniansports.src.distributed.worker import run_worker
+from hamiltoniansports.src.engines.parallel import split_prefixes
+
+
+def complete_graph(nteams: int) -> tuple:
+    """helper for the complete graph on nteams teams, which has (nteams-1)! hamiltonian cycles"""
+    defeated = [((1 << nteams) - 1) ^ (1 << i) for i in range(nteams)]
+    neighbours = [[j for j in range(nteams) if j != i] for i in range(nteams)]
+    edge_rank = [[i * nteams + j for j in range(nteams)] for i in range(nteams)]
+    graph = (neighbours, defeated, defeated, edge_rank)
+    prefixes, _, _ = split_prefixes(neighbours, defeated, defeated, 3)
+    return graph, [(prefix, None) for prefix in prefixes]
+
+
+def start_worker(address: tuple[str, int]) -> threading.Thread:
+    """helper to run a well behaved worker in a thread"""
+    worker = threading.Thread(
+        target=run_worker, args=address, kwargs={"heartbeat_seconds": 0.1}, daemon=True
+    )
+    worker.start()
+    return worker
+
+
+def faulty_worker(address: tuple[str, int], hang: bool) -> threading.Thread:
+    """helper for a worker that takes tasks then fails, either disconnecting or going silent while
+    keeping its connection open. A well behaved worker is started once it has failed"""
+
+    def run() -> None:
+        connection = Connection(socket.create_connection(address))
+        connection.send({"type": "hello", "name": "faulty"})
+        for message in connection.messages():
+            if message["type"] == "task":
+                break
+        start_worker(address)
+        if hang:
+            # no more heartbeats, the coordinator has to notice the silence
+            stop.wait()
+        connection.close()
+
+    stop = threading.Event()
+    thread = threading.Thread(target=run, daemon=True)
+    thread.stop = stop
+    thread.start()
+    return thread
+
+
+def test_coordinator_run():
+    """every task is searched once, across several workers, and the search can be run again"""
+    coordinator = Coordinator("127.0.0.1", 0, heartbeat_timeout=5)
+    graph, tasks = complete_graph(7)
+    workers = [start_worker(coordinator.address) for _ in range(3)]
+    for _ in range(2):
+        results = coordinator.run(graph, tasks, keep_cycles=True, exists=False)
+        assert len(results) == len(tasks)
+        assert sum(r[1] for r in results) == math.factorial(6)
+        assert len({tuple(c) for r in results for c in r[0]}) == math.factorial(6)
+    coordinator.close()
+    for worker in workers:
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+
+def test_coordinator_exists():
+    """the search is over once any worker finds a cycle"""
+    coordinator = Coordinator("127.0.0.1", 0, heartbeat_timeout=5)
+    graph, tasks = complete_graph(8)
+    start_worker(coordinator.address)
+    results = coordinator.run(graph, tasks, keep_cycles=True, exists=True)
+    assert sum(r[1] for r in results) == 1
+    coordinator.close()
+
+
+def test_coordinator_budget():
+    """the search is cancelled once the results run out the nodes between them, or the deadline passes"""
+    coordinator = Coordinator("127.0.0.1", 0, heartbeat_timeout=5)
+    graph, tasks = complete_graph(8)
+    start_worker(coordinator.address)
+    results = coordinator.run(
+        graph, tasks, keep_cycles=False, exists=False, node_limit=1
+    )
+    assert 0 < len(results) < len(tasks)
+    results = coordinator.run(
+        graph, tasks, keep_cycles=False, exists=False, deadline=time.monotonic()
+    )
+    assert results == []
+    coordinator.close()
+
+
+@pytest.mark.parametrize("hang", [False, True])
+def test_coordinator_redispatch(hang: bool):
+    """tasks held by a worker that disconnects, or misses its heartbeats, are handed to another worker"""
+    coordinator = Coordinator("127.0.0.1", 0, heartbeat_timeout=0.5)
+    graph, tasks = complete_graph(7)
+    faulty = faulty_worker(coordinator.address, hang)
+    results = coordinator.run(graph, tasks, keep_cycles=False, exists=False)
+    assert len(results) == len(tasks)
+    assert sum(r[1] for r in results) == math.factorial(6)
+    faulty.stop.set()
+    coordinator.close()
@@ -0,0 +1,81 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch, PropertyMock
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.engines.auto import select_engine
+from hamiltoniansports.src.api.models import Team
+
+
+def test_select_engine():
+    """depth-first while the tree is small against the dynamic programs, which are limited in size, then
+    meet-in-the-middle while its halves fit in memory"""
+    # 16 teams, 2^15 * 16 = 524288 dynamic program states
+    assert select_engine("count", 16, True, 1000, 0.3) == "pruned"
+    assert select_engine("count", 16, True, 1e6, 0.3) == "dpcount"
+    assert select_engine("count", 30, True, 1e12, 0.3) == "mitm"
+    assert select_engine("count", 30, True, 1e16, 0.3) == "iecount"
+    assert select_engine("earliest", 16, True, 1000, 0.3) == "bnb"
+    assert select_engine("earliest", 16, True, 1e6, 0.3) == "bottleneck"
+    assert select_engine("earliest", 30, True, 1e12, 0.3) == "mitm"
+    assert select_engine("earliest", 30, True, 1e16, 0.3) == "bnb"
+    assert select_engine("exists", 16, True, 1000, 0.3) == "mrv"
+    assert select_engine("exists", 16, True, 1e6, 0.3) == "dp"
+    assert select_engine("exists", 30, True, 1e12, 0.3) == "mrv"
+    assert select_engine("enumerate", 16, True, 1e6, 0.3) == "incremental"
+    # no cycle is possible, nothing to search
+    assert select_engine("count", 16, False, 1e6, 0.3) is None
+
+
+def test_select_engine_density():
+    """only the exists objective, stopping at the first cycle, searches dense rounds depth-first"""
+    assert select_engine("exists", 16, True, 1e6, 0.5) == "mrv"
+    assert select_engine("count", 16, True, 1e6, 0.5) == "dpcount"
+    assert select_engine("earliest", 16, True, 1e6, 0.5) == "bottleneck"
+
+
+@pytest.mark.parametrize("objective", ["exists", "earliest", "count", "enumerate"])
+@pytest.mark.parametrize("seed", range(4))
+def test_auto_matches_default_engines(
+    random_season_results, objective: str, seed: int, tmp_path: Path
+):
+    """whichever engines are chosen, the results are those of the objective's own engines"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="bitmask", objective=objective)
+    auto_algo = Algo(seasonresults=season_results, engine="auto", objective=objective)
+    with patch.object(
+        Algo, "all_hc_stream_file", new_callable=PropertyMock
+    ) as mock_stream_file:
+        mock_stream_file.return_value = tmp_path / "all_hc.jsonl"
+        dfs_algo.hamiltonian_cycle_search()
+        auto_algo.hamiltonian_cycle_search()
+
+    assert auto_algo.hc_found == dfs_algo.hc_found
+    assert auto_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    if objective != "exists":
+        assert auto_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    if objective == "count":
+        assert auto_algo.total_hc_found == dfs_algo.total_hc_found
+
+
+def test_auto_records_decisions(random_season_results):
+    """the engine chosen for each round searched, and the inputs it was chosen from, are in the summary"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=6)
+    algo = Algo(seasonresults=season_results, engine="auto", objective="count")
+    algo.hamiltonian_cycle_search()
+
+    decisions = algo.hc_season_summary["2022"]["Engine_Selection"]
+    assert decisions
+    assert decisions.keys() == algo.round_estimates.keys()
+    for decision in decisions.values():
+        assert decision["Engine"] in ("pruned", "dpcount")
+        assert decision["Teams"] == 10
+        assert 0 < decision["Density"] <= 1
+        assert decision["Strongly_Connected"]
+        assert decision["Estimated_Permutations"] > 0
+    assert algo.hc_season_summary["2022"]["Engine"] == "auto"
@@ -0,0 +1,57 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from hamiltoniansports.src.algo import Algo
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_bitmask_matches_dfs(random_season_results, seed: int):
+    """the bitmask engine walks the same search tree as the original dfs, so every result must match"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    bitmask_algo = Algo(seasonresults=season_results, engine="bitmask")
+    bitmask_algo.hamiltonian_cycle_search()
+
+    assert bitmask_algo.first_hc == dfs_algo.first_hc
+    assert bitmask_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert bitmask_algo.all_hc == dfs_algo.all_hc
+    assert bitmask_algo.permutation_counter == dfs_algo.permutation_counter
+    assert bitmask_algo.round_hc_tracker == dfs_algo.round_hc_tracker
+    assert bitmask_algo.round_permutation_tracker == dfs_algo.round_permutation_tracker
+
+
+def test_bitmask_engine_summary(random_season_results):
+    """the engine used is recorded in the season summary"""
+    season_results = random_season_results(nteams=6, nrounds=6, seed=1)
+    algo = Algo(seasonresults=season_results, engine="bitmask")
+    algo.hamiltonian_cycle_search()
+    assert algo.hc_season_summary["2022"]["Engine"] == "bitmask"
+
+
+@pytest.mark.parametrize("objective", ["earliest", "count"])
+@pytest.mark.parametrize("seed", range(6))
+def test_bitmask_memo(random_season_results, seed: int, objective: str):
+    """dead states are skipped without changing the cycles found, whatever the objective"""
+    season_results = random_season_results(nteams=9, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs", objective=objective)
+    dfs_algo.hamiltonian_cycle_search()
+    memo_algo = Algo(
+        seasonresults=season_results,
+        engine="bitmask",
+        objective=objective,
+        memo_bytes=2**20,
+    )
+    memo_algo.hamiltonian_cycle_search()
+
+    assert memo_algo.first_hc == dfs_algo.first_hc
+    assert memo_algo.all_hc == dfs_algo.all_hc
+    assert memo_algo.total_hc_found == dfs_algo.total_hc_found
+    assert memo_algo.permutation_counter <= dfs_algo.permutation_counter
+    if memo_algo.permutation_counter:
+        # only looked up once a search has been run
+        assert memo_algo.transposition.misses > 0
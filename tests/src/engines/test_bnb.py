@@ -0,0 +1,43 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from hamiltoniansports.src.algo import Algo
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_bnb_matches_dfs_date(random_season_results, seed: int):
+    """the earliest cycle date must match the full enumeration, while undertaking fewer permutations"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    bnb_algo = Algo(seasonresults=season_results, engine="bnb")
+    bnb_algo.hamiltonian_cycle_search()
+
+    assert bnb_algo.hc_found == dfs_algo.hc_found
+    assert bnb_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert bnb_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert bnb_algo.permutation_counter <= dfs_algo.permutation_counter
+    if bnb_algo.hc_found:
+        assert bnb_algo.first_hc in dfs_algo.all_hc
+        # every cycle recorded improved on the one before it
+        assert 1 <= bnb_algo.total_hc_found <= dfs_algo.total_hc_found
+
+
+def test_bnb_bounded_by_earlier_incumbent(random_season_results):
+    """a cycle already found bounds the search, nothing later than it is explored"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=1)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    assert dfs_algo.hc_found
+
+    bnb_algo = Algo(seasonresults=season_results, engine="bnb")
+    bnb_algo.adjacency_graph = dfs_algo.adjacency_graph
+    bnb_algo.result_detail = dfs_algo.result_detail
+    bnb_algo.date_of_first_hc = dfs_algo.date_of_first_hc
+    bnb_algo._find_hamiltonian_cycle(hc_length_target=8)
+    assert not bnb_algo.all_hc
+    assert bnb_algo.pruned_counter > 0
@@ -0,0 +1,45 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from datetime import datetime
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.api.models import GameResult
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_bottleneck_matches_dfs_date(random_season_results, seed: int):
+    """the earliest cycle date and round must match the full enumeration, with the same witness cycle"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    bottleneck_algo = Algo(seasonresults=season_results, engine="bottleneck")
+    bottleneck_algo.hamiltonian_cycle_search()
+
+    assert bottleneck_algo.hc_found == dfs_algo.hc_found
+    assert bottleneck_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert bottleneck_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    if bottleneck_algo.hc_found:
+        assert bottleneck_algo.total_hc_found == 1
+        # the witness is the cycle dfs kept, not just one of those it found
+        assert bottleneck_algo.first_hc == dfs_algo.first_hc
+
+
+def test_bottleneck_no_cycle(random_season_results):
+    """a strongly connected round without a cycle records nothing"""
+    season_results = random_season_results(nteams=4, nrounds=1, seed=0)
+    algo = Algo(seasonresults=season_results, engine="bottleneck")
+    # 1 <-> 2 <-> 3 <-> 4 along a line is strongly connected, but has no hamiltonian cycle
+    games = [(1, 2), (2, 1), (2, 3), (3, 2), (3, 4), (4, 3)]
+    dt = datetime(year=2022, month=3, day=1)
+    for winner, loser in games:
+        algo.adjacency_graph.setdefault(winner, set()).add(loser)
+        algo.result_detail.setdefault(winner, {})[loser] = GameResult(
+            winner=winner, loser=loser, round=1, winner_score=2, loser_score=1, dt=dt
+        )
+    algo._find_hamiltonian_cycle(hc_length_target=4)
+    assert not algo.hc_found
+    assert algo.permutation_counter > 0
@@ -0,0 +1,56 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import math
+import numpy as np
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.engines.count import (
+    count_cycles,
+    count_dtype,
+    path_count_table,
+)
+
+
+def test_count_cycles_complete():
+    """a complete digraph on n teams has (n-1)! hamiltonian cycles"""
+    for nteams in range(2, 7):
+        everyone = (1 << nteams) - 1
+        defeated = [everyone ^ (1 << i) for i in range(nteams)]
+        total, witness, _ = count_cycles(defeated)
+        assert total == math.factorial(nteams - 1)
+        assert witness[0] == 0 and sorted(witness) == list(range(nteams))
+        for cur, nxt in zip(witness, witness[1:] + witness[:1]):
+            assert defeated[cur] >> nxt & 1
+
+
+def test_count_cycles_none():
+    """no way back to team 0, so no cycle and no witness"""
+    defeated = [0b110, 0b100, 0b000]
+    assert count_cycles(defeated)[:2] == (0, None)
+
+
+def test_count_dtype():
+    """python ints are used once the counts could overflow int64"""
+    assert count_dtype(20) is np.int64
+    assert count_dtype(21) is object
+    assert path_count_table([0b110, 0b101, 0b011]).dtype == np.int64
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_dpcount_matches_dfs(random_season_results, seed: int):
+    """the exact number of cycles is counted without building them, in the same round"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    count_algo = Algo(seasonresults=season_results, engine="dpcount", objective="count")
+    count_algo.hamiltonian_cycle_search()
+
+    assert count_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert count_algo.total_hc_found == dfs_algo.total_hc_found
+    assert count_algo.round_hc_tracker == dfs_algo.round_hc_tracker
+    assert count_algo.first_hc == dfs_algo.first_hc
+    assert count_algo.date_of_first_hc == dfs_algo.date_of_first_hc
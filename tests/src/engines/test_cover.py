@@ -0,0 +1,37 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from hamiltoniansports.src.algo import Algo
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_cover_matches_dfs(random_season_results, seed: int):
+    """only cycle-free branches are cut, so the same cycles are found in the same order as the original dfs"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    cover_algo = Algo(seasonresults=season_results, engine="cover")
+    cover_algo.hamiltonian_cycle_search()
+
+    assert cover_algo.first_hc == dfs_algo.first_hc
+    assert cover_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert cover_algo.all_hc == dfs_algo.all_hc
+    assert cover_algo.round_hc_tracker == dfs_algo.round_hc_tracker
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_cover_cuts_more_than_pruned(random_season_results, seed: int):
+    """the cycle cover check only adds to forward checking, so never searches more than the pruned engine"""
+    season_results = random_season_results(nteams=12, nrounds=14, seed=seed)
+    pruned_algo = Algo(seasonresults=season_results, engine="pruned", objective="count")
+    pruned_algo.hamiltonian_cycle_search()
+    cover_algo = Algo(seasonresults=season_results, engine="cover", objective="count")
+    cover_algo.hamiltonian_cycle_search()
+
+    assert cover_algo.total_hc_found == pruned_algo.total_hc_found
+    assert cover_algo.round_hc_tracker == pruned_algo.round_hc_tracker
+    assert cover_algo.permutation_counter <= pruned_algo.permutation_counter
@@ -0,0 +1,78 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import multiprocessing
+import time
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.distributed.worker import run_worker
+from hamiltoniansports.src.api.models import SeasonResults
+
+
+def distributed_search(
+    season_results: SeasonResults, objective: str, nworkers: int
+) -> Algo:
+    """helper to run a distributed search, with worker processes connecting over localhost"""
+    algo = Algo(seasonresults=season_results, engine="distributed", objective=objective)
+    engine = algo.enginecreator.engine
+    engine.port = 0
+    engine.parallel_min_teams = 2
+    engine.split_depth = 3
+    host, port = engine.start()
+    workers = [
+        multiprocessing.Process(
+            target=run_worker, args=(host, port), kwargs={"heartbeat_seconds": 0.2}
+        )
+        for _ in range(nworkers)
+    ]
+    for worker in workers:
+        worker.start()
+    # every worker connected before the search, so none is left waiting on a closed coordinator
+    while len(engine.coordinator.accepted) < nworkers:
+        time.sleep(0.01)
+    try:
+        algo.hamiltonian_cycle_search()
+    finally:
+        # workers are told to shut down once the search closes the coordinator
+        for worker in workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+    assert engine.coordinator is None
+    assert all(worker.exitcode == 0 for worker in workers)
+    return algo
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_distributed_matches_dfs(random_season_results, seed: int):
+    """the same cycles, in the same order and dates are found as the original dfs"""
+    season_results = random_season_results(nteams=9, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    algo = distributed_search(season_results, "earliest", 3)
+
+    assert algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert algo.all_hc == dfs_algo.all_hc
+
+
+@pytest.mark.parametrize("objective", ["count", "exists"])
+def test_distributed_objectives(random_season_results, objective: str):
+    """counts are streamed back without the cycles, and existence stops at the first cycle"""
+    season_results = random_season_results(nteams=9, nrounds=10, seed=6)
+    pruned_algo = Algo(
+        seasonresults=season_results, engine="pruned", objective=objective
+    )
+    pruned_algo.hamiltonian_cycle_search()
+    algo = distributed_search(season_results, objective, 2)
+
+    assert algo.round_of_first_hc == pruned_algo.round_of_first_hc
+    if objective == "count":
+        assert algo.total_hc_found == pruned_algo.total_hc_found
+        assert algo.date_of_first_hc == pruned_algo.date_of_first_hc
+        assert algo.permutation_counter == pruned_algo.permutation_counter
+    else:
+        assert algo.hc_found and algo.total_hc_found == 1
@@ -0,0 +1,77 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import random
+import itertools
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.engines.dp import subset_layers, held_karp_cycle
+
+
+def is_cycle(defeated: list[int], cycle: list[int]) -> bool:
+    """helper to check a list of bit positions is a hamiltonian cycle of the defeated bitmasks"""
+    nteams = len(defeated)
+    return sorted(cycle) == list(range(nteams)) and all(
+        defeated[cycle[i]] >> cycle[(i + 1) % nteams] & 1 for i in range(nteams)
+    )
+
+
+def test_subset_layers():
+    """every subset appears exactly once, in the layer of its size"""
+    layers = subset_layers(4)
+    assert len(layers) == 5
+    assert sorted(mask for layer in layers for mask in layer.tolist()) == list(
+        range(16)
+    )
+    for size, layer in enumerate(layers):
+        assert all(bin(mask).count("1") == size for mask in layer.tolist())
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_held_karp_cycle_matches_brute_force(seed: int):
+    """existence must agree with trying every permutation, and any cycle rebuilt must be valid"""
+    rng = random.Random(seed)
+    nteams = rng.randint(2, 7)
+    defeated = [0] * nteams
+    for i, j in itertools.permutations(range(nteams), 2):
+        if rng.random() < 0.45:
+            defeated[i] |= 1 << j
+
+    brute_force = any(
+        is_cycle(defeated, [0, *perm])
+        for perm in itertools.permutations(range(1, nteams))
+    )
+    cycle, states = held_karp_cycle(defeated)
+    assert (cycle is not None) == brute_force
+    assert states >= 0
+    if cycle is not None:
+        assert cycle[0] == 0
+        assert is_cycle(defeated, cycle)
+
+
+def test_held_karp_cycle_too_small():
+    """a single team can never be a cycle"""
+    assert held_karp_cycle([0]) == (None, 0)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_dp_matches_dfs_round(random_season_results, seed: int):
+    """the dp engine must find a cycle in exactly the same round as the dfs, with a valid cycle (it only
+    decides if a cycle exists, so isn't held to the earliest)"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    dp_algo = Algo(seasonresults=season_results, engine="dp", objective="exists")
+    dp_algo.hamiltonian_cycle_search()
+
+    assert dp_algo.hc_found == dfs_algo.hc_found
+    assert dp_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    if dp_algo.hc_found:
+        assert dp_algo.first_hc in [
+            hc[i:] + hc[:i] for hc in dfs_algo.all_hc for i in range(len(hc))
+        ]
+        assert dp_algo.total_hc_found == 1
+        assert dp_algo.date_of_first_hc >= dfs_algo.date_of_first_hc
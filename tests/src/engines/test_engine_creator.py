@@ -0,0 +1,205 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from pathlib import Path
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.api.models import SeasonResults, Team
+from hamiltoniansports.src.engines.creator import EngineCreator
+from hamiltoniansports.src.engines.dfs import DFSEngine
+from hamiltoniansports.src.engines.bitmask import BitmaskDFSEngine
+from hamiltoniansports.src.engines.dp import HeldKarpEngine
+from hamiltoniansports.src.engines.incremental import IncrementalEngine
+from hamiltoniansports.src.engines.iterative import IterativeDFSEngine
+from hamiltoniansports.src.engines.pruned import PrunedDFSEngine
+from hamiltoniansports.src.engines.bottleneck import BottleneckEngine
+from hamiltoniansports.src.engines.bnb import BranchAndBoundEngine
+from hamiltoniansports.src.engines.mrv import MRVEngine
+from hamiltoniansports.src.engines.count import PathCountEngine
+from hamiltoniansports.src.engines.inclusion import InclusionExclusionEngine
+from hamiltoniansports.src.engines.parallel import ParallelDFSEngine
+from hamiltoniansports.src.engines.distributed import DistributedEngine
+from hamiltoniansports.src.engines.mitm import MeetInTheMiddleEngine
+from hamiltoniansports.src.engines.auto import AutoEngine
+from hamiltoniansports.src.engines.cover import CycleCoverDFSEngine
+
+
+def dummy_algo() -> Algo:
+    """helper to create an algo instance with a single team, the engines only hold a reference to it"""
+    team = Team(
+        id=1,
+        name="Team1",
+        logo_url="http://example.com/logo1.png",
+        logo_file=Path("/path/to/logo1.png"),
+    )
+    season_results = SeasonResults(
+        league="TestLeague", season="2022", round_results={}, teams={1: team}
+    )
+    return Algo(seasonresults=season_results)
+
+
+def test_engine_property_not_set():
+    """assert usage of hacky 'not yet set' pattern"""
+    creator = EngineCreator()
+    with pytest.raises(AttributeError):
+        creator.engine
+
+
+def test_assign_engine_dfs():
+    """assert concrete engine class for dfs
+
+    nb. create a new test for each concrete engine class implementation
+    """
+    creator = EngineCreator()
+    algo = dummy_algo()
+    creator.assign_engine("dfs", algo)
+    # hacky work-around for when classes are not imported using the same namespace
+    assert (
+        creator.engine.__class__.__name__ == DFSEngine.__name__
+    ), f"Expected class {DFSEngine.__name__}, but got {creator.engine.__class__.__name__}"
+    assert creator.engine.algo is algo
+
+
+def test_assign_engine_bitmask():
+    """assert concrete engine class for bitmask dfs"""
+    creator = EngineCreator()
+    creator.assign_engine("bitmask", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == BitmaskDFSEngine.__name__
+    ), f"Expected class {BitmaskDFSEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_dp():
+    """assert concrete engine class for held-karp dynamic programming"""
+    creator = EngineCreator()
+    creator.assign_engine("dp", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == HeldKarpEngine.__name__
+    ), f"Expected class {HeldKarpEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_incremental():
+    """assert concrete engine class for incremental bitmask dfs"""
+    creator = EngineCreator()
+    creator.assign_engine("incremental", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == IncrementalEngine.__name__
+    ), f"Expected class {IncrementalEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_iterative():
+    """assert concrete engine class for iterative dfs"""
+    creator = EngineCreator()
+    creator.assign_engine("iterative", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == IterativeDFSEngine.__name__
+    ), f"Expected class {IterativeDFSEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_pruned():
+    """assert concrete engine class for forward checking dfs"""
+    creator = EngineCreator()
+    creator.assign_engine("pruned", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == PrunedDFSEngine.__name__
+    ), f"Expected class {PrunedDFSEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_bottleneck():
+    """assert concrete engine class for bottleneck (earliest cycle) search"""
+    creator = EngineCreator()
+    creator.assign_engine("bottleneck", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == BottleneckEngine.__name__
+    ), f"Expected class {BottleneckEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_bnb():
+    """assert concrete engine class for branch-and-bound dfs"""
+    creator = EngineCreator()
+    creator.assign_engine("bnb", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == BranchAndBoundEngine.__name__
+    ), f"Expected class {BranchAndBoundEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_mrv():
+    """assert concrete engine class for most-constrained-first dfs"""
+    creator = EngineCreator()
+    creator.assign_engine("mrv", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == MRVEngine.__name__
+    ), f"Expected class {MRVEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_dpcount():
+    """assert concrete engine class for subset dp cycle counting"""
+    creator = EngineCreator()
+    creator.assign_engine("dpcount", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == PathCountEngine.__name__
+    ), f"Expected class {PathCountEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_iecount():
+    """assert concrete engine class for inclusion-exclusion cycle counting"""
+    creator = EngineCreator()
+    creator.assign_engine("iecount", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == InclusionExclusionEngine.__name__
+    ), f"Expected class {InclusionExclusionEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_parallel():
+    """assert concrete engine class for process-pool parallel dfs"""
+    creator = EngineCreator()
+    creator.assign_engine("parallel", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == ParallelDFSEngine.__name__
+    ), f"Expected class {ParallelDFSEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_distributed():
+    """assert concrete engine class for the distributed coordinator"""
+    creator = EngineCreator()
+    creator.assign_engine("distributed", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == DistributedEngine.__name__
+    ), f"Expected class {DistributedEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_mitm():
+    """assert concrete engine class for meet-in-the-middle search"""
+    creator = EngineCreator()
+    creator.assign_engine("mitm", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == MeetInTheMiddleEngine.__name__
+    ), f"Expected class {MeetInTheMiddleEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_auto():
+    """assert concrete engine class for automatic engine selection"""
+    creator = EngineCreator()
+    creator.assign_engine("auto", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == AutoEngine.__name__
+    ), f"Expected class {AutoEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_cover():
+    """assert concrete engine class for the cycle cover pruned depth first search"""
+    creator = EngineCreator()
+    creator.assign_engine("cover", dummy_algo())
+    assert (
+        creator.engine.__class__.__name__ == CycleCoverDFSEngine.__name__
+    ), f"Expected class {CycleCoverDFSEngine.__name__}, but got {creator.engine.__class__.__name__}"
+
+
+def test_assign_engine_invalid():
+    """for invalid engines"""
+    creator = EngineCreator()
+    with pytest.raises(ValueError):
+        creator.assign_engine("invalid_engine", dummy_algo())
@@ -0,0 +1,116 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import math
+import numpy as np
+import random
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.engines.count import count_cycles
+from hamiltoniansports.src.engines.inclusion import (
+    closed_walk_residues,
+    crt,
+    moduli,
+)
+
+
+def test_moduli_crt():
+    """enough primes to rebuild any count up to (n-1)!, and rebuilt exactly"""
+    for nteams in [2, 13, 14, 25]:
+        primes = moduli(nteams)
+        assert math.prod(primes) > math.factorial(nteams - 1)
+        assert all(p < 2**31 for p in primes)
+    primes = moduli(25)
+    value = math.factorial(24) - 12345
+    assert crt([value % p for p in primes], primes) == value
+
+
+@pytest.mark.parametrize("nteams", [3, 8, 15])
+def test_closed_walk_residues_complete(nteams: int):
+    """a complete digraph on n teams has (n-1)! hamiltonian cycles, across more than one prime"""
+    adjacency = np.ones((nteams, nteams)) - np.eye(nteams)
+    primes = moduli(nteams)
+    residues = closed_walk_residues(adjacency, 0, 1 << (nteams - 1), primes, batch=100)
+    assert crt(residues, primes) == math.factorial(nteams - 1)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_closed_walk_residues_matches_dpcount(seed: int):
+    """the same count as the subset dp, summing the subset range in split chunks"""
+    rng = random.Random(seed)
+    nteams = 11
+    defeated = [
+        sum(1 << j for j in range(nteams) if j != i and rng.random() < 0.5)
+        for i in range(nteams)
+    ]
+    adjacency = np.array(
+        [[d >> j & 1 for j in range(nteams)] for d in defeated], dtype=np.float64
+    )
+    primes = moduli(nteams)
+    half = 1 << (nteams - 2)
+    lower = closed_walk_residues(adjacency, 0, half, primes)
+    upper = closed_walk_residues(adjacency, half, 2 * half, primes)
+    residues = [(a + b) % p for a, b, p in zip(lower, upper, primes)]
+    assert crt(residues, primes) == count_cycles(defeated)[0]
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_iecount_matches_dfs(random_season_results, seed: int):
+    """the exact number of cycles is counted in the same round, with a witness cycle"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    count_algo = Algo(seasonresults=season_results, engine="iecount", objective="count")
+    count_algo.hamiltonian_cycle_search()
+
+    assert count_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert count_algo.total_hc_found == dfs_algo.total_hc_found
+    assert count_algo.first_hc == dfs_algo.first_hc
+    assert count_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+
+
+def test_iecount_process_pool(random_season_results):
+    """the same count when the subsets are split across a process pool"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=3)
+    serial_algo = Algo(
+        seasonresults=season_results, engine="iecount", objective="count"
+    )
+    serial_algo.hamiltonian_cycle_search()
+    pool_algo = Algo(seasonresults=season_results, engine="iecount", objective="count")
+    engine = pool_algo.enginecreator.engine
+    engine.parallel_min_teams = 2
+    engine.workers = 2
+    pool_algo.hamiltonian_cycle_search()
+
+    assert pool_algo.hc_found
+    assert pool_algo.total_hc_found == serial_algo.total_hc_found
+
+
+def test_iecount_witness_budget(random_season_results):
+    """the dfs finding the witness, the last of the round, counts its expansions and stops once out of
+    budget"""
+    season_results = random_season_results(nteams=9, nrounds=12, seed=1)
+    algo = Algo(seasonresults=season_results, engine="iecount", objective="count")
+    algo.hamiltonian_cycle_search()
+    round_permutations = (
+        algo.round_permutation_tracker[-1] - algo.round_permutation_tracker[-2]
+    )
+    # the 2^8 subsets of each count, and at least the 8 expansions of the witness
+    assert round_permutations % 256 >= 8
+
+    # one expansion short, stopping part way through the witness
+    algo = Algo(
+        seasonresults=season_results,
+        engine="iecount",
+        objective="count",
+        round_nodes=round_permutations - 1,
+    )
+    algo.hamiltonian_cycle_search()
+    assert algo.hc_season_summary["2022"]["Budget_Exhausted"] == "round_nodes"
+    assert (
+        algo.permutation_counter - algo.round_permutation_tracker[-2]
+        == round_permutations - 1
+    )
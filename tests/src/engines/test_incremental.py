@@ -0,0 +1,71 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from hamiltoniansports.src.algo import Algo
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_matches_dfs(random_season_results, seed: int):
+    """the anchored searches must find exactly the same cycles (in any order) and dates as the full dfs"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    incremental_algo = Algo(seasonresults=season_results, engine="incremental")
+    incremental_algo.hamiltonian_cycle_search()
+
+    assert incremental_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert incremental_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert sorted(incremental_algo.all_hc) == sorted(dfs_algo.all_hc)
+    assert incremental_algo.round_hc_tracker == dfs_algo.round_hc_tracker
+    # rotated to the same start team, and ties on the date settled as the full search would
+    assert incremental_algo.first_hc == dfs_algo.first_hc
+
+
+@pytest.mark.parametrize("objective", ["earliest", "count"])
+def test_incremental_first_hc_tie_break(random_season_results, objective: str):
+    """several cycles share the earliest date, found in a different order to dfs, the one dfs would find
+    first is kept"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=0)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs", objective=objective)
+    dfs_algo.hamiltonian_cycle_search()
+    incremental_algo = Algo(
+        seasonresults=season_results, engine="incremental", objective=objective
+    )
+    incremental_algo.hamiltonian_cycle_search()
+
+    earliest = Algo(seasonresults=season_results, engine="dfs")
+    earliest.hamiltonian_cycle_search()
+    ties = [
+        c for c in earliest.all_hc if earliest.hc_date(c) == earliest.date_of_first_hc
+    ]
+    assert len(ties) > 1
+    assert incremental_algo.first_hc == dfs_algo.first_hc == ties[0]
+
+
+def test_incremental_new_edges_recorded(random_season_results):
+    """only first-time winner->loser combinations are new edges"""
+    season_results = random_season_results(nteams=6, nrounds=6, seed=3)
+    algo = Algo(seasonresults=season_results, engine="incremental")
+    algo.hamiltonian_cycle_search()
+
+    assert len(algo.round_new_edges) == len(algo.round_hc_tracker)
+    all_new_edges = [edge for edges in algo.round_new_edges for edge in edges]
+    assert len(all_new_edges) == len(set(all_new_edges))
+    assert sorted(all_new_edges) == sorted(
+        (w, l) for w in algo.adjacency_graph for l in algo.adjacency_graph[w]
+    )
+
+
+def test_incremental_no_new_edges(random_season_results):
+    """a round without new edges cannot create a cycle, so nothing is searched"""
+    season_results = random_season_results(nteams=6, nrounds=2, seed=3)
+    algo = Algo(seasonresults=season_results, engine="incremental")
+    algo.adjacency_graph = {1: {2}, 2: {3}, 3: {1}}
+    algo.round_new_edges = [[]]
+    algo._find_hamiltonian_cycle(hc_length_target=3)
+    assert not algo.all_hc
+    assert algo.permutation_counter == 0
@@ -0,0 +1,183 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import json
+from unittest.mock import patch, PropertyMock
+from pathlib import Path
+from datetime import datetime
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.api.models import GameResult
+from hamiltoniansports.src.algo import Config as AlgoConfig
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_iterative_matches_dfs(random_season_results, seed: int):
+    """the iterative engine walks the same search tree as the original dfs, so every result must match"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    iterative_algo = Algo(seasonresults=season_results, engine="iterative")
+    iterative_algo.hamiltonian_cycle_search()
+
+    assert iterative_algo.first_hc == dfs_algo.first_hc
+    assert iterative_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert iterative_algo.all_hc == dfs_algo.all_hc
+    assert iterative_algo.permutation_counter == dfs_algo.permutation_counter
+    assert (
+        iterative_algo.round_permutation_tracker == dfs_algo.round_permutation_tracker
+    )
+
+
+def test_iterative_pause_and_resume(random_season_results):
+    """running the search in small slices gives the same results as running it in one go"""
+    season_results = random_season_results(nteams=8, nrounds=6, seed=4)
+    whole_algo = Algo(seasonresults=season_results, engine="iterative")
+    sliced_algo = Algo(seasonresults=season_results, engine="iterative")
+    for algo in (whole_algo, sliced_algo):
+        for team_id in season_results.team_ids:
+            algo.adjacency_graph[team_id] = set()
+        for cur_round in season_results.rounds_list:
+            for game in season_results.round_results[cur_round]:
+                algo.adjacency_graph[game.winner].add(game.loser)
+                algo.result_detail.setdefault(game.winner, {})[game.loser] = game
+
+    whole_algo.enginecreator.engine.find_hamiltonian_cycle(hc_length_target=8)
+
+    engine = sliced_algo.enginecreator.engine
+    engine.start()
+    assert not engine.exhausted
+    slices = 0
+    while not engine.resume(max_permutations=7):
+        slices += 1
+        # paused state can be inspected, the permutations are exactly the slices taken so far
+        assert engine.state["Permutations"] == slices * 7
+        assert engine.state["Depth"] == len(engine.state["Path"])
+        assert engine.state["Path"][0] == season_results.team_ids[0]
+        assert not engine.state["Exhausted"]
+    assert slices > 0
+    assert engine.exhausted
+
+    assert sliced_algo.all_hc == whole_algo.all_hc
+    assert sliced_algo.first_hc == whole_algo.first_hc
+    assert sliced_algo.permutation_counter == whole_algo.permutation_counter
+
+
+def test_iterative_checkpoint_resume(
+    random_season_results, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """a search interrupted part way through a round resumes from the saved stack, with the same results"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=6)
+    whole_algo = Algo(
+        seasonresults=season_results, engine="iterative", objective="count"
+    )
+    whole_algo.hamiltonian_cycle_search()
+
+    checkpoint_file = tmp_path / "checkpoint.json"
+    # a checkpoint is due whenever the search pauses
+    monkeypatch.setattr(AlgoConfig, "checkpoint_seconds", 0)
+    with patch.object(
+        Algo, "checkpoint_file", new_callable=PropertyMock
+    ) as mock_checkpoint_file:
+        mock_checkpoint_file.return_value = checkpoint_file
+
+        interrupted_algo = Algo(
+            seasonresults=season_results, engine="iterative", objective="count"
+        )
+        interrupted_algo.checkpointing = True
+        interrupted_algo.enginecreator.engine.checkpoint_permutations = 50
+        search_checkpoint = interrupted_algo.search_checkpoint
+
+        def interrupt_after_checkpoint():
+            search_checkpoint()
+            raise KeyboardInterrupt
+
+        interrupted_algo.search_checkpoint = interrupt_after_checkpoint
+        with pytest.raises(KeyboardInterrupt):
+            interrupted_algo.hamiltonian_cycle_search()
+        saved = json.loads(checkpoint_file.read_text())
+        assert saved["Search"]["Stack"]
+
+        algo = Algo(
+            seasonresults=season_results,
+            engine="iterative",
+            objective="count",
+            resume=True,
+        )
+        algo.hamiltonian_cycle_search()
+
+    assert algo.first_hc == whole_algo.first_hc
+    assert algo.date_of_first_hc == whole_algo.date_of_first_hc
+    assert algo.total_hc_found == whole_algo.total_hc_found
+    assert algo.permutation_counter == whole_algo.permutation_counter
+    assert algo.round_hc_tracker == whole_algo.round_hc_tracker
+    assert algo.round_permutation_tracker == whole_algo.round_permutation_tracker
+    assert not checkpoint_file.is_file()
+
+
+def test_iterative_budget_resume(random_season_results, tmp_path: Path):
+    """a search stopped by its budget is checkpointed where it stopped, and resumes to the same results"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=6)
+    whole_algo = Algo(
+        seasonresults=season_results, engine="iterative", objective="count"
+    )
+    whole_algo.hamiltonian_cycle_search()
+
+    checkpoint_file = tmp_path / "checkpoint.json"
+    with patch.object(
+        Algo, "checkpoint_file", new_callable=PropertyMock
+    ) as mock_checkpoint_file:
+        mock_checkpoint_file.return_value = checkpoint_file
+        stopped_algo = Algo(
+            seasonresults=season_results,
+            engine="iterative",
+            objective="count",
+            checkpoint=True,
+            season_nodes=whole_algo.permutation_counter // 2,
+        )
+        stopped_algo.hamiltonian_cycle_search()
+        assert stopped_algo.budget.exhausted == "season_nodes"
+        assert stopped_algo.permutation_counter < whole_algo.permutation_counter
+        assert json.loads(checkpoint_file.read_text())["Search"]["Stack"]
+
+        algo = Algo(
+            seasonresults=season_results,
+            engine="iterative",
+            objective="count",
+            resume=True,
+        )
+        algo.hamiltonian_cycle_search()
+
+    assert algo.first_hc == whole_algo.first_hc
+    assert algo.total_hc_found == whole_algo.total_hc_found
+    assert algo.permutation_counter == whole_algo.permutation_counter
+    assert algo.round_permutation_tracker == whole_algo.round_permutation_tracker
+    assert algo.hc_season_summary["2022"]["Exhaustive"]
+
+
+def test_iterative_beyond_recursion_limit(random_season_results):
+    """the explicit stack has no dependency on the python recursion limit"""
+    nteams = sys.getrecursionlimit() + 100
+    season_results = random_season_results(nteams=2, nrounds=1, seed=0)
+    algo = Algo(seasonresults=season_results, engine="iterative")
+    dt = datetime(year=2022, month=3, day=1)
+    for team_id in range(nteams):
+        loser = (team_id + 1) % nteams
+        algo.adjacency_graph[team_id] = {loser}
+        algo.result_detail[team_id] = {
+            loser: GameResult(
+                winner=team_id,
+                loser=loser,
+                round=1,
+                winner_score=2,
+                loser_score=1,
+                dt=dt,
+            )
+        }
+    algo._find_hamiltonian_cycle(hc_length_target=nteams)
+
+    assert algo.first_hc == list(range(nteams))
+    assert algo.permutation_counter == nteams - 1
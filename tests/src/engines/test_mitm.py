@@ -0,0 +1,57 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from hamiltoniansports.src.algo import Algo
+
+
+@pytest.mark.parametrize("nteams", [5, 8, 9])
+@pytest.mark.parametrize("seed", range(8))
+def test_mitm_matches_dfs(random_season_results, seed: int, nteams: int):
+    """every cycle is counted, and the earliest recorded, in the same round as the original dfs"""
+    season_results = random_season_results(nteams=nteams, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    mitm_algo = Algo(seasonresults=season_results, engine="mitm")
+    mitm_algo.hamiltonian_cycle_search()
+
+    assert mitm_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert mitm_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert mitm_algo.total_hc_found == dfs_algo.total_hc_found
+    if mitm_algo.hc_found:
+        assert mitm_algo.first_hc in dfs_algo.all_hc
+        assert mitm_algo.all_hc == [mitm_algo.first_hc]
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_mitm_exists(random_season_results, seed: int):
+    """stopping at the first join finds a cycle in the same round as the full search"""
+    season_results = random_season_results(nteams=10, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    mitm_algo = Algo(seasonresults=season_results, engine="mitm", objective="exists")
+    mitm_algo.hamiltonian_cycle_search()
+
+    assert mitm_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    if mitm_algo.hc_found:
+        assert mitm_algo.first_hc in dfs_algo.all_hc
+        assert mitm_algo.total_hc_found == 1
+
+
+def test_mitm_budget_keeps_joins(random_season_results):
+    """running out of budget part way through the backward halves keeps the joins made so far"""
+    season_results = random_season_results(nteams=9, nrounds=12, seed=1)
+    full_algo = Algo(seasonresults=season_results, engine="mitm", objective="count")
+    full_algo.hamiltonian_cycle_search()
+    # one expansion short of the 111 of the round with the cycles
+    algo = Algo(
+        seasonresults=season_results, engine="mitm", objective="count", round_nodes=110
+    )
+    algo.hamiltonian_cycle_search()
+
+    assert algo.hc_season_summary["2022"]["Budget_Exhausted"] == "round_nodes"
+    assert algo.round_of_first_hc == full_algo.round_of_first_hc
+    assert 0 < algo.total_hc_found <= full_algo.total_hc_found
@@ -0,0 +1,50 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.engines.mrv import most_constrained_team
+
+
+def test_most_constrained_team():
+    """smallest in- or out-degree, bit positions 0..3"""
+    # everyone defeated everyone else, except 2 only defeated 0
+    defeated = [0b1110, 0b1101, 0b0001, 0b0111]
+    defeated_by = [0b1110, 0b1001, 0b1011, 0b0011]
+    assert most_constrained_team(defeated, defeated_by) == 2
+    # now 3 has only been defeated by 0, and 2 has also defeated 1
+    defeated = [0b1110, 0b0101, 0b0011, 0b0111]
+    defeated_by = [0b1110, 0b1101, 0b1011, 0b0001]
+    assert most_constrained_team(defeated, defeated_by) == 3
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_mrv_matches_dfs(random_season_results, seed: int):
+    """the same cycles and dates are found as the original dfs, just in a different order"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    mrv_algo = Algo(seasonresults=season_results, engine="mrv")
+    mrv_algo.hamiltonian_cycle_search()
+
+    assert mrv_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert mrv_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert sorted(mrv_algo.all_hc) == sorted(dfs_algo.all_hc)
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_mrv_exists(random_season_results, seed: int):
+    """stopping at the first cycle finds one in the same round as the full search"""
+    season_results = random_season_results(nteams=10, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    mrv_algo = Algo(seasonresults=season_results, engine="mrv", objective="exists")
+    mrv_algo.hamiltonian_cycle_search()
+
+    assert mrv_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    if mrv_algo.hc_found:
+        assert mrv_algo.first_hc in dfs_algo.all_hc
+        assert mrv_algo.permutation_counter <= dfs_algo.permutation_counter
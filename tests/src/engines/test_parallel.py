@@ -0,0 +1,175 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import threading
+import os
+import math
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.engines.parallel import split_prefixes, search_subtree
+from hamiltoniansports.src.api.models import SeasonResults
+
+
+def parallel_algo(season_results: SeasonResults, objective: str, pool: bool) -> Algo:
+    """helper to create a parallel engine Algo, with the process pool forced on or off"""
+    algo = Algo(seasonresults=season_results, engine="parallel", objective=objective)
+    algo.enginecreator.engine.parallel_min_teams = 2 if pool else 1000
+    algo.enginecreator.engine.workers = 2
+    algo.enginecreator.engine.split_depth = 3
+    return algo
+
+
+def test_split_prefixes():
+    """prefixes in dfs order, cut by forward checking, with the complete graph on 4 teams"""
+    defeated = [0b1110, 0b1101, 0b1011, 0b0111]
+    neighbours = [[1, 2, 3], [0, 2, 3], [0, 1, 3], [0, 1, 2]]
+    prefixes, counter, pruned = split_prefixes(neighbours, defeated, defeated, 3)
+    assert prefixes == [
+        [0, 1, 2],
+        [0, 1, 3],
+        [0, 2, 1],
+        [0, 2, 3],
+        [0, 3, 1],
+        [0, 3, 2],
+    ]
+    assert counter == 9 and pruned == 0
+    # nothing ever defeated team 0, so there is nothing to split
+    defeated = [0b1110, 0b1100, 0b1010, 0b0110]
+    defeated_by = [0b0000, 0b0001, 0b1011, 0b0111]
+    assert split_prefixes(neighbours, defeated, defeated_by, 3) == ([], 0, 1)
+
+
+class EagerScheduler:
+    """stands in for the StealingScheduler, always finding an idle worker to give work to"""
+
+    interval = 1
+
+    def __init__(self) -> None:
+        self.cancel = threading.Event()
+        self.given: list = []
+
+    def hungry(self) -> bool:
+        return True
+
+    def submit(self, tasks: list) -> None:
+        self.given.extend(tasks)
+
+
+def test_search_subtree_gives_away_work():
+    """the tasks given away and the rest of the search together find every cycle exactly once"""
+    nteams = 7
+    defeated = [((1 << nteams) - 1) ^ (1 << i) for i in range(nteams)]
+    neighbours = [[j for j in range(nteams) if j != i] for i in range(nteams)]
+    edge_rank = [[i * nteams + j for j in range(nteams)] for i in range(nteams)]
+    graph = (neighbours, defeated, defeated, edge_rank)
+    serial = search_subtree(([0], None), graph, True, False)
+
+    scheduler = EagerScheduler()
+    results = [search_subtree(([0], None), graph, True, False, scheduler)]
+    while scheduler.given:
+        results.append(search_subtree(scheduler.given.pop(), graph, True, False))
+    assert len(results) > 2
+    cycles = sorted(cycle for r in results for cycle in r[0])
+    assert cycles == sorted(serial[0]) and len(cycles) == math.factorial(nteams - 1)
+    assert sum(r[3] for r in results) == serial[3]
+    assert min(r[2] for r in results if r[2]) == serial[2]
+
+    # cancelled searches stop at the next check
+    scheduler = EagerScheduler()
+    scheduler.cancel.set()
+    assert search_subtree(([0], None), graph, True, False, scheduler)[1] == 0
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_parallel_stealing(random_season_results, seed: int):
+    """seeded with a single prefix, so any sharing out is through idle workers taking work"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=seed)
+    pruned_algo = Algo(seasonresults=season_results, engine="pruned")
+    pruned_algo.hamiltonian_cycle_search()
+    algo = parallel_algo(season_results, "earliest", True)
+    algo.enginecreator.engine.split_depth = 1
+    algo.enginecreator.engine.steal_interval = 1
+    algo.hamiltonian_cycle_search()
+
+    assert algo.all_hc == pruned_algo.all_hc
+    assert algo.permutation_counter == pruned_algo.permutation_counter
+
+
+@pytest.mark.parametrize("pool", [False, True])
+@pytest.mark.parametrize("seed", range(6))
+def test_parallel_matches_dfs(random_season_results, seed: int, pool: bool):
+    """the same cycles, in the same order and dates are found as the original dfs"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    algo = parallel_algo(season_results, "earliest", pool)
+    algo.hamiltonian_cycle_search()
+
+    assert algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert algo.first_hc == dfs_algo.first_hc
+    assert algo.all_hc == dfs_algo.all_hc
+
+
+@pytest.mark.parametrize("pool", [False, True])
+@pytest.mark.parametrize("seed", range(6))
+def test_parallel_count(random_season_results, seed: int, pool: bool):
+    """only counts and the earliest cycle of each subtree are sent back, giving the same totals"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    pruned_algo = Algo(seasonresults=season_results, engine="pruned", objective="count")
+    pruned_algo.hamiltonian_cycle_search()
+    algo = parallel_algo(season_results, "count", pool)
+    algo.hamiltonian_cycle_search()
+
+    assert algo.total_hc_found == pruned_algo.total_hc_found
+    assert algo.date_of_first_hc == pruned_algo.date_of_first_hc
+    assert algo.permutation_counter == pruned_algo.permutation_counter
+    assert algo.pruned_counter == pruned_algo.pruned_counter
+    assert algo.all_hc == []
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_parallel_exists(random_season_results, seed: int):
+    """the first subtree to finish with a cycle stops the search, in the same round"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    algo = parallel_algo(season_results, "exists", True)
+    algo.hamiltonian_cycle_search()
+
+    assert algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    if algo.hc_found:
+        assert algo.first_hc in dfs_algo.all_hc
+
+
+@pytest.mark.parametrize("pool", [False, True])
+def test_parallel_budget(random_season_results, pool: bool):
+    """the workers' searches are stopped once their counts between them run out the budget"""
+    season_results = random_season_results(nteams=9, nrounds=12, seed=0)
+    algo = Algo(seasonresults=season_results, engine="parallel", round_nodes=20)
+    algo.enginecreator.engine.parallel_min_teams = 2 if pool else 1000
+    algo.enginecreator.engine.workers = 2
+    algo.enginecreator.engine.split_depth = 3
+    algo.enginecreator.engine.steal_interval = 10
+    algo.hamiltonian_cycle_search()
+
+    summary = algo.hc_season_summary["2022"]
+    assert not summary["Exhaustive"]
+    assert summary["Budget_Exhausted"] == "round_nodes"
+    if not pool:
+        # searched in process, which stops exactly on the budget
+        assert algo.round_permutation_tracker[-1] == 20
+
+
+def test_parallel_worker_death(random_season_results, monkeypatch):
+    """a worker dying part way through its task fails the search, rather than leaving it waiting forever"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=0)
+    algo = parallel_algo(season_results, "earliest", True)
+    engine_module = sys.modules[type(algo.enginecreator.engine).__module__]
+    # the workers are forked from the parent, so take the patched search with them
+    monkeypatch.setattr(engine_module, "search_subtree", lambda *args: os._exit(1))
+    with pytest.raises(RuntimeError):
+        algo.hamiltonian_cycle_search()
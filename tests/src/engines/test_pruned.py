@@ -0,0 +1,74 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.engines.pruned import forward_check
+
+
+def test_forward_check():
+    """each of the cut conditions on a small graph, bit positions 0..3"""
+    # 0 -> 1 -> 2 -> 3 -> 0, plus 0 -> 2
+    defeated = [0b0110, 0b0100, 0b1000, 0b0001]
+    defeated_by = [0b1000, 0b0001, 0b0011, 0b0100]
+    full = 0b1111
+    # start, and the path 0 -> 1 can both be completed
+    assert forward_check(0, 0b0001, full, defeated, defeated_by)
+    assert forward_check(1, 0b0011, full, defeated, defeated_by)
+    # path 0 -> 2 leaves team 1 unreachable
+    assert not forward_check(2, 0b0101, full, defeated, defeated_by)
+    # a complete path is always left for the closing check
+    assert forward_check(3, full, full, defeated, defeated_by)
+
+    # 0 -> 1, 1 -> 2, 2 -> 1, 1 -> 0: team 2 can be entered and left, but the start is only
+    # reachable through team 1, which is already on the path 0 -> 1
+    defeated = [0b010, 0b101, 0b010]
+    defeated_by = [0b010, 0b101, 0b010]
+    assert not forward_check(1, 0b011, 0b111, defeated, defeated_by)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_pruned_matches_dfs(random_season_results, seed: int):
+    """only cycle-free branches are cut, so the same cycles are found in the same order as the original dfs"""
+    season_results = random_season_results(nteams=8, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    pruned_algo = Algo(seasonresults=season_results, engine="pruned")
+    pruned_algo.hamiltonian_cycle_search()
+
+    assert pruned_algo.first_hc == dfs_algo.first_hc
+    assert pruned_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+    assert pruned_algo.all_hc == dfs_algo.all_hc
+    assert pruned_algo.round_hc_tracker == dfs_algo.round_hc_tracker
+    assert pruned_algo.permutation_counter <= dfs_algo.permutation_counter
+    assert dfs_algo.pruned_counter == 0
+
+
+def test_pruned_summary(random_season_results):
+    """the branches cut are reported next to the permutations"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=2)
+    algo = Algo(seasonresults=season_results, engine="pruned")
+    algo.hamiltonian_cycle_search()
+    assert algo.pruned_counter > 0
+    assert algo.hc_season_summary["2022"]["Pruned"] == algo.pruned_counter
+
+
+@pytest.mark.parametrize("memo_entries", [10, 100000])
+@pytest.mark.parametrize("seed", range(6))
+def test_pruned_memo(random_season_results, seed: int, memo_entries: int):
+    """dead states are skipped, however small the memo, without changing the cycles found"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=seed)
+    pruned_algo = Algo(seasonresults=season_results, engine="pruned")
+    pruned_algo.hamiltonian_cycle_search()
+    memo_algo = Algo(
+        seasonresults=season_results, engine="pruned", memo_entries=memo_entries
+    )
+    memo_algo.hamiltonian_cycle_search()
+
+    assert memo_algo.all_hc == pruned_algo.all_hc
+    assert memo_algo.round_hc_tracker == pruned_algo.round_hc_tracker
+    assert memo_algo.permutation_counter <= pruned_algo.permutation_counter
+    assert len(memo_algo.transposition.states) <= memo_entries
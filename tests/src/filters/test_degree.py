@@ -0,0 +1,101 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import random
+from hamiltoniansports.src.filters.degree import (
+    graph_bitmasks,
+    degree_condition,
+    camion_cycle,
+    construct_cycle,
+)
+
+
+def is_hamiltonian_cycle(cycle: list[int], defeated: list[int]) -> bool:
+    nteams = len(defeated)
+    return sorted(cycle) == list(range(nteams)) and all(
+        defeated[cycle[i]] >> cycle[(i + 1) % nteams] & 1 for i in range(nteams)
+    )
+
+
+def test_graph_bitmasks():
+    """bit positions follow the order of the graph"""
+    team_ids, defeated = graph_bitmasks({7: {3}, 3: {5}, 5: {7, 3}})
+    assert team_ids == [7, 3, 5]
+    assert defeated == [0b010, 0b100, 0b011]
+
+
+def test_degree_condition():
+    """the theorem holding, if any, for graphs either side of the conditions"""
+    # a directed cycle has every degree 2, and the teams two apart yet to play
+    assert degree_condition([0b0010, 0b0100, 0b1000, 0b0001]) is None
+    # a cycle played both ways, every degree 4 >= V with the teams two apart yet to play
+    assert degree_condition([0b1010, 0b0101, 0b1010, 0b0101]) == "ghouila-houri"
+    # 1 and 3 yet to play, with 7 wins plus losses between them, though 3 only has 3
+    assert degree_condition([0b0110, 0b0101, 0b1010, 0b0101]) == "meyniel"
+    # every pair having played once, a strongly connected tournament
+    assert degree_condition([0b010, 0b100, 0b001]) == "camion"
+    # 0 and 2 yet to play, with 3 wins plus losses between them, short of 2V - 1
+    assert degree_condition([0b0010, 0b1100, 0b1000, 0b0011]) is None
+    # every pair has played, but 0 has never lost, so no cycle at all
+    assert degree_condition([0b110, 0b100, 0b000]) is None
+    assert degree_condition([0]) is None
+
+
+def test_camion_cycle():
+    """a hamiltonian cycle of every strongly connected tournament, and None for those that aren't"""
+    rng = random.Random(0)
+    for _ in range(300):
+        nteams = rng.randrange(2, 16)
+        defeated = [0] * nteams
+        for u in range(nteams):
+            for v in range(u + 1, nteams):
+                if rng.random() < 0.5:
+                    defeated[u] |= 1 << v
+                else:
+                    defeated[v] |= 1 << u
+                # the occasional pair having played both ways, as teams can meet twice a season
+                if rng.random() < 0.1:
+                    defeated[u] |= 1 << v
+                    defeated[v] |= 1 << u
+        cycle = camion_cycle(defeated)
+        if degree_condition(defeated) == "camion":
+            assert cycle is not None and cycle[0] == 0
+            assert is_hamiltonian_cycle(cycle, defeated)
+        else:
+            assert cycle is None
+
+    # 2 lost to 0 and 1, but defeated 3 which defeated them both, so both are inserted together
+    defeated = [0b0110, 0b0101, 0b1000, 0b0011]
+    assert degree_condition(defeated) == "camion"
+    assert is_hamiltonian_cycle(camion_cycle(defeated), defeated)
+
+
+def test_construct_cycle():
+    """every graph the degree theorems cover that a cycle is constructed for, it's a hamiltonian cycle"""
+    rng = random.Random(0)
+    constructed = 0
+    for _ in range(300):
+        nteams = rng.randrange(3, 12)
+        density = rng.uniform(0.5, 1.0)
+        defeated = [0] * nteams
+        for w in range(nteams):
+            for l in range(nteams):
+                if w != l and rng.random() < density:
+                    defeated[w] |= 1 << l
+        if degree_condition(defeated) is None:
+            continue
+        cycle = construct_cycle(defeated)
+        if cycle is not None:
+            constructed += 1
+            assert cycle[0] == 0
+            assert is_hamiltonian_cycle(cycle, defeated)
+    assert constructed > 0
+
+    # the rotational tournament, each team beating the next two, the shortest cycle through 0 skips 1 and 4
+    defeated = [sum(1 << (t + k) % 5 for k in (1, 2)) for t in range(5)]
+    assert degree_condition(defeated) == "camion"
+    cycle = construct_cycle(defeated)
+    assert cycle is not None and is_hamiltonian_cycle(cycle, defeated)
@@ -0,0 +1,81 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import random
+from hamiltoniansports.src.filters.matching import (
+    hopcroft_karp,
+    augment_from,
+    hall_violator,
+    CycleCoverFilter,
+)
+from hamiltoniansports.src.filters.scc import SCCFilter
+
+
+def test_hopcroft_karp():
+    """maximum matchings of random graphs, checked against Hall violators where they aren't perfect"""
+    rng = random.Random(0)
+    for _ in range(200):
+        nteams = rng.randrange(1, 12)
+        defeated = [
+            sum(1 << l for l in range(nteams) if l != w and rng.random() < 0.25)
+            for w in range(nteams)
+        ]
+        full = (1 << nteams) - 1
+        match_left, match_right = hopcroft_karp(defeated, full, full)
+        for w, l in enumerate(match_left):
+            if l != -1:
+                assert defeated[w] >> l & 1
+                assert match_right[l] == w
+        matched = nteams - match_left.count(-1)
+
+        violator = hall_violator(defeated, full, full)
+        if matched == nteams:
+            assert violator == 0
+        else:
+            neighbours = 0
+            for w in range(nteams):
+                if violator >> w & 1:
+                    neighbours |= defeated[w]
+            assert neighbours.bit_count() < violator.bit_count()
+
+
+def test_augment_from():
+    """an unmatched team is matched along an alternating path, or not at all"""
+    # 0 -> {1}, 1 -> {1, 2}, with 1 -> 1 matched, so 0 can only be matched by moving 1 on to 2
+    defeated = [0b010, 0b110, 0b000]
+    match_left = [-1, 1, -1]
+    match_right = [-1, 1, -1]
+    assert augment_from(defeated, 0, 0b110, match_left, match_right)
+    assert match_left == [1, 2, -1]
+    assert match_right == [-1, 0, 1]
+    # without 2 there's nowhere left to move to
+    match_left = [-1, 1, -1]
+    match_right = [-1, 1, -1]
+    assert not augment_from(defeated, 0, 0b010, match_left, match_right)
+    assert match_left == [-1, 1, -1]
+
+
+def test_cycle_cover_filter():
+    """a strongly connected graph without a cycle cover is rejected, with the teams blocking it"""
+    # teams 1, 2 and 3 only defeated teams 4 and 5 between them
+    graph = {1: {4, 5}, 2: {4}, 3: {5}, 4: {1, 2, 3}, 5: {1, 2, 3}}
+    sccfilter = SCCFilter()
+    sccfilter.update(graph)
+    assert sccfilter.strongly_connected
+
+    coverfilter = CycleCoverFilter()
+    assert not coverfilter.check(graph)
+    assert coverfilter.violator == [1, 2, 3]
+    assert (
+        coverfilter.reason(graph)
+        == "no cycle cover, teams [1, 2, 3] only defeated teams [4, 5] between them"
+    )
+
+    # once 3 has defeated 2, 1 -> 5 -> 3 -> 2 -> 4 -> 1
+    graph[3].add(2)
+    assert coverfilter.check(graph)
+    assert coverfilter.violator == []
+    assert coverfilter.checks == 2
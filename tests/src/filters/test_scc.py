@@ -0,0 +1,80 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+from hamiltoniansports.src.filters.scc import strongly_connected_components, SCCFilter
+
+
+def test_strongly_connected_components():
+    """two cycles joined by a single edge are two components, the sink component first"""
+    graph = {1: {2}, 2: {3}, 3: {1, 4}, 4: {5}, 5: {4}}
+    components = strongly_connected_components(graph)
+    assert [sorted(component) for component in components] == [[4, 5], [1, 2, 3]]
+
+    # a single cycle through everything is one component
+    graph = {1: {2}, 2: {3}, 3: {4}, 4: {5}, 5: {1}}
+    assert [sorted(c) for c in strongly_connected_components(graph)] == [
+        [1, 2, 3, 4, 5]
+    ]
+
+    # no edges, every team on its own
+    assert len(strongly_connected_components({1: set(), 2: set()})) == 2
+
+
+def test_strongly_connected_components_deep():
+    """no recursion, so long chains are fine"""
+    nteams = sys.getrecursionlimit() * 2
+    graph = {team: {(team + 1) % nteams} for team in range(nteams)}
+    assert len(strongly_connected_components(graph)) == 1
+
+
+def test_scc_filter_only_recomputes_across_components():
+    """edges within a component do not trigger recomputation"""
+    graph = {1: {2}, 2: {1}, 3: set()}
+    sccfilter = SCCFilter()
+    assert not sccfilter.strongly_connected
+    sccfilter.update(graph)
+    assert sccfilter.recomputations == 1
+    assert not sccfilter.strongly_connected
+    assert sccfilter.reason(graph) == "teams [3] yet to win"
+
+    # already in the same component, nothing to do
+    sccfilter.add_edge(2, 1)
+    sccfilter.update(graph)
+    assert sccfilter.recomputations == 1
+
+    graph[2].add(3)
+    sccfilter.add_edge(2, 3)
+    sccfilter.update(graph)
+    assert sccfilter.recomputations == 2
+    assert not sccfilter.strongly_connected
+
+    graph[3].add(1)
+    sccfilter.add_edge(3, 1)
+    sccfilter.update(graph)
+    assert sccfilter.recomputations == 3
+    assert sccfilter.strongly_connected
+
+    # strongly connected stays strongly connected
+    graph[3].add(2)
+    sccfilter.add_edge(3, 2)
+    sccfilter.update(graph)
+    assert sccfilter.recomputations == 3
+
+
+def test_scc_filter_reasons():
+    """the most specific reason is given for a skipped round"""
+    sccfilter = SCCFilter()
+    graph = {1: {2}, 2: {3}, 3: {2}}
+    sccfilter.update(graph)
+    assert sccfilter.reason(graph) == "teams [1] yet to lose"
+
+    # everyone has won and lost, but nobody in 3/4 has beaten 1/2
+    graph = {1: {2, 3}, 2: {1}, 3: {4}, 4: {3}, 5: {4, 6}, 6: {1, 5}}
+    sccfilter = SCCFilter()
+    sccfilter.update(graph)
+    assert sccfilter.reason(graph) == (
+        "victory graph not strongly connected, 3 components of sizes [2, 2, 2]"
+    )
@@ -0,0 +1,68 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from hamiltoniansports.src.filters.transposition import TranspositionTable
+
+
+def test_transposition_table():
+    """dead states are found again, with hits and misses counted"""
+    table = TranspositionTable(max_entries=10)
+    assert table.hit_rate is None
+    assert not table.dead(0b0111, 2)
+    table.add(0b0111, 2)
+    assert table.dead(0b0111, 2)
+    # same visited set, different team
+    assert not table.dead(0b0111, 1)
+    assert (table.hits, table.misses) == (1, 2)
+    assert table.hit_rate == pytest.approx(1 / 3)
+
+    # cleared states are forgotten, but the counts are kept
+    table.clear()
+    assert not table.dead(0b0111, 2)
+    assert (table.hits, table.misses) == (1, 3)
+
+
+def test_transposition_table_lru():
+    """the least recently used state is evicted once full"""
+    table = TranspositionTable(max_entries=2)
+    table.add(0b011, 1)
+    table.add(0b101, 2)
+    # using the first state makes the second the least recently used
+    assert table.dead(0b011, 1)
+    table.add(0b111, 2)
+    assert table.evictions == 1
+    assert table.dead(0b011, 1)
+    assert table.dead(0b111, 2)
+    assert not table.dead(0b101, 2)
+
+
+def test_transposition_table_limits():
+    """bounded by entries or bytes, whichever is smaller, and must be bounded"""
+    assert TranspositionTable(max_entries=5).capacity == 5
+    assert (
+        TranspositionTable(max_bytes=TranspositionTable.ENTRY_BYTES * 7).capacity == 7
+    )
+    assert (
+        TranspositionTable(
+            max_entries=3, max_bytes=TranspositionTable.ENTRY_BYTES * 7
+        ).capacity
+        == 3
+    )
+    with pytest.raises(ValueError):
+        TranspositionTable()
+    with pytest.raises(ValueError):
+        TranspositionTable(max_bytes=1)
+
+
+def test_transposition_table_many_teams():
+    """states of competitions beyond 64 teams are kept apart"""
+    table = TranspositionTable(max_entries=10)
+    table.add(0b10, 64)
+    assert table.dead(0b10, 64)
+    # would share a key if the team was packed into the low 6 bits of the visited bitmask
+    assert not table.dead(0b11, 0)
+    assert not table.dead(1 << 70 | 1, 70)
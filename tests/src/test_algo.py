@@ -6,12 +6,14 @@ sys.path.append("hamiltoniansports")
 
 import pytest
 import json
+import logging
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 from unittest.mock import MagicMock, patch, PropertyMock
 from hamiltoniansports.src.algo import Algo
 from hamiltoniansports.src.api.models import Team, GameResult, SeasonResults
+from hamiltoniansports.utils.config import Config
 
 
 class DummyResults:
@@ -94,11 +96,13 @@ def test_algo_initial_values():
     # assert default types
     assert isinstance(algo.adjacency_graph, defaultdict)
     assert isinstance(algo.result_detail, dict)
+    assert isinstance(algo.round_new_edges, list)
     assert isinstance(algo.first_hc, list)
     assert isinstance(algo.date_of_first_hc, datetime)
     assert isinstance(algo.all_hc, list)
     assert isinstance(algo.round_hc_tracker, list)
     assert isinstance(algo.permutation_counter, int)
+    assert isinstance(algo.pruned_counter, int)
     assert isinstance(algo.round_permutation_tracker, list)
     assert isinstance(algo.algo_seconds_runtime, float)
     assert isinstance(algo.total_hc_found, int)
@@ -111,15 +115,23 @@ def test_algo_initial_values():
     # assert empty/falsey initial values
     assert not algo.adjacency_graph
     assert not algo.result_detail
+    assert not algo.round_new_edges
     assert not algo.first_hc
     assert not algo.all_hc
     assert not algo.round_hc_tracker
     assert not algo.permutation_counter
+    assert not algo.pruned_counter
     assert not algo.round_permutation_tracker
     assert not algo.total_hc_found
     assert not algo.round_of_first_hc
     assert not algo.hc_found
     assert not algo.first_hc_team_names
+    # the memo is off unless asked for
+    assert algo.transposition is None
+    assert algo.hc_season_summary["2022"]["Memo_Hit_Rate"] is None
+    # no budgets unless asked for
+    assert not algo.budget.limits
+    assert algo.hc_season_summary["2022"]["Exhaustive"]
 
     # assert non empty / falsey initial values
     assert algo.date_of_first_hc == datetime(year=2999, month=12, day=31)
@@ -145,6 +157,8 @@ def test_successful_hamiltonian_cycle_search():
     assert algo.permutation_counter > 0
     assert len(algo.round_permutation_tracker) == algo.seasonresults.nrounds
     assert algo.round_permutation_tracker == [0, 0, 3]
+    assert algo.round_new_edges == [[(1, 2)], [(1, 3), (2, 3)], [(3, 1)]]
+    assert algo.sccfilter.strongly_connected
     assert algo.algo_seconds_runtime > 0
     assert algo.total_hc_found == 1
     assert algo.round_of_first_hc == 3
@@ -168,9 +182,11 @@ def test_unsuccessful_hamiltonian_cycle_search():
     assert not algo.all_hc
     assert len(algo.round_hc_tracker) == algo.seasonresults.nrounds
     assert algo.round_hc_tracker == [0] * algo.seasonresults.nrounds
-    assert algo.permutation_counter > 0
+    # team 1 never loses, so the graph is never strongly connected and no search is needed
+    assert algo.permutation_counter == 0
     assert len(algo.round_permutation_tracker) == algo.seasonresults.nrounds
-    assert algo.round_permutation_tracker == [0, 0, 4]
+    assert algo.round_permutation_tracker == [0, 0, 0]
+    assert not algo.sccfilter.strongly_connected
     assert not algo.total_hc_found
     assert not algo.round_of_first_hc
     assert not algo.hc_found
@@ -180,6 +196,366 @@ def test_unsuccessful_hamiltonian_cycle_search():
     )
 
 
+def test_invalid_objective():
+    """objectives are validated when the algo is created"""
+    dr_positive = DummyResults(positive_case=True)
+    with pytest.raises(ValueError):
+        Algo(seasonresults=dr_positive.season_results, objective="invalid_objective")
+
+
+@pytest.mark.parametrize(
+    "engine,objective",
+    [
+        ("dp", "count"),
+        ("dp", "earliest"),
+        ("bottleneck", "enumerate"),
+        ("mitm", "enumerate"),
+    ],
+)
+def test_unsupported_engine_objective(engine, objective):
+    """engines only search for the objectives they can meet (Config.engine_objectives)"""
+    dr_positive = DummyResults(positive_case=True)
+    with pytest.raises(ValueError):
+        Algo(
+            seasonresults=dr_positive.season_results, engine=engine, objective=objective
+        )
+
+
+def test_exists_objective_stops_at_first_cycle():
+    """the search stops as soon as any cycle is found, and the counters still reflect the work done"""
+    dr_positive = DummyResults(positive_case=True)
+    algo = Algo(seasonresults=dr_positive.season_results, objective="exists")
+    # 1 also defeats 3 in reverse, so there is more than one cycle in round 3
+    algo.adjacency_graph = {1: {2, 3}, 2: {1, 3}, 3: {1, 2}}
+    for w, l in [(2, 1), (3, 2)]:
+        algo.result_detail.setdefault(w, {})[l] = dr_positive.game_result4
+    algo.result_detail.setdefault(1, {}).update(
+        {2: dr_positive.game_result1, 3: dr_positive.game_result2}
+    )
+    algo.result_detail.setdefault(2, {})[3] = dr_positive.game_result3
+    algo.result_detail.setdefault(3, {})[1] = dr_positive.game_result4
+    algo._find_hamiltonian_cycle(hc_length_target=3)
+
+    assert algo.hc_found
+    assert algo.total_hc_found == 1
+    assert len(algo.all_hc) == 1
+    assert algo.permutation_counter == 2
+
+
+def test_count_objective():
+    """cycles are counted without being kept"""
+    dr_positive = DummyResults(positive_case=True)
+    algo = Algo(seasonresults=dr_positive.season_results, objective="count")
+    algo.hamiltonian_cycle_search()
+
+    assert algo.first_hc == [1, 2, 3]
+    assert algo.date_of_first_hc == datetime(year=2022, month=11, day=11)
+    assert not algo.all_hc
+    assert algo.total_hc_found == 1
+    assert algo.round_hc_tracker == [0, 0, 1]
+    assert algo.hc_season_summary["2022"]["Objective"] == "count"
+
+
+def test_memo_summary():
+    """hits and misses of the memo are reported in the summary"""
+    dr_positive = DummyResults(positive_case=True)
+    algo = Algo(
+        seasonresults=dr_positive.season_results, engine="bitmask", memo_entries=100
+    )
+    algo.hamiltonian_cycle_search()
+
+    summary = algo.hc_season_summary["2022"]
+    assert algo.first_hc == [1, 2, 3]
+    assert summary["Memo_Hits"] == algo.transposition.hits
+    assert summary["Memo_Misses"] == algo.transposition.misses > 0
+    assert summary["Memo_Hit_Rate"] == algo.transposition.hit_rate
+
+
+@pytest.mark.parametrize("engine,warned", [("dfs", True), ("pruned", False)])
+def test_memo_unused_warning(engine: str, warned: bool):
+    """asking for the memo with an engine that doesn't use it is warned about, rather than silently ignored"""
+    dr_positive = DummyResults(positive_case=True)
+    with patch.object(logging.getLogger("main"), "warning") as mock_warning:
+        Algo(seasonresults=dr_positive.season_results, engine=engine, memo_entries=100)
+    assert mock_warning.called == warned
+
+
+def test_enumerate_objective(tmp_path: Path):
+    """every cycle of every round is streamed to file, continuing past the first round with a cycle"""
+    dr_positive = DummyResults(positive_case=True)
+    # an extra round, which adds a second cycle
+    dr_positive.season_results.round_results[4] = [
+        GameResult(
+            winner=2,
+            loser=1,
+            round=4,
+            winner_score=3,
+            loser_score=2,
+            dt=datetime(year=2022, month=12, day=1),
+        ),
+        GameResult(
+            winner=3,
+            loser=2,
+            round=4,
+            winner_score=3,
+            loser_score=2,
+            dt=datetime(year=2022, month=12, day=2),
+        ),
+    ]
+    algo = Algo(
+        seasonresults=dr_positive.season_results,
+        engine="incremental",
+        objective="enumerate",
+    )
+    stream_file = tmp_path / "all_hc.jsonl"
+    with patch.object(
+        Algo, "all_hc_stream_file", new_callable=PropertyMock
+    ) as mock_stream_file:
+        mock_stream_file.return_value = stream_file
+        algo.hamiltonian_cycle_search()
+
+    assert algo.first_hc == [1, 2, 3]
+    assert not algo.all_hc
+    assert algo.round_hc_tracker == [0, 0, 1, 2]
+    assert algo.round_of_first_hc == 3
+    streamed = [json.loads(line) for line in stream_file.read_text().splitlines()]
+    assert streamed == [
+        {"Round": 3, "HC": [1, 2, 3], "HC_Date": "2022-11-11 00:00:00"},
+        {"Round": 4, "HC": [1, 3, 2], "HC_Date": "2022-12-02 00:00:00"},
+    ]
+
+
+def enumerate_season(season_results: SeasonResults, engine: str, stream_file: Path):
+    """helper to run the enumerate objective, returning the algo and the cycles streamed by round"""
+    algo = Algo(seasonresults=season_results, engine=engine, objective="enumerate")
+    with patch.object(
+        Algo, "all_hc_stream_file", new_callable=PropertyMock
+    ) as mock_stream_file:
+        mock_stream_file.return_value = stream_file
+        algo.hamiltonian_cycle_search()
+    streamed = [json.loads(line) for line in stream_file.read_text().splitlines()]
+    return algo, sorted((s["Round"], s["HC"], s["HC_Date"]) for s in streamed)
+
+
+@pytest.mark.parametrize(
+    "engine",
+    [
+        e
+        for e, objectives in Config.engine_objectives.items()
+        if "enumerate" in objectives
+    ],
+)
+def test_enumerate_every_engine(random_season_results, engine: str, tmp_path: Path):
+    """each cycle is streamed once, in the round it became apparent, whichever engine finds it"""
+    season_results = random_season_results(nteams=8, nrounds=14, seed=3)
+    dfs_algo, dfs_streamed = enumerate_season(
+        season_results, "dfs", tmp_path / "dfs.jsonl"
+    )
+    algo, streamed = enumerate_season(season_results, engine, tmp_path / "all_hc.jsonl")
+
+    # cycles are apparent in more than one round of the season
+    assert len({s[0] for s in dfs_streamed}) > 1
+    assert streamed == dfs_streamed
+    assert algo.round_hc_tracker == dfs_algo.round_hc_tracker
+    assert algo.total_hc_found == dfs_algo.total_hc_found == len(dfs_streamed)
+    assert algo.first_hc == dfs_algo.first_hc
+
+
+def test_checkpoint_resume_between_rounds(tmp_path: Path):
+    """a search interrupted after a round picks up from the next round, streaming the same cycles"""
+    dr_positive = DummyResults(positive_case=True)
+    dr_positive.season_results.round_results[4] = [
+        GameResult(
+            winner=2,
+            loser=1,
+            round=4,
+            winner_score=3,
+            loser_score=2,
+            dt=datetime(year=2022, month=12, day=1),
+        ),
+        GameResult(
+            winner=3,
+            loser=2,
+            round=4,
+            winner_score=3,
+            loser_score=2,
+            dt=datetime(year=2022, month=12, day=2),
+        ),
+    ]
+    checkpoint_file = tmp_path / "checkpoint.json"
+    stream_file = tmp_path / "all_hc.jsonl"
+    with patch.object(
+        Algo, "checkpoint_file", new_callable=PropertyMock
+    ) as mock_checkpoint_file, patch.object(
+        Algo, "all_hc_stream_file", new_callable=PropertyMock
+    ) as mock_stream_file:
+        mock_checkpoint_file.return_value = checkpoint_file
+        mock_stream_file.return_value = stream_file
+
+        interrupted_algo = Algo(
+            seasonresults=dr_positive.season_results,
+            engine="incremental",
+            objective="enumerate",
+            checkpoint=True,
+        )
+        find_hamiltonian_cycle = interrupted_algo._find_hamiltonian_cycle
+
+        def interrupt_in_round_4(*args, **kwargs):
+            if interrupted_algo.cur_round == 4:
+                raise KeyboardInterrupt
+            find_hamiltonian_cycle(*args, **kwargs)
+
+        interrupted_algo._find_hamiltonian_cycle = interrupt_in_round_4
+        with pytest.raises(KeyboardInterrupt):
+            interrupted_algo.hamiltonian_cycle_search()
+        saved = json.loads(checkpoint_file.read_text())
+        assert saved["Rounds_Completed"] == 3
+        assert saved["Search"] is None
+
+        # a different engine cannot pick the search up
+        with pytest.raises(ValueError):
+            Algo(
+                seasonresults=dr_positive.season_results,
+                engine="dfs",
+                objective="enumerate",
+                resume=True,
+            ).hamiltonian_cycle_search()
+
+        algo = Algo(
+            seasonresults=dr_positive.season_results,
+            engine="incremental",
+            objective="enumerate",
+            resume=True,
+        )
+        algo.hamiltonian_cycle_search()
+
+    assert algo.first_hc == [1, 2, 3]
+    assert algo.round_hc_tracker == [0, 0, 1, 2]
+    assert algo.round_new_edges == [
+        [(1, 2)],
+        [(1, 3), (2, 3)],
+        [(3, 1)],
+        [(2, 1), (3, 2)],
+    ]
+    assert not checkpoint_file.is_file()
+    streamed = [json.loads(line) for line in stream_file.read_text().splitlines()]
+    assert streamed == [
+        {"Round": 3, "HC": [1, 2, 3], "HC_Date": "2022-11-11 00:00:00"},
+        {"Round": 4, "HC": [1, 3, 2], "HC_Date": "2022-12-02 00:00:00"},
+    ]
+
+
+def test_budget_partial_result():
+    """running out of budget stops the search cleanly, keeping the partial result"""
+    dr_positive = DummyResults(positive_case=True)
+    algo = Algo(
+        seasonresults=dr_positive.season_results, engine="bitmask", round_nodes=1
+    )
+    algo.hamiltonian_cycle_search()
+
+    summary = algo.hc_season_summary["2022"]
+    assert not algo.hc_found
+    assert algo.permutation_counter == 1
+    # stopped in round 3, the first round a search was possible
+    assert algo.round_permutation_tracker == [0, 0, 1]
+    assert not summary["Exhaustive"]
+    assert summary["Budget"] == {"round_nodes": 1}
+    assert summary["Budget_Exhausted"] == "round_nodes"
+
+    # enough budget to finish, so the search is exhaustive
+    algo = Algo(
+        seasonresults=dr_positive.season_results, engine="bitmask", season_nodes=100
+    )
+    algo.hamiltonian_cycle_search()
+    assert algo.first_hc == [1, 2, 3]
+    assert algo.hc_season_summary["2022"]["Exhaustive"]
+    assert algo.hc_season_summary["2022"]["Budget_Exhausted"] is None
+
+
+@pytest.mark.parametrize("engine", Config.valid_engines)
+def test_budget_every_engine(random_season_results, engine: str):
+    """every engine stops once out of budget, rather than reporting a search it didn't finish as exhaustive"""
+    season_results = random_season_results(nteams=9, nrounds=12, seed=0)
+    objectives = Config.engine_objectives[engine]
+    algo = Algo(
+        seasonresults=season_results,
+        engine=engine,
+        objective="earliest" if "earliest" in objectives else objectives[0],
+        round_nodes=5,
+    )
+    algo.hamiltonian_cycle_search()
+
+    summary = algo.hc_season_summary["2022"]
+    assert not summary["Exhaustive"]
+    assert summary["Budget_Exhausted"] == "round_nodes"
+
+
+def test_fast_path():
+    """rounds the degree theorems guarantee a cycle are answered without a search, for exists and earliest"""
+    dr_positive = DummyResults(positive_case=True)
+    for objective in ["exists", "earliest"]:
+        algo = Algo(
+            seasonresults=dr_positive.season_results,
+            engine="bitmask",
+            objective=objective,
+            fast_path=True,
+        )
+        algo.hamiltonian_cycle_search()
+
+        assert algo.first_hc == [1, 2, 3]
+        assert algo.date_of_first_hc == datetime(year=2022, month=11, day=11)
+        # earliest only searches the games up to the date for the cycle dfs would keep
+        assert algo.permutation_counter == 0 or objective == "earliest"
+        # every pair has played in round 3, the tournament is strongly connected
+        assert algo.hc_season_summary["2022"]["HC_Certificates"] == {3: "camion"}
+
+    # count still has to search, the certificate is kept regardless
+    algo = Algo(
+        seasonresults=dr_positive.season_results, objective="count", fast_path=True
+    )
+    algo.hamiltonian_cycle_search()
+    assert algo.total_hc_found == 1
+    assert algo.permutation_counter > 0
+    assert algo.round_certificates == {3: "camion"}
+
+    # off by default
+    algo = Algo(seasonresults=dr_positive.season_results, engine="bitmask")
+    algo.hamiltonian_cycle_search()
+    assert algo.permutation_counter > 0
+    assert algo.round_certificates == {}
+
+
+@pytest.mark.parametrize("objective,answered", [("exists", True), ("count", False)])
+def test_fast_path_runtime(objective: str, answered: bool):
+    """checking the theorems counts towards the runtime, whether or not the round is answered by them"""
+    dr_positive = DummyResults(positive_case=True)
+    algo = Algo(
+        seasonresults=dr_positive.season_results, objective=objective, fast_path=True
+    )
+    algo.adjacency_graph = defaultdict(set, {1: {2}, 2: {3}, 3: {1}})
+    algo.cur_round = 3
+    with patch(
+        "hamiltoniansports.src.algo.time.perf_counter", side_effect=[10.0, 12.5]
+    ), patch.object(algo, "record_hc") as mock_record_hc:
+        assert algo.certificate_fast_path() == answered
+    assert mock_record_hc.called == answered
+    assert algo.algo_seconds_runtime == 2.5
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_fast_path_earliest_matches_dfs(random_season_results, seed: int):
+    """rounds answered by the fast path keep the cycle dfs would, of the many as early"""
+    season_results = random_season_results(nteams=5, nrounds=10, seed=seed)
+    dfs_algo = Algo(seasonresults=season_results, engine="dfs")
+    dfs_algo.hamiltonian_cycle_search()
+    fast_algo = Algo(seasonresults=season_results, engine="bitmask", fast_path=True)
+    fast_algo.hamiltonian_cycle_search()
+
+    assert fast_algo.round_of_first_hc == dfs_algo.round_of_first_hc
+    assert fast_algo.first_hc == dfs_algo.first_hc
+    assert fast_algo.date_of_first_hc == dfs_algo.date_of_first_hc
+
+
 def test_no_file():
     """test recording of the hamiltonian cycle search results if there is no
     output file existing using mocking.
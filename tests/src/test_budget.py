@@ -0,0 +1,76 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from unittest.mock import patch
+from hamiltoniansports.src.budget import SearchBudget, BudgetExhausted
+
+
+def test_unlimited():
+    """with no limits set the search is never stopped"""
+    budget = SearchBudget()
+    budget.start_season(permutation_counter=0)
+    budget.start_round(permutation_counter=0)
+    for counter in range(0, 10000, 7):
+        budget.check(counter)
+    assert budget.exhausted is None
+    assert not budget.limits
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        SearchBudget(round_nodes=0)
+    with pytest.raises(ValueError):
+        SearchBudget(season_seconds=-1)
+
+
+def test_node_budgets():
+    """the tightest of the round and season node limits stops the search"""
+    budget = SearchBudget(round_nodes=100, season_nodes=250)
+    budget.start_season(permutation_counter=50)
+    budget.start_round(permutation_counter=50)
+    budget.check(149)
+    with pytest.raises(BudgetExhausted) as be:
+        budget.check(150)
+    assert be.value.budget == "round_nodes"
+    assert be.value.limit == 100
+    assert budget.exhausted == "round_nodes"
+
+    # a later round, where the season limit is now the tighter
+    budget.start_round(permutation_counter=250)
+    with pytest.raises(BudgetExhausted) as be:
+        budget.check(300)
+    assert be.value.budget == "season_nodes"
+
+    # nothing left of the season before the round even starts
+    with pytest.raises(BudgetExhausted):
+        budget.start_round(permutation_counter=300)
+
+
+def test_time_budgets():
+    """the tightest of the round and season time limits stops the search"""
+    with patch("hamiltoniansports.src.budget.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 1000.0
+        budget = SearchBudget(round_seconds=10, season_seconds=15)
+        budget.start_season(permutation_counter=0)
+        budget.start_round(permutation_counter=0)
+        assert budget.deadline == 1010.0
+        assert budget.deadline_budget == "round_seconds"
+
+        mock_monotonic.return_value = 1009.0
+        budget.check(100)
+        mock_monotonic.return_value = 1011.0
+        with pytest.raises(BudgetExhausted) as be:
+            budget.check(200)
+        assert be.value.budget == "round_seconds"
+
+        budget.start_round(permutation_counter=0)
+        assert budget.deadline == 1015.0
+        assert budget.deadline_budget == "season_seconds"
+        mock_monotonic.return_value = 1015.0
+        with pytest.raises(BudgetExhausted) as be:
+            budget.check(0)
+        assert be.value.budget == "season_seconds"
@@ -0,0 +1,83 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+import random
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.estimator import knuth_estimate, SearchEstimator
+
+
+@pytest.mark.parametrize("nteams", [2, 5, 8])
+def test_knuth_estimate_exact_on_uniform_trees(nteams: int):
+    """when every node at a depth has the same number of children, every probe is exact"""
+    full = (1 << nteams) - 1
+    # every team defeated every other team
+    complete = [full & ~(1 << t) for t in range(nteams)]
+    nodes, width = 0, 1
+    for children in range(nteams - 1, 0, -1):
+        width *= children
+        nodes += width
+    assert knuth_estimate(complete, probes=3, rng=random.Random(0)) == nodes
+
+    # a single cycle through every team
+    cycle = [1 << (t + 1) % nteams for t in range(nteams)]
+    assert knuth_estimate(cycle, probes=3, rng=random.Random(0)) == nteams - 1
+
+
+def test_knuth_estimate_close_to_search(random_season_results):
+    """averaged over enough probes the estimate is close to the permutations the dfs actually takes"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=6)
+    algo = Algo(seasonresults=season_results, engine="bitmask", objective="count")
+    algo.hamiltonian_cycle_search()
+
+    estimator = SearchEstimator(probes=2000)
+    estimate = estimator.estimate(algo.adjacency_graph)
+    algo.permutation_counter = 0
+    algo._find_hamiltonian_cycle(hc_length_target=10)
+    assert 0.75 < estimate["Permutations"] / algo.permutation_counter < 1.25
+
+
+def test_estimates_by_round(random_season_results):
+    """each round searched is estimated beforehand, and kept in the summary"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=6)
+    algo = Algo(seasonresults=season_results, engine="bitmask", objective="count")
+    algo.hamiltonian_cycle_search()
+
+    estimates = algo.hc_season_summary["2022"]["Search_Estimates"]
+    assert estimates
+    assert set(estimates) <= set(season_results.rounds_list)
+    for estimate in estimates.values():
+        assert estimate["Permutations"] > 0
+        assert estimate["Seconds"] > 0
+
+
+def test_observed_rate():
+    """runtimes are estimated at the rate of the searches so far, once one is large enough to time"""
+    estimator = SearchEstimator()
+    default_rate = estimator.permutations_per_s
+    estimator.observe(permutations=10, seconds=1.0)
+    assert estimator.permutations_per_s == default_rate
+    estimator.observe(permutations=50000, seconds=0.5)
+    assert estimator.permutations_per_s == 100000
+    estimate = estimator.estimate({1: {2}, 2: {3}, 3: {1}})
+    assert estimate == {"Permutations": 2.0, "Seconds": 2.0 / 100000}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_knuth_estimate_skewed_tree(seed: int):
+    """a dead end beside a large subtree doesn't pull the estimate down when the early probes find it"""
+    nteams = 11
+    rest = (1 << nteams) - 1 & ~0b11
+    # team 0 defeated a team that defeated nobody, and team 2, with every other team defeating each other
+    defeated = [0b110, 0] + [rest & ~(1 << t) for t in range(2, nteams)]
+    nodes, width = 0, 1
+    for children in range(nteams - 3, 0, -1):
+        width *= children
+        nodes += width
+    # the root's two children, and the round robin below team 2
+    nodes += 2
+    estimate = knuth_estimate(defeated, probes=200, rng=random.Random(seed))
+    assert 0.5 < estimate / nodes < 1.5
@@ -0,0 +1,70 @@
+import sys
+
+sys.path.append("hamiltoniansports")
+# appending the application dir to sys ensures tests run using the correct relative imports
+# and also keep tests out of docker container / application code
+
+import pytest
+from unittest.mock import patch
+from hamiltoniansports.src.algo import Algo
+from hamiltoniansports.src.progress import ProgressReporter
+
+
+def test_reports_when_due():
+    """samples only report once report_seconds have passed, with the rate since the last report"""
+    reports = []
+    with patch("hamiltoniansports.src.progress.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        progress = ProgressReporter(
+            callback=reports.append, sample_interval=10, report_seconds=5
+        )
+        progress.start(cur_round=3, permutation_counter=1000)
+        mock_monotonic.return_value = 104.0
+        progress.sample(permutation_counter=1400, depth=7)
+        assert not reports
+
+        mock_monotonic.return_value = 110.0
+        progress.sample(permutation_counter=2000, depth=9)
+        assert reports == [
+            {
+                "Round": 3,
+                "Permutations": 2000,
+                "Depth": 9,
+                "Elapsed_s": 10.0,
+                "Permutations_per_s": 100.0,
+            }
+        ]
+
+        # the totals of the whole search once it is over
+        mock_monotonic.return_value = 120.0
+        progress.finish(permutation_counter=3000)
+        assert reports[-1] == {
+            "Round": 3,
+            "Permutations": 3000,
+            "Depth": None,
+            "Elapsed_s": 20.0,
+            "Permutations_per_s": 100.0,
+        }
+
+
+@pytest.mark.parametrize("engine", ["dfs", "bitmask", "iterative", "pruned", "mrv"])
+def test_engines_sample_progress(random_season_results, engine: str):
+    """the depth-first engines sample every sample_interval permutations"""
+    season_results = random_season_results(nteams=10, nrounds=12, seed=6)
+    reports = []
+    algo = Algo(
+        seasonresults=season_results,
+        engine=engine,
+        objective="count",
+        progress_callback=reports.append,
+    )
+    algo.progress.sample_interval = 10
+    algo.progress.report_seconds = 0
+    algo.hamiltonian_cycle_search()
+
+    samples = [report for report in reports if report["Depth"] is not None]
+    assert samples
+    assert all(1 <= report["Depth"] <= 10 for report in samples)
+    permutations = [report["Permutations"] for report in reports]
+    assert permutations == sorted(permutations)
+    assert permutations[-1] == algo.permutation_counter
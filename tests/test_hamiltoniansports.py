@@ -103,6 +103,57 @@ class TestHamiltonianSports(unittest.TestCase):
                 self.hc.log_season_result()
                 mock_algo.log_season_result.assert_called_once()
 
+    def test_algo_engine(self):
+        # the engine requested is passed through to the algo composition class
+        hc = HamiltonianSports(
+            league="afl", season="2023", clearcache=False, engine="bitmask"
+        )
+        assert hc.engine == "bitmask"
+        assert self.hc.engine is None
+        assert self.hc.objective == "earliest"
+
+        mock_apicreator = Mock()
+        mock_api = Mock()
+        mock_apicreator.api = mock_api
+        type(mock_api).seasonresults = PropertyMock(return_value="mocked_value")
+
+        hc.assign_api()
+        with patch.object(hc, "apicreator", new=mock_apicreator):
+            hc.assign_algo()
+            assert hc.algo.enginecreator.engine.name == "bitmask"
+
+        # without an engine, the cheapest engine for the objective is used
+        hc = HamiltonianSports(
+            league="afl", season="2023", clearcache=False, objective="exists"
+        )
+        hc.assign_api()
+        with patch.object(hc, "apicreator", new=mock_apicreator):
+            hc.assign_algo()
+            assert hc.algo.objective == "exists"
+            assert hc.algo.enginecreator.engine.name == "mrv"
+
+        # a default run searches for the earliest cycle with dfs, so all_seasons.json keeps counting every
+        # cycle and node of the round
+        hc = HamiltonianSports(league="afl", season="2023", clearcache=False)
+        hc.assign_api()
+        with patch.object(hc, "apicreator", new=mock_apicreator):
+            hc.assign_algo()
+            assert hc.algo.objective == "earliest"
+            assert hc.algo.enginecreator.engine.name == "dfs"
+
+        # an engine that can't meet the objective is refused
+        hc = HamiltonianSports(
+            league="afl",
+            season="2023",
+            clearcache=False,
+            engine="dp",
+            objective="count",
+        )
+        hc.assign_api()
+        with patch.object(hc, "apicreator", new=mock_apicreator):
+            with pytest.raises(ValueError):
+                hc.assign_algo()
+
     def test_infographic(self):
         # cannot design before assign_api is called
         with pytest.raises(RuntimeError):
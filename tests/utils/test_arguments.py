@@ -44,6 +44,82 @@ def test_arguments():
         assert args.args.clearcache
         assert isinstance(args.args.clearcache, bool)
 
+    # test for valid args with engine and objective, the engine is left to the objective when not provided
+    assert args.args.engine is None
+    assert args.args.objective == "earliest"
+    test_args = ["prog", "-l", "afl", "-s", "2000", "-e", "bitmask"]
+    with patch("sys.argv", test_args):
+        args = Arguments()
+        assert args.args.engine == "bitmask"
+
+    test_args = ["prog", "-l", "afl", "-s", "2000", "-o", "exists"]
+    with patch("sys.argv", test_args):
+        args = Arguments()
+        assert args.args.objective == "exists"
+
+    # memo is off unless a size is given
+    assert args.args.memo == 0
+    test_args = ["prog", "-l", "afl", "-s", "2000", "-m", "64"]
+    with patch("sys.argv", test_args):
+        args = Arguments()
+        assert args.args.memo == 64
+
+    # only resumes from a checkpoint when asked to
+    assert args.args.resume is False
+    test_args = ["prog", "-l", "afl", "-s", "2000", "-r"]
+    with patch("sys.argv", test_args):
+        args = Arguments()
+        assert args.args.resume is True
+
+    # no search budgets unless given
+    assert args.args.round_seconds is None
+    assert args.args.season_nodes is None
+    test_args = [
+        "prog",
+        "-l",
+        "afl",
+        "-s",
+        "2000",
+        "--round-seconds",
+        "1.5",
+        "--season-nodes",
+        "1000",
+    ]
+    with patch("sys.argv", test_args):
+        args = Arguments()
+        assert args.args.round_seconds == 1.5
+        assert args.args.season_nodes == 1000
+
+    # the fast path is off unless switched on
+    assert args.args.fast_path is False
+    test_args = ["prog", "-l", "afl", "-s", "2000", "--fast-path"]
+    with patch("sys.argv", test_args):
+        args = Arguments()
+        assert args.args.fast_path is True
+
+    # test for invalid objective
+    test_args = ["prog", "-l", "afl", "-s", "2000", "-o", "no_objective_ever_like_this"]
+    with patch("sys.argv", test_args):
+        with pytest.raises(SystemExit):
+            args = Arguments()
+
+    # engines that can't meet the objective are refused
+    for engine, objective in [
+        ("dp", "count"),
+        ("bottleneck", "enumerate"),
+        ("mitm", "enumerate"),
+    ]:
+        test_args = ["prog", "-l", "afl", "-s", "2000", "-e", engine, "-o", objective]
+        with patch("sys.argv", test_args):
+            with pytest.raises(SystemExit):
+                args = Arguments()
+
+    # test for invalid engine
+    test_args = ["prog", "-l", "afl", "-s", "2000", "-e", "no_engine_ever_like_this"]
+    with patch("sys.argv", test_args):
+        with pytest.raises(SystemExit):
+            args = Arguments()
+
     # test for invalid league
     test_args = ["prog", "-l", "no_league_ever_like_this", "-s", "2000"]
     with patch("sys.argv", test_args):